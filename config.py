@@ -2,7 +2,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, Self
 
-from pydantic import BaseModel, DirectoryPath, EmailStr, Field, FilePath, HttpUrl
+from pydantic import (
+    BaseModel,
+    DirectoryPath,
+    EmailStr,
+    Field,
+    FilePath,
+    HttpUrl,
+    field_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,6 +40,93 @@ class Environment(str, Enum):
     PROD = "production"
 
 
+class RecordingMode(str, Enum):
+    """Перечисление режимов записи артефактов теста (видео и трассировки).
+
+    Members:
+        OFF (str): Запись отключена.
+        ON (str): Запись ведется и прикладывается к отчету для каждого теста.
+        RETAIN_ON_FAILURE (str): Запись ведется для каждого теста, но сохраняется
+            только для упавших.
+        ON_FIRST_RETRY (str): Запись ведется только при первом перезапуске теста.
+    """
+
+    OFF = "off"
+    ON = "on"
+    RETAIN_ON_FAILURE = "retain-on-failure"
+    ON_FIRST_RETRY = "on-first-retry"
+
+    def should_record(self, attempt: int) -> bool:
+        """Определяет, нужно ли вести запись для попытки запуска теста.
+
+        Args:
+            attempt (int): Номер попытки запуска теста, начиная с 1.
+
+        Returns:
+            bool: True, если запись нужно начать.
+        """
+        if self is RecordingMode.OFF:
+            return False
+        if self is RecordingMode.ON_FIRST_RETRY:
+            return attempt == 2
+        return True
+
+    def should_retain(self, failed: bool) -> bool:
+        """Определяет, нужно ли сохранить уже сделанную запись.
+
+        Args:
+            failed (bool): Упал ли тест.
+
+        Returns:
+            bool: True, если запись нужно сохранить и приложить к отчету.
+        """
+        if self is RecordingMode.RETAIN_ON_FAILURE:
+            return failed
+        return self is not RecordingMode.OFF
+
+
+class CoverageFlush(str, Enum):
+    """Перечисление моментов записи буфера покрытия UI в файл-шард воркера.
+
+    Members:
+        TEST (str): После каждого теста.
+        SESSION (str): Один раз по завершении сессии.
+    """
+
+    TEST = "test"
+    SESSION = "session"
+
+
+class StepVerbosity(str, Enum):
+    """Перечисление уровней детализации шагов элементов в отчете Allure.
+
+    Уровень шага - минимальная детализация, при которой шаг попадает в отчет.
+
+    Members:
+        ACTIONS (str): Только действия пользователя (клик, ввод, выбор).
+        CHECKS (str): Действия и проверки элементов.
+        DEBUG (str): Все шаги, включая служебные (получение локаторов и данных).
+    """
+
+    ACTIONS = "actions"
+    CHECKS = "checks"
+    DEBUG = "debug"
+
+
+class HarMode(str, Enum):
+    """Перечисление режимов работы с HAR-архивами сетевого трафика.
+
+    Members:
+        OFF (str): Запросы уходят в сеть, трафик не записывается.
+        RECORD (str): Запросы уходят в сеть, трафик записывается в HAR-архивы.
+        REPLAY (str): Ответы отдаются из HAR-архивов, сеть не используется.
+    """
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
 class TestUser(BaseModel):
     """Модель данных, представляющая тестового пользователя.
 
@@ -70,6 +165,71 @@ class TestData(BaseModel):
     test_users_file: Optional[FilePath] = None
 
 
+class BlockingRule(BaseModel):
+    """Правило блокировки запросов страницы.
+
+    Attributes:
+        resource_types (list[str]): Типы ресурсов Playwright для блокировки
+            (image, font, media, stylesheet, script и т.д.).
+        deny_domains (list[str]): Домены, запросы к которым блокируются (вместе с поддоменами).
+        allow_domains (list[str]): Домены, запросы к которым пропускаются всегда.
+        url_patterns (list[str]): Glob-шаблоны URL для блокировки.
+    """
+
+    resource_types: list[str] = Field(default=[])
+    deny_domains: list[str] = Field(
+        default=[
+            "mc.yandex.ru",
+            "mc.yandex.com",
+            "google-analytics.com",
+            "googletagmanager.com",
+            "top-fwz1.mail.ru",
+            "vk.com",
+        ]
+    )
+    allow_domains: list[str] = Field(default=[])
+    url_patterns: list[str] = Field(
+        default=["**/*.{ico,png,jpg,webp,mp3,mp4,woff,woff2}"]
+    )
+
+
+class BlockingPolicySettings(BlockingRule):
+    """Настройки политики блокировки запросов страницы.
+
+    Attributes:
+        enabled (bool): Включена ли блокировка.
+        dry_run (bool): Только учитывать запросы, попадающие под блокировку,
+            не блокируя их (позволяет измерить их объем).
+        route_overrides (dict[str, BlockingRule]): Переопределения правила
+            для страниц, путь которых начинается с ключа (например, "/vakansii").
+    """
+
+    enabled: bool = Field(default=True)
+    dry_run: bool = Field(default=False)
+    route_overrides: dict[str, BlockingRule] = Field(default={})
+
+
+class AssetCacheSettings(BaseModel):
+    """Настройки общего для всех контекстов кеша статических ресурсов.
+
+    Attributes:
+        enabled (bool): Включен ли кеш (при записи и воспроизведении HAR не используется).
+        cache_dir (Path): Каталог дискового кеша.
+        resource_types (list[str]): Типы ресурсов Playwright, которые кешируются.
+        memory_limit_mb (int): Предельный объем кеша в памяти воркера.
+        disk_limit_mb (int): Предельный объем дискового кеша.
+        ttl (int): Время в секундах, в течение которого ресурс без `max-age`
+            отдается без перепроверки на сервере.
+    """
+
+    enabled: bool = Field(default=True)
+    cache_dir: Path = Field(default=Path("./asset-cache"))
+    resource_types: list[str] = Field(default=["script", "stylesheet"])
+    memory_limit_mb: int = Field(default=64, ge=0)
+    disk_limit_mb: int = Field(default=512, ge=0)
+    ttl: int = Field(default=300, ge=0)
+
+
 class UISettings(BaseModel):
     """Настройки для UI тестирования."""
 
@@ -79,13 +239,38 @@ class UISettings(BaseModel):
     default_browser: Browser = Field(default=Browser.CHROMIUM)
     viewport_width: int = Field(default=1920)
     viewport_height: int = Field(default=1080)
+    warmup_queue_depth: int = Field(default=1, ge=0)
+    locator_cache: bool = Field(default=True)  # Переиспользование локаторов элементов на странице
     # slow_mo: int = Field(default=0)  # Замедление действий в ms
     videos_path: DirectoryPath
     tracing_path: DirectoryPath
-    browser_state_file: FilePath
+    browser_state_dir: Path = Field(default=Path("./browser-state"))
+    browser_state_ttl: int = Field(default=3600, ge=0)  # Время жизни состояния в секундах
+    har_mode: HarMode = Field(default=HarMode.OFF)
+    har_dir: Path = Field(default=Path("./har"))
+    blocking: BlockingPolicySettings = Field(default_factory=BlockingPolicySettings)
+    asset_cache: AssetCacheSettings = Field(default_factory=AssetCacheSettings)
+    coverage_agent: bool = Field(default=False)  # Добавлять на страницы агент UI Coverage
+    coverage_agent_file: Path = Field(
+        default=Path("./integrations/playwright/vendor/ui-coverage-agent.global.js")
+    )
     # snapshots_tests: Optional[List[str]] = None
 
 
+class StandinSettings(BaseModel):
+    """Настройки локального двойника сайта (integrations/standin).
+
+    Если двойник включен, он запускается на хосте и порту из `ui.app_url`.
+    Двойник отдает синтетические страницы, а не снимок реального сайта, поэтому
+    подходит для отладки фреймворка и замеров, но не заменяет прогон на сайте.
+    """
+
+    enabled: bool = Field(default=False)
+    latency_ms: int = Field(default=0, ge=0)
+    vacancies_count: int = Field(default=24, ge=0)
+    dataset_file: FilePath | None = None
+
+
 class APISettings(BaseModel):
     """Настройки для API тестирования."""
 
@@ -99,8 +284,22 @@ class ReportingSettings(BaseModel):
 
     # allure_api_results_dir: DirectoryPath
     allure_results_dir: DirectoryPath
-    video_recording: bool = Field(default=False)
-    trace_recording: bool = Field(default=False)
+    video_recording: RecordingMode = Field(default=RecordingMode.OFF)
+    trace_recording: RecordingMode = Field(default=RecordingMode.OFF)
+    artifact_workers: int = Field(default=2, ge=1)
+    artifact_queue_size: int = Field(default=16, ge=1)
+    step_verbosity: StepVerbosity = Field(default=StepVerbosity.CHECKS)
+    coverage_flush: CoverageFlush = Field(default=CoverageFlush.TEST)
+
+    @field_validator("video_recording", "trace_recording", mode="before")
+    @classmethod
+    def _parse_legacy_flag(cls, value: Any) -> Any:
+        """Поддерживает прежние булевы значения настроек записи (True/False)."""
+        if isinstance(value, bool):
+            return RecordingMode.ON if value else RecordingMode.OFF
+        if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+            return RecordingMode.ON if value.strip().lower() == "true" else RecordingMode.OFF
+        return value
 
 
 class FrameworkSettings(BaseSettings):
@@ -121,6 +320,9 @@ class FrameworkSettings(BaseSettings):
     # UI настройки
     ui: UISettings
 
+    # Локальный двойник сайта
+    standin: StandinSettings = Field(default_factory=StandinSettings)
+
     # API настройки
     api: APISettings
 
@@ -152,10 +354,6 @@ class FrameworkSettings(BaseSettings):
         for dir_path in base_dirs:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
 
-        # Создаем файл состояния браузера если его нет
-        browser_state_file = Path("browser_state.json")
-        browser_state_file.touch(exist_ok=True)
-
         return cls()
 
     def get_ui_base_url(self) -> str:
@@ -2,4 +2,7 @@ pytest_plugins = (
     "tests.ui.fixtures.browsers",
     "tests.ui.fixtures.pages",
     "fixtures.allure",
+    "fixtures.coverage",
+    "fixtures.standin",
+    "integrations.scheduling.plugin",
 )
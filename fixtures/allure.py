@@ -2,7 +2,12 @@ from collections.abc import Iterator
 
 import pytest
 
+from integrations.allure.artifacts import artifact_pipeline
 from integrations.allure.environment import create_allure_environment
+from integrations.allure.steps import step_recorder
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -18,3 +23,52 @@ def save_allure_environment() -> Iterator[None]:
     """
     yield
     create_allure_environment()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def allure_artifact_pipeline(pytestconfig: pytest.Config) -> Iterator[None]:
+    """Фикстура, управляющая фоновым конвейером вложений Allure.
+
+    Запускает конвейер в начале сессии, если результаты Allure формируются,
+    и дописывает все поставленные в очередь трассировки, видео и скриншоты
+    по завершении сессии.
+
+    Args:
+        pytestconfig (pytest.Config): Конфигурация текущей сессии pytest.
+
+    Yields:
+        None: Не возвращает значение напрямую, но управляет жизненным циклом через yield.
+    """
+    artifact_pipeline.start(pytestconfig)
+    yield
+    artifact_pipeline.shutdown()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def allure_step_recorder(pytestconfig: pytest.Config) -> Iterator[None]:
+    """Фикстура, подключающая запись шагов элементов к отчету Allure.
+
+    По завершении сессии выводит количество записанных и пропущенных шагов
+    и накладные расходы на их запись.
+
+    Args:
+        pytestconfig (pytest.Config): Конфигурация текущей сессии pytest.
+
+    Yields:
+        None: Не возвращает значение напрямую, но управляет жизненным циклом через yield.
+    """
+    step_recorder.start(pytestconfig)
+    yield
+    logger.info(f"Шаги элементов в Allure: {step_recorder.stats.summary()}")
+
+
+@pytest.fixture(autouse=True)
+def allure_step_overhead() -> Iterator[None]:
+    """Фикстура, учитывающая время записи шагов элементов каждого теста.
+
+    Yields:
+        None: Не возвращает значение напрямую, но управляет жизненным циклом через yield.
+    """
+    overhead_before = step_recorder.stats.overhead_ns
+    yield
+    step_recorder.stats.record_test(step_recorder.stats.overhead_ns - overhead_before)
@@ -0,0 +1,35 @@
+from collections.abc import Iterator
+
+import pytest
+
+from config import CoverageFlush, settings
+from src.ui.elements.ui_coverage import tracker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ui_coverage_tracker() -> Iterator[None]:
+    """Фикстура, записывающая остаток буфера покрытия UI по завершении сессии.
+
+    Yields:
+        None: Не возвращает значение напрямую, но управляет жизненным циклом через yield.
+    """
+    yield
+    tracker.flush()
+    logger.info(f"Покрытие UI: {tracker.stats.summary()}")
+
+
+@pytest.fixture(autouse=True)
+def ui_coverage_flush() -> Iterator[None]:
+    """Фикстура, записывающая покрытие UI теста в шард воркера после его завершения.
+
+    Работает, если `settings.reporting.coverage_flush` равен `CoverageFlush.TEST`.
+
+    Yields:
+        None: Не возвращает значение напрямую, но управляет жизненным циклом через yield.
+    """
+    yield
+    if settings.reporting.coverage_flush == CoverageFlush.TEST:
+        tracker.flush()
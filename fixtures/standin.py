@@ -0,0 +1,35 @@
+from urllib.parse import urlsplit
+
+import pytest
+
+from config import settings
+from integrations.standin import StandinServer
+
+_standin_server_key = pytest.StashKey[StandinServer]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Запускает локальный двойник сайта, если он включен в настройках.
+
+    Сервер запускается один раз в основном процессе pytest: воркеры pytest-xdist
+    обращаются к нему по адресу из `settings.ui.app_url`.
+    """
+    if not settings.standin.enabled or hasattr(config, "workerinput"):
+        return
+
+    app_url = urlsplit(settings.get_ui_base_url())
+    server = StandinServer(
+        host=app_url.hostname,
+        port=app_url.port or 80,
+        latency_ms=settings.standin.latency_ms,
+        vacancies_count=settings.standin.vacancies_count,
+        dataset_file=settings.standin.dataset_file,
+    )
+    config.stash[_standin_server_key] = server.start()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Останавливает локальный двойник сайта по завершении сессии."""
+    server = config.stash.get(_standin_server_key, None)
+    if server is not None:
+        server.stop()
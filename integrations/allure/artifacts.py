@@ -0,0 +1,261 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import threading
+import uuid
+
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, ExecutableItem
+from allure_commons.types import AttachmentType
+import pytest
+
+from config import settings
+from integrations.allure.steps import step_recorder
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ArtifactStats:
+    """Статистика работы конвейера артефактов.
+
+    Attributes:
+        attached (int): Количество записанных в отчет вложений.
+        deduplicated (int): Количество вложений, совпавших по содержимому с уже записанными
+            и сохраненных жесткой ссылкой вместо копии.
+        bytes_written (int): Объем фактически записанных на диск данных в байтах.
+        failed (int): Количество вложений, которые не удалось записать.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.attached = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+        self.failed = 0
+
+    def summary(self) -> str:
+        """Возвращает сводку статистики в читаемом виде."""
+        return (
+            f"вложений: {self.attached}, дубликатов: {self.deduplicated}, "
+            f"записано: {self.bytes_written / 1024 / 1024:.1f} МБ, ошибок: {self.failed}"
+        )
+
+
+class ArtifactPipeline:
+    """Фоновый конвейер записи артефактов теста (трассировок, видео, скриншотов) в Allure.
+
+    Вложение регистрируется в отчете сразу, в потоке теста: в текущий шаг, фикстуру
+    или тест добавляется запись со ссылкой на файл. Само содержимое хешируется
+    и записывается в каталог результатов Allure пулом потоков, поэтому следующий тест
+    не ждет дискового ввода-вывода. Совпадающие по хешу артефакты сохраняются жесткой
+    ссылкой на уже записанный файл. Сжатие не выполняется: трассировки (zip),
+    видео (webm) и скриншоты (png) уже хранятся в сжатых форматах.
+
+    Очередь ограничена: при `max_pending` незавершенных задачах поток теста ждет
+    освобождения места. Все задачи дописываются при вызове `flush` в конце сессии.
+
+    Attributes:
+        max_workers (int): Количество потоков записи.
+        stats (ArtifactStats): Статистика работы конвейера.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        """Инициализирует конвейер артефактов.
+
+        Args:
+            max_workers (int): Количество потоков записи.
+            max_pending (int): Максимальное количество незавершенных задач в очереди.
+        """
+        self.max_workers = max_workers
+        self.stats = ArtifactStats()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._futures: set[Future] = set()
+        self._digests: dict[str, Path] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._report_dir: Path | None = None
+        self._reporter = None
+
+    @property
+    def enabled(self) -> bool:
+        """Запущен ли конвейер (включена ли запись результатов Allure)."""
+        return self._executor is not None
+
+    def start(self, config: pytest.Config) -> None:
+        """Запускает конвейер, если pytest запущен с формированием результатов Allure.
+
+        Args:
+            config (pytest.Config): Конфигурация текущей сессии pytest.
+        """
+        report_dir = config.getoption("allure_report_dir", default=None)
+        listener = config.pluginmanager.get_plugin("allure_listener")
+        if not report_dir or listener is None:
+            logger.debug("Результаты Allure не формируются, вложения отключены")
+            return
+
+        self._report_dir = Path(report_dir)
+        self._reporter = listener.allure_logger
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="allure-artifacts"
+        )
+
+    def attach_file(
+        self,
+        source: str | Path,
+        name: str,
+        attachment_type: AttachmentType | None = None,
+        extension: str | None = None,
+    ) -> None:
+        """Прикладывает файл к текущему элементу отчета, записывая его в фоне.
+
+        Args:
+            source (str | Path): Путь к файлу артефакта.
+            name (str): Название вложения в отчете.
+            attachment_type (AttachmentType | None): Тип вложения Allure.
+            extension (str | None): Расширение файла, если тип не указан.
+        """
+        file_name = self._register(name, attachment_type, extension)
+        if file_name:
+            self._submit(self._write_file, Path(source), file_name)
+
+    def attach_bytes(
+        self,
+        body: bytes,
+        name: str,
+        attachment_type: AttachmentType | None = None,
+        extension: str | None = None,
+    ) -> None:
+        """Прикладывает данные к текущему элементу отчета, записывая их в фоне.
+
+        Args:
+            body (bytes): Содержимое вложения (например, скриншот).
+            name (str): Название вложения в отчете.
+            attachment_type (AttachmentType | None): Тип вложения Allure.
+            extension (str | None): Расширение файла, если тип не указан.
+        """
+        file_name = self._register(name, attachment_type, extension)
+        if file_name:
+            self._submit(self._write_bytes, body, file_name)
+
+    def flush(self) -> None:
+        """Дожидается записи всех поставленных в очередь вложений."""
+        with self._lock:
+            pending = list(self._futures)
+        wait(pending)
+
+    def shutdown(self) -> None:
+        """Дописывает все вложения, останавливает потоки и выводит статистику."""
+        if not self.enabled:
+            return
+
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        logger.info(f"Статистика вложений Allure: {self.stats.summary()}")
+
+    def _register(
+        self,
+        name: str,
+        attachment_type: AttachmentType | None,
+        extension: str | None,
+    ) -> str | None:
+        """Добавляет вложение в текущий элемент отчета и возвращает имя его файла."""
+        if not self.enabled:
+            return None
+
+        item = step_recorder.current() or self._reporter.get_last_item(ExecutableItem)
+        if item is None:
+            logger.warning(f"Вложение '{name}' пропущено: нет активного элемента отчета")
+            return None
+
+        mime_type = attachment_type
+        if isinstance(attachment_type, AttachmentType):
+            mime_type, extension = attachment_type.mime_type, attachment_type.extension
+
+        file_name = ATTACHMENT_PATTERN.format(prefix=uuid.uuid4(), ext=extension or "attach")
+        item.attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+        return file_name
+
+    def _submit(self, func, *args) -> None:
+        """Ставит задачу записи в очередь, ожидая свободного места при ее заполнении."""
+        self._slots.acquire()
+        future = self._executor.submit(func, *args)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
+
+        if future.exception() is not None:
+            with self._lock:
+                self.stats.failed += 1
+            logger.error(f"Не удалось записать вложение Allure: {future.exception()}")
+
+    def _link_duplicate(self, digest: str, destination: Path) -> bool:
+        """Создает жесткую ссылку на ранее записанный файл с тем же содержимым."""
+        with self._lock:
+            existing = self._digests.get(digest)
+
+        if existing is None:
+            return False
+
+        try:
+            os.link(existing, destination)
+        except OSError:
+            return False
+
+        with self._lock:
+            self.stats.deduplicated += 1
+        return True
+
+    def _remember(self, digest: str, destination: Path) -> None:
+        """Запоминает записанный файл как источник ссылок для совпадающих вложений.
+
+        Вызывается только после успешной записи, чтобы ссылки не создавались
+        на файлы, которые еще пишутся или не будут записаны из-за ошибки.
+        """
+        with self._lock:
+            self._digests.setdefault(digest, destination)
+
+    def _write_file(self, source: Path, file_name: str) -> None:
+        destination = self._report_dir / file_name
+        digest = hashlib.sha256()
+        with source.open("rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                digest.update(chunk)
+
+        written = 0
+        if not self._link_duplicate(digest.hexdigest(), destination):
+            shutil.copyfile(source, destination)
+            written = destination.stat().st_size
+            self._remember(digest.hexdigest(), destination)
+        self._record_write(written)
+
+    def _write_bytes(self, body: bytes, file_name: str) -> None:
+        destination = self._report_dir / file_name
+        digest = hashlib.sha256(body).hexdigest()
+        written = 0
+        if not self._link_duplicate(digest, destination):
+            destination.write_bytes(body)
+            written = len(body)
+            self._remember(digest, destination)
+        self._record_write(written)
+
+    def _record_write(self, written: int) -> None:
+        with self._lock:
+            self.stats.attached += 1
+            self.stats.bytes_written += written
+
+
+# Глобальный конвейер артефактов
+artifact_pipeline = ArtifactPipeline(
+    max_workers=settings.reporting.artifact_workers,
+    max_pending=settings.reporting.artifact_queue_size,
+)
@@ -0,0 +1,208 @@
+"""Шаги элементов в отчете Allure с уровнями детализации.
+
+Каждый `allure.step` проходит через хуки allure-commons: генерирует UUID,
+регистрирует шаг в репортере и снимает его с регистрации. На тестах, работающих
+со списками, таких шагов тысячи. Шаги элементов вместо этого собираются в памяти
+потока теста: результат шага сразу добавляется в дерево результата текущего теста
+(или открытого шага Allure), а вложенные шаги элементов - в открытый шаг элемента.
+Дерево, как и прежде, сериализуется в JSON один раз, при завершении теста.
+
+Шаги с уровнем выше `settings.reporting.step_verbosity` не создаются вовсе.
+"""
+
+from contextlib import AbstractContextManager
+import threading
+import time
+from types import TracebackType
+
+from allure_commons.model2 import ExecutableItem, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now
+from allure_pytest.utils import get_status, get_status_details
+import pytest
+
+from config import StepVerbosity, settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+_LEVEL_ORDER = {
+    StepVerbosity.ACTIONS: 0,
+    StepVerbosity.CHECKS: 1,
+    StepVerbosity.DEBUG: 2,
+}
+
+
+class StepStats:
+    """Статистика шагов элементов и накладных расходов на их запись.
+
+    Attributes:
+        recorded (int): Количество записанных шагов.
+        skipped (int): Количество шагов, пропущенных по уровню детализации.
+        overhead_ns (int): Суммарное время записи шагов в наносекундах.
+        tests (int): Количество учтенных тестов.
+        max_test_overhead_ns (int): Наибольшее время записи шагов одного теста.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.recorded = 0
+        self.skipped = 0
+        self.overhead_ns = 0
+        self.tests = 0
+        self.max_test_overhead_ns = 0
+        self._lock = threading.Lock()
+
+    def record_test(self, overhead_ns: int) -> None:
+        """Учитывает время записи шагов завершившегося теста."""
+        with self._lock:
+            self.tests += 1
+            self.max_test_overhead_ns = max(self.max_test_overhead_ns, overhead_ns)
+
+    def summary(self) -> str:
+        """Возвращает сводку статистики в читаемом виде."""
+        if not self.tests:
+            return "нет данных"
+        return (
+            f"шагов: {self.recorded}, пропущено по уровню детализации: {self.skipped}, "
+            f"запись шагов: {self.overhead_ns / self.tests / 1_000_000:.2f} мс на тест "
+            f"(макс. {self.max_test_overhead_ns / 1_000_000:.2f} мс)"
+        )
+
+
+class _SkippedStep(AbstractContextManager):
+    """Шаг, не попадающий в отчет."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_SKIPPED_STEP = _SkippedStep()
+
+
+class _RecordedStep(AbstractContextManager):
+    """Шаг элемента, записываемый в дерево результата теста."""
+
+    __slots__ = ("_recorder", "_title")
+
+    def __init__(self, recorder: "StepRecorder", title: str) -> None:
+        self._recorder = recorder
+        self._title = title
+
+    def __enter__(self) -> None:
+        started_at = time.perf_counter_ns()
+        self._recorder._open(self._title)
+        self._recorder.stats.overhead_ns += time.perf_counter_ns() - started_at
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool:
+        started_at = time.perf_counter_ns()
+        self._recorder._close(exc_type, exc_val, exc_tb)
+        self._recorder.stats.overhead_ns += time.perf_counter_ns() - started_at
+        return False
+
+
+class StepRecorder:
+    """Запись шагов элементов в отчет Allure с учетом уровня детализации.
+
+    Attributes:
+        verbosity (StepVerbosity): Наибольший уровень шагов, попадающих в отчет.
+        stats (StepStats): Статистика шагов и накладных расходов на их запись.
+    """
+
+    def __init__(self, verbosity: StepVerbosity | None = None) -> None:
+        """Инициализирует запись шагов; до вызова `start` шаги не записываются.
+
+        Args:
+            verbosity (StepVerbosity | None): Уровень детализации; по умолчанию
+                берется из `settings.reporting.step_verbosity`.
+        """
+        self.verbosity = verbosity or settings.reporting.step_verbosity
+        self.stats = StepStats()
+        self._reporter: AllureReporter | None = None
+        self._local = threading.local()
+
+    def start(self, config: pytest.Config) -> None:
+        """Подключается к репортеру allure-pytest, если результаты Allure формируются.
+
+        Args:
+            config (pytest.Config): Конфигурация текущей сессии pytest.
+        """
+        listener = config.pluginmanager.get_plugin("allure_listener")
+        if not config.getoption("allure_report_dir", default=None) or listener is None:
+            logger.debug("Результаты Allure не формируются, шаги элементов не записываются")
+            return
+
+        self._reporter = listener.allure_logger
+        logger.debug(f"Детализация шагов элементов: {self.verbosity.value}")
+
+    def step(
+        self, title: str, level: StepVerbosity = StepVerbosity.ACTIONS
+    ) -> AbstractContextManager[None]:
+        """Возвращает контекстный менеджер шага элемента.
+
+        Args:
+            title (str): Название шага в отчете.
+            level (StepVerbosity): Минимальная детализация, при которой шаг попадает в отчет.
+
+        Returns:
+            AbstractContextManager[None]: Шаг; если шаг не попадает в отчет,
+                контекстный менеджер ничего не делает.
+
+        Example:
+            >>> with step_recorder.step("Клик по кнопке 'Найти'"):
+            ...     button.click()
+        """
+        if self._reporter is None:
+            return _SKIPPED_STEP
+        if _LEVEL_ORDER[level] > _LEVEL_ORDER[self.verbosity]:
+            self.stats.skipped += 1
+            return _SKIPPED_STEP
+        return _RecordedStep(self, title)
+
+    def current(self) -> TestStepResult | None:
+        """Возвращает открытый шаг элемента текущего потока, если он есть."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def _stack(self) -> list[TestStepResult]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _open(self, title: str) -> None:
+        result = TestStepResult(name=title, start=now())
+        stack = self._stack()
+        if stack:
+            stack[-1].steps.append(result)
+        else:
+            parent = self._reporter.get_last_item(ExecutableItem)
+            if parent is not None:
+                parent.steps.append(result)
+        stack.append(result)
+        self.stats.recorded += 1
+
+    def _close(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        result = self._stack().pop()
+        result.stop = now()
+        result.status = get_status(exc_val)
+        if exc_val is not None:
+            result.statusDetails = get_status_details(exc_type, exc_val, exc_tb)
+
+
+# Глобальная запись шагов элементов воркера
+step_recorder = StepRecorder()
@@ -0,0 +1,347 @@
+"""Формирование отчета ui-coverage-tool из шардов буферизованного трекера.
+
+Повторяет команду `ui-coverage-tool save-report`, но читает результаты
+и из файлов-шардов `BufferedCoverageTracker`, и из файлов стандартного
+трекера. Отчет, история и настройки берутся из `ui_coverage_config.yaml`.
+
+Файлы результатов разбираются параллельно в нескольких процессах и сводятся
+в счетчики действий. Сводное состояние сохраняется в кеше между запусками:
+файлы, не изменившиеся с прошлого запуска, повторно не разбираются, а покрытие
+приложения пересчитывается, только если изменились его счетчики; для
+неизменившегося приложения в историю все равно добавляется запись запуска.
+Если история отключена, не изменилось ни одно приложение и отчеты уже есть,
+они не перезаписываются.
+
+Пример:
+    python -m integrations.coverage.report --workers 4
+"""
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from ui_coverage_tool import ActionType, SelectorType
+from ui_coverage_tool.config import Settings, get_settings
+from ui_coverage_tool.src.coverage.builder import UICoverageBuilder
+from ui_coverage_tool.src.coverage.models import AppCoverage
+from ui_coverage_tool.src.history.builder import UICoverageHistoryBuilder
+from ui_coverage_tool.src.history.models import ActionHistory, AppHistoryState
+from ui_coverage_tool.src.history.storage import UICoverageHistoryStorage
+from ui_coverage_tool.src.reports.models import CoverageReportState
+from ui_coverage_tool.src.reports.storage import UIReportsStorage
+from ui_coverage_tool.src.tracker.models import CoverageResult, CoverageResultList
+
+from integrations.coverage.store import CoverageEvent, CoverageStore
+from integrations.coverage.tracker import SHARD_SUFFIX
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+DEFAULT_CACHE_FILE = Path("./.cache/coverage-aggregate.json")
+
+# Ключ сводного счетчика: приложение, селектор, действие, тип селектора
+AggregateKey = tuple[str, str, ActionType, SelectorType]
+
+
+class CachedResultsFile(BaseModel):
+    """Разобранный файл результатов покрытия.
+
+    Attributes:
+        size (int): Размер файла в байтах на момент разбора.
+        mtime_ns (int): Время изменения файла на момент разбора.
+        events (list[CoverageEvent]): События файла со счетчиками.
+    """
+
+    size: int
+    mtime_ns: int
+    events: list[CoverageEvent]
+
+
+class CachedAppCoverage(BaseModel):
+    """Построенное покрытие приложения.
+
+    Attributes:
+        digest (str): Хеш счетчиков действий приложения, по которым построено покрытие.
+        coverage (AppCoverage): Покрытие приложения в формате отчета ui-coverage-tool.
+    """
+
+    digest: str
+    coverage: AppCoverage
+
+
+class CoverageAggregateCache(BaseModel):
+    """Сводное состояние покрытия, сохраняемое между запусками.
+
+    Attributes:
+        files (dict[str, CachedResultsFile]): Разобранные файлы результатов по имени.
+        apps (dict[str, CachedAppCoverage]): Построенное покрытие по ключу приложения.
+    """
+
+    files: dict[str, CachedResultsFile] = Field(default={})
+    apps: dict[str, CachedAppCoverage] = Field(default={})
+
+    @classmethod
+    def load(cls, path: Path | None) -> "CoverageAggregateCache":
+        """Загружает кеш из файла; при отсутствии или повреждении файла возвращает пустой."""
+        if path is None or not path.exists():
+            return cls()
+        try:
+            return cls.model_validate_json(path.read_text(encoding="utf-8"))
+        except ValueError as error:
+            logger.warning(f"Кеш покрытия {path} поврежден и не используется: {error}")
+            return cls()
+
+    def save(self, path: Path | None) -> None:
+        """Атомарно сохраняет кеш в файл."""
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(self.model_dump_json(by_alias=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def _read_results_files(paths: list[str]) -> list[list[dict]]:
+    """Разбирает файлы результатов; выполняется в процессе пула.
+
+    Возвращает события каждого файла в виде словарей, чтобы не передавать
+    между процессами модели pydantic.
+    """
+    parsed = []
+    for path in paths:
+        if path.endswith(SHARD_SUFFIX):
+            with CoverageStore(path, readonly=True) as store:
+                events = [event.model_dump(mode="json") for event in store.events()]
+        else:
+            result = CoverageResult.model_validate_json(Path(path).read_text(encoding="utf-8"))
+            events = [CoverageEvent(**result.model_dump()).model_dump(mode="json")]
+        parsed.append(events)
+    return parsed
+
+
+def aggregate_coverage(
+    results_dir: Path, cache: CoverageAggregateCache, workers: int | None = None
+) -> Counter[AggregateKey]:
+    """Сводит результаты покрытия в счетчики действий.
+
+    Файлы-шарды `BufferedCoverageTracker` и файлы стандартного трекера, которых
+    нет в кеше или которые изменились, разбираются параллельно пакетами.
+
+    Args:
+        results_dir (Path): Каталог результатов покрытия (`results_dir` ui-coverage-tool).
+        cache (CoverageAggregateCache): Кеш разобранных файлов; обновляется на месте.
+        workers (int | None): Количество процессов; по умолчанию - по числу ядер.
+
+    Returns:
+        Counter[AggregateKey]: Количество действий по приложению, селектору,
+            действию и типу селектора.
+    """
+    files = {}
+    if results_dir.exists():
+        for file in results_dir.iterdir():
+            if file.is_file() and file.suffix in (".json", SHARD_SUFFIX):
+                files[file.name] = file
+
+    cache.files = {name: entry for name, entry in cache.files.items() if name in files}
+    stale = []
+    for name, file in sorted(files.items()):
+        stat = file.stat()
+        entry = cache.files.get(name)
+        if entry is None or (entry.size, entry.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            stale.append((name, stat))
+
+    if stale:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(stale)))
+        # Пакеты меньше числа файлов, чтобы не передавать в процессы по одному мелкому файлу
+        batch_size = max(1, len(stale) // (workers * 4))
+        batches = [stale[i : i + batch_size] for i in range(0, len(stale), batch_size)]
+        paths = [[str(files[name]) for name, _ in batch] for batch in batches]
+
+        if workers == 1:
+            parsed = map(_read_results_files, paths)
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            parsed = executor.map(_read_results_files, paths)
+
+        try:
+            for batch, batch_events in zip(batches, parsed, strict=True):
+                for (name, stat), events in zip(batch, batch_events, strict=True):
+                    cache.files[name] = CachedResultsFile(
+                        size=stat.st_size, mtime_ns=stat.st_mtime_ns, events=events
+                    )
+        finally:
+            if workers > 1:
+                executor.shutdown()
+
+    counts: Counter[AggregateKey] = Counter()
+    for entry in cache.files.values():
+        for event in entry.events:
+            counts[(event.app, event.selector, event.action_type, event.selector_type)] += (
+                event.count
+            )
+
+    logger.info(
+        f"Результаты покрытия {results_dir}: файлов {len(files)}, разобрано {len(stale)}, "
+        f"действий {sum(counts.values())}"
+    )
+    return counts
+
+
+def _app_digest(counts: dict[AggregateKey, int]) -> str:
+    """Возвращает хеш счетчиков действий приложения."""
+    rows = sorted(
+        (selector, action.value, selector_type.value, count)
+        for (_, selector, action, selector_type), count in counts.items()
+    )
+    return hashlib.sha1(json.dumps(rows, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _build_app_coverage(
+    counts: dict[AggregateKey, int], history: AppHistoryState, settings: Settings
+) -> AppCoverage:
+    """Строит покрытие приложения построителями ui-coverage-tool."""
+    results = []
+    for (app, selector, action_type, selector_type), count in counts.items():
+        result = CoverageResult(
+            app=app, selector=selector, action_type=action_type, selector_type=selector_type
+        )
+        # Построители считают действия по длине списка результатов
+        results.extend([result] * count)
+
+    coverage_builder = UICoverageBuilder(
+        results_list=CoverageResultList(root=results),
+        history_builder=UICoverageHistoryBuilder(history=history, settings=settings),
+    )
+    return coverage_builder.build()
+
+
+def _extend_app_history(
+    coverage: AppCoverage, history: AppHistoryState, settings: Settings
+) -> AppCoverage:
+    """Добавляет в историю приложения запись запуска без пересчета покрытия.
+
+    Счетчики приложения не изменились, поэтому запись строится по уже построенному
+    покрытию так же, как ее построил бы `UICoverageBuilder`.
+    """
+    history_builder = UICoverageHistoryBuilder(history=history, settings=settings)
+    totals: Counter[ActionType] = Counter()
+    for element in coverage.elements:
+        for action in element.actions:
+            totals[action.type] += action.count
+
+    elements = [
+        element.model_copy(
+            update={
+                "history": history_builder.get_element_history(
+                    actions=[
+                        ActionHistory(type=action.type, count=action.count)
+                        for action in element.actions
+                    ],
+                    selector=element.selector,
+                    selector_type=element.selector_type,
+                )
+            }
+        )
+        for element in coverage.elements
+    ]
+    return AppCoverage(
+        history=history_builder.get_app_history(
+            actions=[
+                ActionHistory(type=action, count=count) for action, count in sorted(totals.items())
+            ],
+            total_actions=sum(totals.values()),
+            total_elements=len(coverage.elements),
+        ),
+        elements=elements,
+    )
+
+
+def save_coverage_report(
+    settings: Settings | None = None,
+    cache_file: Path | None = DEFAULT_CACHE_FILE,
+    workers: int | None = None,
+) -> CoverageReportState:
+    """Строит и сохраняет JSON- и HTML-отчеты покрытия и обновляет историю.
+
+    Покрытие приложения пересчитывается, только если его счетчики действий изменились
+    с прошлого запуска; иначе берется из кеша. Запись запуска добавляется в историю
+    каждого приложения в обоих случаях.
+
+    Args:
+        settings (Settings | None): Настройки ui-coverage-tool; по умолчанию
+            читаются из `ui_coverage_config.yaml`.
+        cache_file (Path | None): Файл кеша сводного состояния; None отключает кеш.
+        workers (int | None): Количество процессов разбора результатов.
+
+    Returns:
+        CoverageReportState: Состояние отчета.
+    """
+    settings = settings or get_settings()
+    cache = CoverageAggregateCache.load(cache_file)
+    counts = aggregate_coverage(settings.results_dir, cache, workers)
+
+    history_storage = UICoverageHistoryStorage(settings=settings)
+    history_state = None
+    report_state = CoverageReportState.init(settings)
+    changed_apps = []
+    for app in settings.apps:
+        app_counts = {
+            key: count for key, count in counts.items() if key[0].lower() == app.key.lower()
+        }
+        digest = _app_digest(app_counts)
+        cached = cache.apps.get(app.key)
+        if cached is not None and cached.digest == digest and not settings.history_file:
+            report_state.apps_coverage[app.key] = cached.coverage
+            continue
+
+        if history_state is None:
+            history_state = history_storage.load()
+        app_history = history_state.apps.get(app.key, AppHistoryState())
+        if cached is not None and cached.digest == digest:
+            coverage = _extend_app_history(cached.coverage, app_history, settings)
+        else:
+            coverage = _build_app_coverage(app_counts, app_history, settings)
+            changed_apps.append(app.key)
+        report_state.apps_coverage[app.key] = coverage
+        cache.apps[app.key] = CachedAppCoverage(digest=digest, coverage=coverage)
+
+    reports_exist = all(
+        file is None or file.exists()
+        for file in (settings.html_report_file, settings.json_report_file, settings.history_file)
+    )
+    if changed_apps or settings.history_file or not reports_exist:
+        reports_storage = UIReportsStorage(settings=settings)
+        history_storage.save_from_report(report_state)
+        reports_storage.save_json_report(report_state)
+        reports_storage.save_html_report(report_state)
+        logger.info(
+            f"Отчет покрытия сохранен: {settings.html_report_file}, "
+            f"пересчитаны приложения: {', '.join(changed_apps) or 'нет'}"
+        )
+    else:
+        logger.info(f"Покрытие не изменилось, отчет {settings.html_report_file} актуален")
+
+    cache.save(cache_file)
+    return report_state
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и сохраняет отчет покрытия."""
+    parser = argparse.ArgumentParser(description="Формирование отчета UI Coverage")
+    parser.add_argument("--workers", type=int, default=None, help="Процессов разбора результатов")
+    parser.add_argument("--cache-file", type=Path, default=DEFAULT_CACHE_FILE)
+    parser.add_argument("--no-cache", action="store_true", help="Не использовать кеш")
+    args = parser.parse_args()
+
+    save_coverage_report(
+        cache_file=None if args.no_cache else args.cache_file, workers=args.workers
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+r"""Компактное хранилище событий покрытия UI в SQLite.
+
+Селекторы хранятся один раз (интернируются) и получают целочисленный
+идентификатор, а действия хранятся счетчиками по паре (идентификатор селектора,
+код действия). Файл хранилища - шард покрытия воркера; шарды объединяются,
+выгружаются в формат ui-coverage-tool и позволяют выполнять сводные запросы,
+например поиск локаторов из `src.ui.locators`, с которыми тесты ни разу
+не взаимодействовали.
+
+Пример:
+    python -m integrations.coverage.store untouched coverage-results/*.sqlite
+    python -m integrations.coverage.store export coverage-results/*.sqlite \
+        --results-dir coverage-export
+"""
+
+import argparse
+from collections.abc import Iterable, Iterator, Mapping
+import json
+from pathlib import Path
+import re
+import sqlite3
+from types import TracebackType
+from typing import Self
+import uuid
+
+from pydantic import BaseModel
+from ui_coverage_tool import ActionType, SelectorType
+from ui_coverage_tool.src.tracker.models import CoverageResult
+
+from src.ui.locators.base import UILocator
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Коды действий хранятся числами; новые действия ui-coverage-tool добавляются в конец
+_ACTIONS = list(ActionType)
+_ACTION_CODES = {action: code for code, action in enumerate(_ACTIONS)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS selectors (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL,
+    selector TEXT NOT NULL,
+    selector_type TEXT NOT NULL,
+    UNIQUE (app, selector, selector_type)
+);
+CREATE TABLE IF NOT EXISTS actions (
+    selector_id INTEGER NOT NULL REFERENCES selectors (id),
+    action INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (selector_id, action)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS declared (
+    app TEXT NOT NULL,
+    template TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (app, template)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_ACTION = """
+INSERT INTO actions (selector_id, action, count) VALUES (?, ?, ?)
+ON CONFLICT (selector_id, action) DO UPDATE SET count = count + excluded.count
+"""
+
+_PLACEHOLDER_RE = re.compile(r"\{[^{}]*\}")
+_GLOB_SPECIAL_RE = re.compile(r"([*?\[])")
+
+CountKey = tuple[str, ActionType, SelectorType]
+
+
+def _template_pattern(template: str) -> str:
+    """Преобразует шаблон локатора в шаблон GLOB: параметры `{...}` совпадают с чем угодно."""
+    parts = _PLACEHOLDER_RE.split(template)
+    return "*".join(_GLOB_SPECIAL_RE.sub(r"[\1]", part) for part in parts)
+
+
+class CoverageEvent(BaseModel):
+    """Действие с элементом и количество его повторов.
+
+    Attributes:
+        app (str): Ключ приложения из `ui_coverage_config.yaml`.
+        selector (str): Селектор элемента.
+        action_type (ActionType): Тип действия.
+        selector_type (SelectorType): Тип селектора.
+        count (int): Количество повторов действия.
+    """
+
+    app: str
+    selector: str
+    action_type: ActionType
+    selector_type: SelectorType
+    count: int = 1
+
+
+class CoverageStore:
+    """Хранилище событий покрытия UI в файле SQLite.
+
+    Attributes:
+        path (Path): Путь к файлу хранилища.
+    """
+
+    def __init__(self, path: Path | str, readonly: bool = False) -> None:
+        """Открывает хранилище, создавая файл и схему при необходимости.
+
+        Args:
+            path (Path | str): Путь к файлу хранилища или ":memory:".
+            readonly (bool): Открыть существующий файл только для чтения.
+        """
+        self.path = Path(path)
+        if readonly:
+            self._connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            if str(path) != ":memory:":
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(path))
+            self._connection.executescript(_SCHEMA)
+        self._selector_ids: dict[tuple[str, str, SelectorType], int] = {}
+
+    def __enter__(self) -> Self:
+        """Возвращает хранилище для использования в блоке `with`."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Закрывает хранилище при выходе из блока `with`."""
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает соединение с файлом хранилища."""
+        self._connection.close()
+
+    def selector_id(self, app: str, selector: str, selector_type: SelectorType) -> int:
+        """Возвращает идентификатор селектора, добавляя селектор при первом обращении.
+
+        Args:
+            app (str): Ключ приложения.
+            selector (str): Селектор элемента.
+            selector_type (SelectorType): Тип селектора.
+
+        Returns:
+            int: Идентификатор селектора в хранилище.
+        """
+        key = (app, selector, selector_type)
+        selector_id = self._selector_ids.get(key)
+        if selector_id is None:
+            row = self._connection.execute(
+                "INSERT INTO selectors (app, selector, selector_type) VALUES (?, ?, ?) "
+                "ON CONFLICT (app, selector, selector_type) DO UPDATE SET app = excluded.app "
+                "RETURNING id",
+                (app, selector, SelectorType(selector_type).value),
+            ).fetchone()
+            selector_id = self._selector_ids[key] = row[0]
+        return selector_id
+
+    def add(self, app: str, counts: Mapping[CountKey, int]) -> None:
+        """Прибавляет счетчики действий одной транзакцией.
+
+        Args:
+            app (str): Ключ приложения.
+            counts (Mapping[CountKey, int]): Количество действий по селектору,
+                действию и типу селектора.
+        """
+        with self._connection:
+            self._connection.executemany(
+                _UPSERT_ACTION,
+                [
+                    (
+                        self.selector_id(app, selector, selector_type),
+                        _ACTION_CODES[ActionType(action_type)],
+                        count,
+                    )
+                    for (selector, action_type, selector_type), count in counts.items()
+                ],
+            )
+
+    def merge(self, source: Path | str) -> None:
+        """Прибавляет к хранилищу счетчики другого файла хранилища.
+
+        Args:
+            source (Path | str): Путь к файлу хранилища-источника.
+        """
+        self._connection.execute("ATTACH DATABASE ? AS source", (str(source),))
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT INTO selectors (app, selector, selector_type) "
+                    "SELECT app, selector, selector_type FROM source.selectors WHERE true "
+                    "ON CONFLICT DO NOTHING"
+                )
+                self._connection.execute(
+                    "INSERT INTO actions (selector_id, action, count) "
+                    "SELECT target.id, a.action, a.count FROM source.actions AS a "
+                    "JOIN source.selectors AS s ON s.id = a.selector_id "
+                    "JOIN selectors AS target ON target.app = s.app "
+                    "AND target.selector = s.selector AND target.selector_type = s.selector_type "
+                    "WHERE true "
+                    "ON CONFLICT (selector_id, action) DO UPDATE SET count = count + excluded.count"
+                )
+        finally:
+            self._connection.execute("DETACH DATABASE source")
+        self._selector_ids.clear()
+
+    def events(self) -> Iterator[CoverageEvent]:
+        """Возвращает все события хранилища со счетчиками."""
+        rows = self._connection.execute(
+            "SELECT s.app, s.selector, s.selector_type, a.action, a.count "
+            "FROM actions AS a JOIN selectors AS s ON s.id = a.selector_id "
+            "ORDER BY s.id, a.action"
+        )
+        for app, selector, selector_type, action, count in rows:
+            yield CoverageEvent(
+                app=app,
+                selector=selector,
+                action_type=_ACTIONS[action],
+                selector_type=selector_type,
+                count=count,
+            )
+
+    def action_totals(self, app: str) -> dict[ActionType, int]:
+        """Возвращает количество действий приложения по типам действий."""
+        rows = self._connection.execute(
+            "SELECT a.action, SUM(a.count) FROM actions AS a "
+            "JOIN selectors AS s ON s.id = a.selector_id "
+            "WHERE s.app = ? GROUP BY a.action ORDER BY a.action",
+            (app,),
+        )
+        return {_ACTIONS[action]: total for action, total in rows}
+
+    def declare(self, app: str, locators: Iterable[UILocator]) -> None:
+        """Регистрирует объявленные локаторы, покрытие которых нужно отслеживать.
+
+        Параметры шаблона локатора (`{index}`) совпадают с любым значением.
+
+        Args:
+            app (str): Ключ приложения.
+            locators (Iterable[UILocator]): Объявленные локаторы.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO declared (app, template, pattern, description) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (app, selector, _template_pattern(selector), description)
+                    for selector, description in locators
+                ],
+            )
+
+    def untouched(self, app: str) -> list[UILocator]:
+        """Возвращает объявленные локаторы, с которыми не было ни одного действия.
+
+        Args:
+            app (str): Ключ приложения.
+
+        Returns:
+            list[UILocator]: Локаторы без покрытия.
+        """
+        rows = self._connection.execute(
+            "SELECT d.template, d.description FROM declared AS d "
+            "WHERE d.app = ? AND NOT EXISTS ("
+            "SELECT 1 FROM selectors AS s JOIN actions AS a ON a.selector_id = s.id "
+            "WHERE s.app = d.app AND s.selector GLOB d.pattern) "
+            "ORDER BY d.template",
+            (app,),
+        )
+        return [UILocator(*row) for row in rows]
+
+    def export_results(self, results_dir: Path) -> int:
+        """Выгружает события в формат стандартного трекера ui-coverage-tool.
+
+        Каждое действие записывается отдельным JSON-файлом `CoverageResult`, как это
+        делает `UICoverageTracker`, поэтому каталог можно передать команде
+        `ui-coverage-tool save-report`.
+
+        Args:
+            results_dir (Path): Каталог результатов (`results_dir` ui-coverage-tool).
+
+        Returns:
+            int: Количество записанных файлов.
+        """
+        results_dir.mkdir(parents=True, exist_ok=True)
+        written = 0
+        for event in self.events():
+            result = CoverageResult(
+                app=event.app,
+                selector=event.selector,
+                action_type=event.action_type,
+                selector_type=event.selector_type,
+            ).model_dump_json()
+            for _ in range(event.count):
+                results_dir.joinpath(f"{uuid.uuid4()}.json").write_text(result)
+                written += 1
+        return written
+
+
+def declared_locators() -> list[UILocator]:
+    """Возвращает все локаторы, объявленные в классах пакета `src.ui.locators`."""
+    import src.ui.locators as locators_package
+
+    locators = []
+    for name in dir(locators_package):
+        holder = getattr(locators_package, name)
+        if isinstance(holder, type) and name.endswith("Locators"):
+            locators.extend(
+                value for value in vars(holder).values() if isinstance(value, UILocator)
+            )
+    return locators
+
+
+def _open_merged(sources: list[Path]) -> CoverageStore:
+    store = CoverageStore(":memory:")
+    for source in sources:
+        store.merge(source)
+    return store
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и выполняет команду над шардами покрытия."""
+    parser = argparse.ArgumentParser(description="Хранилище покрытия UI")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    untouched = commands.add_parser("untouched", help="Локаторы без покрытия")
+    untouched.add_argument("stores", type=Path, nargs="+", help="Файлы хранилищ (*.sqlite)")
+    untouched.add_argument("--app", default="cism-ms", help="Ключ приложения")
+
+    export = commands.add_parser("export", help="Выгрузка в формат ui-coverage-tool")
+    export.add_argument("stores", type=Path, nargs="+", help="Файлы хранилищ (*.sqlite)")
+    export.add_argument("--results-dir", type=Path, default=Path("coverage-results"))
+    args = parser.parse_args()
+
+    with _open_merged(args.stores) as store:
+        if args.command == "untouched":
+            store.declare(args.app, declared_locators())
+            untouched_locators = store.untouched(args.app)
+            print(
+                json.dumps(
+                    [locator._asdict() for locator in untouched_locators],
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            )
+            logger.info(f"Локаторов без покрытия: {len(untouched_locators)}")
+        else:
+            written = store.export_results(args.results_dir)
+            logger.info(f"Выгружено {written} результатов покрытия в {args.results_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Буферизованный трекер покрытия UI.
+
+`UICoverageTracker` из ui-coverage-tool записывает каждое действие с элементом
+отдельным JSON-файлом со случайным именем: тест, проверяющий список, создает
+сотни файлов, которые затем по одному читает `save-report`. Трекер этого модуля
+накапливает события в памяти, схлопывая одинаковые (селектор, действие,
+тип селектора) в счетчик, и прибавляет счетчики к файлу-шарду своего воркера
+(`<worker>-<uuid>.sqlite` в `results_dir` ui-coverage-tool, см. `CoverageStore`)
+один раз за тест или за сессию. Шарды объединяются и превращаются в отчет ui-coverage-tool
+командой `python -m integrations.coverage.report`.
+"""
+
+from collections import Counter
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import uuid
+
+from ui_coverage_tool import ActionType, SelectorType
+from ui_coverage_tool.config import Settings, get_settings
+
+from integrations.coverage.store import CoverageStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Расширение файлов-шардов; стандартное хранилище ui-coverage-tool читает только *.json
+SHARD_SUFFIX = ".sqlite"
+
+EventKey = tuple[str, ActionType, SelectorType]
+
+
+class CoverageStats:
+    """Статистика трекера покрытия.
+
+    Attributes:
+        tracked (int): Количество зарегистрированных действий.
+        written (int): Количество счетчиков, записанных в шард.
+        flushes (int): Количество сбросов буфера в файл.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.tracked = 0
+        self.written = 0
+        self.flushes = 0
+
+    def summary(self) -> str:
+        """Возвращает сводку статистики в читаемом виде."""
+        if not self.tracked:
+            return "нет данных"
+        return (
+            f"действий: {self.tracked}, записано счетчиков: {self.written} "
+            f"(сжатие {self.tracked / max(self.written, 1):.1f}x), сбросов: {self.flushes}"
+        )
+
+
+class BufferedCoverageTracker:
+    """Трекер покрытия UI с буфером в памяти и записью в шард воркера.
+
+    Совместим по вызову `track_coverage` с `UICoverageTracker`. Буфер общий
+    для потоков воркера и защищен блокировкой.
+
+    Attributes:
+        app (str): Ключ приложения из `ui_coverage_config.yaml`.
+        stats (CoverageStats): Статистика трекера.
+    """
+
+    def __init__(self, app: str, settings: Settings | None = None) -> None:
+        """Инициализирует трекер с пустым буфером.
+
+        Args:
+            app (str): Ключ приложения из `ui_coverage_config.yaml`.
+            settings (Settings | None): Настройки ui-coverage-tool; по умолчанию
+                читаются из `ui_coverage_config.yaml` при первой записи.
+        """
+        self.app = app
+        self.stats = CoverageStats()
+        self._settings = settings
+        self._buffer: Counter[EventKey] = Counter()
+        self._lock = threading.Lock()
+        self._shard_path: Path | None = None
+
+    @property
+    def shard_path(self) -> Path:
+        """Путь к файлу-шарду текущего процесса."""
+        if self._shard_path is None:
+            settings = self._settings or get_settings()
+            worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+            file_name = f"{worker_id}-{uuid.uuid4().hex}{SHARD_SUFFIX}"
+            self._shard_path = settings.results_dir / file_name
+        return self._shard_path
+
+    def track_coverage(
+        self, selector: str, action_type: ActionType, selector_type: SelectorType
+    ) -> None:
+        """Регистрирует действие с элементом в буфере.
+
+        Args:
+            selector (str): Селектор элемента.
+            action_type (ActionType): Тип действия.
+            selector_type (SelectorType): Тип селектора.
+        """
+        with self._lock:
+            self._buffer[(selector, action_type, selector_type)] += 1
+            self.stats.tracked += 1
+
+    def flush(self) -> int:
+        """Прибавляет накопленные счетчики к файлу-шарду и очищает буфер.
+
+        Returns:
+            int: Количество записанных счетчиков.
+        """
+        with self._lock:
+            if not self._buffer:
+                return 0
+            buffer, self._buffer = self._buffer, Counter()
+
+        try:
+            with CoverageStore(self.shard_path) as store:
+                store.add(self.app, buffer)
+        except sqlite3.Error as error:
+            logger.error(f"Не удалось записать покрытие в {self.shard_path}: {error}")
+            return 0
+
+        self.stats.written += len(buffer)
+        self.stats.flushes += 1
+        return len(buffer)
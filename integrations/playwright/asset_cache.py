@@ -0,0 +1,343 @@
+from collections import OrderedDict
+from contextlib import suppress
+import hashlib
+import os
+from pathlib import Path
+import re
+import time
+
+from playwright.sync_api import APIResponse, Page, Route
+from playwright.sync_api import Error as PlaywrightError
+from pydantic import BaseModel, ValidationError
+
+from config import AssetCacheSettings, HarMode, settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Заголовки ответа, которые сохраняются вместе с телом ресурса. Content-Encoding
+# и Content-Length не сохраняются: тело хранится уже распакованным.
+_STORED_HEADERS = (
+    "content-type",
+    "cache-control",
+    "etag",
+    "last-modified",
+    "access-control-allow-origin",
+)
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Как часто обновлять отметку использования файла ресурса, отдаваемого из памяти
+_TOUCH_INTERVAL_SECONDS = 60
+
+
+class CachedAsset(BaseModel):
+    """Запись индекса кеша статических ресурсов.
+
+    Attributes:
+        url (str): URL ресурса.
+        digest (str): SHA-256 тела ресурса, по которому тело хранится на диске.
+        size (int): Размер тела в байтах.
+        headers (dict[str, str]): Сохраненные заголовки ответа.
+        stored_at (float): Время сохранения или последней перепроверки (Unix time).
+        fresh_for (int): Время в секундах, в течение которого ресурс не перепроверяется.
+    """
+
+    url: str
+    digest: str
+    size: int
+    headers: dict[str, str]
+    stored_at: float
+    fresh_for: int
+
+    @property
+    def is_fresh(self) -> bool:
+        """Можно ли отдать ресурс без перепроверки на сервере."""
+        return time.time() - self.stored_at < self.fresh_for
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Заголовки условного запроса для перепроверки ресурса."""
+        validators = {}
+        if "etag" in self.headers:
+            validators["if-none-match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["if-modified-since"] = self.headers["last-modified"]
+        return validators
+
+
+class AssetCacheStats:
+    """Статистика кеша статических ресурсов.
+
+    Attributes:
+        hits (int): Ресурсы, отданные из кеша без обращения к серверу.
+        revalidated (int): Ресурсы, отданные из кеша после ответа 304.
+        misses (int): Ресурсы, загруженные с сервера.
+        bytes_saved (int): Объем тел ресурсов, отданных из кеша.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля ресурсов, отданных из кеша (с перепроверкой или без)."""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+    def summary(self) -> str:
+        """Возвращает сводку по кешу в читаемом виде."""
+        return (
+            f"попаданий {self.hits}, после перепроверки {self.revalidated}, "
+            f"промахов {self.misses}, доля попаданий {self.hit_rate:.0%}, "
+            f"сэкономлено {self.bytes_saved / 1024:.0f} КБ"
+        )
+
+
+class AssetCache:
+    """Общий для всех контекстов браузера кеш статических ресурсов.
+
+    Контексты Playwright не разделяют HTTP-кеш, поэтому каждый новый контекст
+    заново скачивает одни и те же JS и CSS. Кеш перехватывает GET-запросы
+    ресурсов типов `resource_types` и отдает сохраненные ответы через
+    `route.fulfill`. Устаревшие ресурсы перепроверяются условным запросом
+    (`If-None-Match` / `If-Modified-Since`), ответ 304 продлевает запись.
+
+    Тела ресурсов хранятся на диске по SHA-256 содержимого (`objects/`),
+    индекс - по одному JSON-файлу на URL (`index/`), поэтому воркеры xdist
+    разделяют дисковый кеш без блокировок. В памяти воркера держатся последние
+    использованные тела в пределах `memory_limit_mb`; дисковый кеш при
+    превышении `disk_limit_mb` очищается от давно не использованных тел.
+
+    Attributes:
+        settings (AssetCacheSettings): Настройки кеша.
+        stats (AssetCacheStats): Статистика кеша воркера.
+    """
+
+    def __init__(self, cache_settings: AssetCacheSettings, har_mode: HarMode) -> None:
+        """Инициализирует кеш статических ресурсов.
+
+        Args:
+            cache_settings (AssetCacheSettings): Настройки кеша.
+            har_mode (HarMode): Режим HAR-архивов; при записи и воспроизведении
+                кеш не используется, чтобы не подменять трафик архивов.
+        """
+        self.settings = cache_settings
+        self.enabled = cache_settings.enabled and har_mode == HarMode.OFF
+        self.stats = AssetCacheStats()
+        self._index: dict[str, CachedAsset] = {}
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk_size: int | None = None
+        self._touched: dict[str, float] = {}
+
+    @property
+    def _objects_dir(self) -> Path:
+        return self.settings.cache_dir / "objects"
+
+    @property
+    def _index_dir(self) -> Path:
+        return self.settings.cache_dir / "index"
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects_dir / digest[:2] / digest
+
+    def _index_path(self, url: str) -> Path:
+        return self._index_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _lookup(self, url: str) -> CachedAsset | None:
+        entry = self._index.get(url)
+        if entry is not None:
+            return entry
+
+        index_path = self._index_path(url)
+        if not index_path.exists():
+            return None
+        try:
+            entry = CachedAsset.model_validate_json(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError):
+            return None
+        self._index[url] = entry
+        return entry
+
+    def _remember(self, digest: str, body: bytes) -> None:
+        limit = self.settings.memory_limit_mb * 1024 * 1024
+        if len(body) > limit:
+            return
+
+        if digest not in self._memory:
+            self._memory_size += len(body)
+        self._memory[digest] = body
+        self._memory.move_to_end(digest)
+        while self._memory_size > limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _touch(self, digest: str) -> None:
+        """Отмечает использование файла ресурса для вытеснения с диска.
+
+        Время изменения файла служит отметкой последнего использования. Для
+        ресурсов, отдаваемых из памяти, оно обновляется не чаще, чем раз
+        в `_TOUCH_INTERVAL_SECONDS`, иначе самые востребованные ресурсы выглядели бы
+        на диске самыми старыми и вытеснялись первыми.
+        """
+        now = time.monotonic()
+        if now - self._touched.get(digest, float("-inf")) < _TOUCH_INTERVAL_SECONDS:
+            return
+        self._touched[digest] = now
+        with suppress(OSError):
+            os.utime(self._object_path(digest))
+
+    def _read_body(self, entry: CachedAsset) -> bytes | None:
+        body = self._memory.get(entry.digest)
+        if body is not None:
+            self._memory.move_to_end(entry.digest)
+            self._touch(entry.digest)
+            return body
+
+        object_path = self._object_path(entry.digest)
+        try:
+            body = object_path.read_bytes()
+        except OSError:
+            return None
+        self._touch(entry.digest)
+        self._remember(entry.digest, body)
+        return body
+
+    def _store(self, url: str, response: APIResponse, body: bytes) -> CachedAsset | None:
+        headers = response.headers
+        cache_control = headers.get("cache-control", "")
+        if "no-store" in cache_control:
+            return None
+
+        if "no-cache" in cache_control:
+            fresh_for = 0
+        elif match := _MAX_AGE_RE.search(cache_control):
+            fresh_for = int(match.group(1))
+        else:
+            fresh_for = self.settings.ttl
+
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            self._write_atomic(object_path, body)
+            self._track_disk_usage(len(body))
+
+        entry = CachedAsset(
+            url=url,
+            digest=digest,
+            size=len(body),
+            headers={name: headers[name] for name in _STORED_HEADERS if name in headers},
+            stored_at=time.time(),
+            fresh_for=fresh_for,
+        )
+        self._save_entry(entry)
+        self._remember(digest, body)
+        return entry
+
+    def _save_entry(self, entry: CachedAsset) -> None:
+        self._index[entry.url] = entry
+        self._write_atomic(self._index_path(entry.url), entry.model_dump_json().encode())
+
+    def _track_disk_usage(self, added: int) -> None:
+        objects = None
+        if self._disk_size is None:
+            objects = list(self._objects_dir.glob("*/*"))
+            self._disk_size = sum(path.stat().st_size for path in objects)
+        else:
+            self._disk_size += added
+
+        limit = self.settings.disk_limit_mb * 1024 * 1024
+        if self._disk_size <= limit:
+            return
+
+        objects = objects or list(self._objects_dir.glob("*/*"))
+        # Вытесняем до 90% предела, чтобы не очищать каталог на каждой записи
+        for path in sorted(objects, key=lambda path: path.stat().st_mtime):
+            if self._disk_size <= limit * 0.9:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            self._disk_size -= size
+        logger.debug(f"Дисковый кеш статики очищен до {self._disk_size / 1024 / 1024:.0f} МБ")
+
+    def handle(self, route: Route) -> None:
+        """Обрабатывает перехваченный запрос статического ресурса.
+
+        Если запрос к серверу не удался (сетевая ошибка), маршрут передается
+        дальше по цепочке без кеша, чтобы браузер получил ответ или ошибку сам,
+        а не ждал разрешения маршрута до таймаута навигации.
+
+        Args:
+            route (Route): Перехваченный маршрут Playwright.
+        """
+        request = route.request
+        if request.method != "GET" or request.resource_type not in self.settings.resource_types:
+            route.fallback()
+            return
+
+        try:
+            self._handle_cacheable(route)
+        except PlaywrightError as error:
+            logger.debug(f"Кеш статики пропустил {request.url}: {error.message}")
+            # Маршрут может быть уже недоступен, если закрыта сама страница
+            with suppress(PlaywrightError):
+                route.fallback()
+
+    def _handle_cacheable(self, route: Route) -> None:
+        request = route.request
+        entry = self._lookup(request.url)
+        body = self._read_body(entry) if entry else None
+        if entry and body is not None:
+            if entry.is_fresh:
+                self.stats.hits += 1
+                self.stats.bytes_saved += entry.size
+                route.fulfill(status=200, headers=entry.headers, body=body)
+                return
+
+            if entry.validators:
+                response = route.fetch(headers={**request.headers, **entry.validators})
+                if response.status == 304:
+                    entry = entry.model_copy(update={"stored_at": time.time()})
+                    self._save_entry(entry)
+                    self.stats.revalidated += 1
+                    self.stats.bytes_saved += entry.size
+                    route.fulfill(status=200, headers=entry.headers, body=body)
+                    return
+            else:
+                response = route.fetch()
+        else:
+            response = route.fetch()
+
+        self.stats.misses += 1
+        body = response.body()
+        if response.status == 200:
+            self._store(request.url, response, body)
+        route.fulfill(response=response, body=body)
+
+    def attach(self, page: Page) -> None:
+        """Подключает кеш к странице.
+
+        Маршрут кеша регистрируется до политики блокировки запросов: Playwright
+        проверяет маршруты в обратном порядке регистрации, поэтому в кеш попадают
+        только запросы, пропущенные политикой.
+
+        Args:
+            page (Page): Объект страницы Playwright.
+        """
+        if self.enabled:
+            page.route("**/*", self.handle)
+
+
+# Глобальный кеш статических ресурсов воркера
+asset_cache = AssetCache(settings.ui.asset_cache, har_mode=settings.ui.har_mode)
@@ -0,0 +1,128 @@
+import os
+
+from playwright.sync_api import Browser, BrowserContext, Playwright
+
+from config import Browser as BrowserType
+from config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+class BrowserPoolStats:
+    """Счетчики запусков и переиспользований браузеров пула.
+
+    Attributes:
+        launches (dict[tuple[str, str], int]): Количество запусков по ключу (воркер, браузер).
+        reuses (dict[tuple[str, str], int]): Количество переиспользований по тому же ключу.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустые счетчики."""
+        self.launches: dict[tuple[str, str], int] = {}
+        self.reuses: dict[tuple[str, str], int] = {}
+
+    def record_launch(self, key: tuple[str, str]) -> None:
+        """Учитывает запуск нового процесса браузера."""
+        self.launches[key] = self.launches.get(key, 0) + 1
+
+    def record_reuse(self, key: tuple[str, str]) -> None:
+        """Учитывает выдачу уже запущенного браузера."""
+        self.reuses[key] = self.reuses.get(key, 0) + 1
+
+    @property
+    def total_launches(self) -> int:
+        """Общее количество запусков браузеров."""
+        return sum(self.launches.values())
+
+    @property
+    def total_reuses(self) -> int:
+        """Общее количество переиспользований браузеров."""
+        return sum(self.reuses.values())
+
+    def summary(self) -> str:
+        """Возвращает сводку по запускам и переиспользованиям в читаемом виде."""
+        lines = [
+            f"запусков: {self.total_launches}, переиспользований: {self.total_reuses}",
+        ]
+        for key in sorted({*self.launches, *self.reuses}):
+            worker, browser_type = key
+            lines.append(
+                f"  [{worker}] {browser_type}: запусков {self.launches.get(key, 0)}, "
+                f"переиспользований {self.reuses.get(key, 0)}"
+            )
+        return "\n".join(lines)
+
+
+class BrowserPool:
+    """Пул браузеров, держащий по одному процессу на пару (воркер, тип браузера).
+
+    Браузер запускается при первом запросе и живет до конца сессии. Каждый тест
+    получает собственный `BrowserContext`, а между тестами закрывается только контекст,
+    что избавляет от холодного старта браузера на каждый тест.
+
+    Attributes:
+        playwright (Playwright): Объект Playwright для запуска браузеров.
+        worker_id (str): Идентификатор воркера pytest-xdist (`master` без xdist).
+        stats (BrowserPoolStats): Статистика запусков и переиспользований.
+    """
+
+    def __init__(self, playwright: Playwright) -> None:
+        """Инициализирует пул браузеров.
+
+        Args:
+            playwright (Playwright): Объект Playwright для запуска браузеров.
+        """
+        self.playwright = playwright
+        self.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        self.stats = BrowserPoolStats()
+        self._browsers: dict[tuple[str, str], Browser] = {}
+
+    def _key(self, browser_type: BrowserType) -> tuple[str, str]:
+        return self.worker_id, BrowserType(browser_type).value
+
+    def get_browser(self, browser_type: BrowserType) -> Browser:
+        """Возвращает запущенный браузер указанного типа, запуская его при необходимости.
+
+        Если ранее запущенный браузер был отключен (например, упал процесс),
+        он запускается заново.
+
+        Args:
+            browser_type (BrowserType): Тип браузера (webkit, chromium, firefox).
+
+        Returns:
+            Browser: Экземпляр запущенного браузера.
+        """
+        key = self._key(browser_type)
+        browser = self._browsers.get(key)
+
+        if browser is not None and browser.is_connected():
+            self.stats.record_reuse(key)
+            return browser
+
+        logger.info(f"Запуск браузера {key[1]} для воркера {key[0]}")
+        browser = self.playwright[key[1]].launch(headless=settings.ui.headless)
+        self._browsers[key] = browser
+        self.stats.record_launch(key)
+        return browser
+
+    def new_context(self, browser_type: BrowserType, **kwargs) -> BrowserContext:
+        """Создает новый контекст в браузере пула.
+
+        Args:
+            browser_type (BrowserType): Тип браузера (webkit, chromium, firefox).
+            **kwargs: Параметры, передаваемые в `Browser.new_context`.
+
+        Returns:
+            BrowserContext: Новый изолированный контекст браузера.
+        """
+        return self.get_browser(browser_type).new_context(**kwargs)
+
+    def close(self) -> None:
+        """Закрывает все браузеры пула и выводит статистику их использования."""
+        for browser in self._browsers.values():
+            if browser.is_connected():
+                browser.close()
+        self._browsers.clear()
+
+        logger.info(f"Статистика пула браузеров: {self.stats.summary()}")
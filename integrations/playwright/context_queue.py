@@ -0,0 +1,214 @@
+from collections import deque
+import time
+from typing import NamedTuple
+
+from playwright.sync_api import BrowserContext, Page
+from playwright_stealth import Stealth
+
+from config import Browser, settings
+from integrations.playwright.asset_cache import asset_cache
+from integrations.playwright.browser_pool import BrowserPool
+from integrations.playwright.mocks import RequestStats, apply_blocking_policy
+from integrations.playwright.ui_coverage_script import add_coverage_script, load_agent_script
+from src.ui.waits import install_wait_helpers, wait_for_dom_quiet
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+class PreparedPage(NamedTuple):
+    """Подготовленные к тесту контекст и страница.
+
+    Attributes:
+        context (BrowserContext): Контекст браузера с примененным stealth.
+        page (Page): Страница с подключенной политикой блокировки запросов.
+        request_stats (RequestStats): Статистика заблокированных и пропущенных запросов.
+    """
+
+    context: BrowserContext
+    page: Page
+    request_stats: RequestStats
+
+
+class SetupLatencyStats:
+    """Метрика времени подготовки страницы к тесту.
+
+    Attributes:
+        samples (list[tuple[str, float, bool]]): Замеры в виде
+            (имя теста, задержка в мс, была ли страница подготовлена заранее).
+        refills (list[float]): Время пополнения очереди в teardown тестов в мс.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой список замеров."""
+        self.samples: list[tuple[str, float, bool]] = []
+        self.refills: list[float] = []
+
+    def record(self, test_name: str, latency_ms: float, warm: bool) -> None:
+        """Сохраняет замер времени подготовки страницы для теста."""
+        self.samples.append((test_name, latency_ms, warm))
+        logger.debug(
+            f"Подготовка страницы для '{test_name}': {latency_ms:.0f} мс"
+            f" ({'из очереди' if warm else 'холодный старт'})"
+        )
+
+    def summary(self) -> str:
+        """Возвращает сводку по замерам: количество, среднее, p95 и максимум.
+
+        Время пополнения очереди выводится отдельно, так как оно приходится
+        на teardown тестов.
+        """
+        if not self.samples:
+            return "замеров нет"
+
+        latencies = sorted(latency for _, latency, _ in self.samples)
+        warm_count = sum(1 for *_, warm in self.samples if warm)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        summary = (
+            f"тестов: {len(latencies)} (из очереди: {warm_count}), "
+            f"среднее: {sum(latencies) / len(latencies):.0f} мс, "
+            f"p95: {p95:.0f} мс, максимум: {latencies[-1]:.0f} мс"
+        )
+        if self.refills:
+            summary += (
+                f", пополнение очереди в teardown: "
+                f"среднее {sum(self.refills) / len(self.refills):.0f} мс"
+            )
+        return summary
+
+
+class ContextWarmupQueue:
+    """Очередь заранее подготовленных контекстов и страниц.
+
+    Подготовка страницы (stealth, кеш статики, блокировка запросов, скрипт
+    ожиданий и движение мыши) выполняется заранее, поэтому настройка теста
+    сводится к извлечению страницы из очереди. Очереди ведутся раздельно для
+    каждого сочетания браузера, файла состояния и признака записи видео, так как
+    запись видео задается при создании контекста.
+
+    Фонового прогрева нет: синхронный API Playwright привязан к потоку, в котором
+    он запущен, поэтому очередь пополняется синхронно в teardown предыдущего теста,
+    сразу после закрытия его контекста. Создание контекста и страницы не исчезает,
+    а переносится из setup следующего теста в teardown предыдущего; выигрыш дает
+    ожидание затихания новой страницы, которое идет параллельно с оставшимся
+    teardown (вложения Allure, HAR) и setup фикстур следующего теста. Время
+    пополнения учитывается в `stats` отдельно от времени подготовки.
+
+    Attributes:
+        browser_pool (BrowserPool): Пул браузеров, в которых создаются контексты.
+        depth (int): Количество страниц, подготавливаемых заранее для каждого ключа.
+        stats (SetupLatencyStats): Метрика времени подготовки страниц к тестам.
+    """
+
+    def __init__(self, browser_pool: BrowserPool, depth: int) -> None:
+        """Инициализирует очередь подготовленных страниц.
+
+        Args:
+            browser_pool (BrowserPool): Пул браузеров, в которых создаются контексты.
+            depth (int): Глубина очереди для каждого ключа; 0 отключает подготовку заранее.
+        """
+        self.browser_pool = browser_pool
+        self.depth = depth
+        self.stats = SetupLatencyStats()
+        self._queues: dict[tuple[str, str, bool], deque[PreparedPage]] = {}
+        self._stealth = Stealth()
+        if settings.ui.coverage_agent:
+            # Недоступный агент должен остановить сессию сразу, а не на первом тесте
+            load_agent_script()
+
+    @staticmethod
+    def _key(
+        browser_type: Browser, state: str | None, record_video: bool
+    ) -> tuple[str, str, bool]:
+        return Browser(browser_type).value, str(state or ""), record_video
+
+    def _prepare(
+        self, browser_type: Browser, state: str | None, record_video: bool
+    ) -> PreparedPage:
+        """Создает контекст и страницу, полностью готовые к началу теста."""
+        context = self.browser_pool.new_context(
+            browser_type,
+            storage_state=state,
+            record_video_dir=settings.ui.videos_path if record_video else None,
+            base_url=settings.get_ui_base_url(),
+            bypass_csp=True,
+        )
+        self._stealth.apply_stealth_sync(context)
+        install_wait_helpers(context)
+        if settings.ui.coverage_agent:
+            add_coverage_script(context)
+        page = context.new_page()
+        asset_cache.attach(page)
+        request_stats = apply_blocking_policy(page)
+        page.mouse.move(10, 10)
+        return PreparedPage(context=context, page=page, request_stats=request_stats)
+
+    def has_prepared(
+        self, browser_type: Browser, state: str | None = None, record_video: bool = False
+    ) -> bool:
+        """Проверяет, есть ли в очереди подготовленная страница для указанного ключа."""
+        return bool(self._queues.get(self._key(browser_type, state, record_video)))
+
+    def acquire(
+        self, browser_type: Browser, state: str | None = None, record_video: bool = False
+    ) -> PreparedPage:
+        """Возвращает готовую страницу из очереди или готовит новую.
+
+        Перед выдачей страницы дожидается, пока ее DOM затихнет: для страницы,
+        подготовленной заранее, ожидание завершается сразу.
+
+        Args:
+            browser_type (Browser): Тип браузера (webkit, chromium, firefox).
+            state (str | None): Путь к файлу состояния браузера.
+            record_video (bool): Нужна ли запись видео в контексте.
+
+        Returns:
+            PreparedPage: Подготовленные контекст, страница и статистика запросов.
+        """
+        queue = self._queues.setdefault(
+            self._key(browser_type, state, record_video), deque()
+        )
+
+        while queue:
+            prepared = queue.popleft()
+            if prepared.context.browser and prepared.context.browser.is_connected():
+                break
+            logger.warning("Подготовленный контекст отброшен: браузер отключен")
+        else:
+            prepared = self._prepare(browser_type, state, record_video)
+
+        wait_for_dom_quiet(prepared.page)
+        return prepared
+
+    def refill(
+        self, browser_type: Browser, state: str | None = None, record_video: bool = False
+    ) -> None:
+        """Пополняет очередь для указанного ключа до заданной глубины.
+
+        Args:
+            browser_type (Browser): Тип браузера (webkit, chromium, firefox).
+            state (str | None): Путь к файлу состояния браузера.
+            record_video (bool): Нужна ли запись видео в контексте.
+        """
+        queue = self._queues.setdefault(
+            self._key(browser_type, state, record_video), deque()
+        )
+        if len(queue) >= self.depth:
+            return
+
+        started_at = time.monotonic()
+        while len(queue) < self.depth:
+            queue.append(self._prepare(browser_type, state, record_video))
+        self.stats.refills.append((time.monotonic() - started_at) * 1000)
+
+    def close(self) -> None:
+        """Закрывает все неиспользованные контексты и выводит метрику подготовки."""
+        for queue in self._queues.values():
+            while queue:
+                prepared = queue.popleft()
+                if prepared.context.browser and prepared.context.browser.is_connected():
+                    prepared.context.close()
+                    if prepared.page.video:
+                        prepared.page.video.delete()
+
+        logger.info(f"Время подготовки страниц к тестам: {self.stats.summary()}")
@@ -0,0 +1,195 @@
+from collections.abc import Iterable
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+
+from playwright.sync_api import BrowserContext, Route
+
+from config import HarMode, settings
+from src.ui.routes import AppRoute
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Общий архив для запросов, не относящихся к отдельным маршрутам
+COMMON_ARCHIVE = "common"
+
+# Маршруты, трафик которых записывается в отдельные архивы вместе с вложенными
+# страницами (например, страницы вакансий внутри /vakansii)
+ARCHIVED_ROUTES = (AppRoute.VACANCIES, AppRoute.NEWS, AppRoute.MATERIALS)
+
+
+def _safe_name(name: str) -> str:
+    """Преобразует имя теста в имя каталога."""
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+class HarRouter:
+    """Запись и воспроизведение сетевого трафика тестов через HAR-архивы.
+
+    В режиме `record` трафик каждого теста записывается в отдельные архивы
+    по маршрутам приложения (`ARCHIVED_ROUTES`) и общий архив для остальных
+    запросов. В конце сессии записи всех тестов и воркеров объединяются
+    в итоговые архивы каталога `har_dir`.
+
+    В режиме `replay` ответы отдаются из итоговых архивов через `route_from_har`.
+    Запросы, которых нет в архивах, не уходят в сеть: они прерываются
+    и учитываются как промахи теста.
+
+    Attributes:
+        mode (HarMode): Режим работы с HAR-архивами.
+        har_dir (Path): Каталог итоговых архивов.
+        base_url (str): Базовый URL приложения.
+        misses (dict[str, list[str]]): Промахи воспроизведения по именам тестов.
+    """
+
+    def __init__(self, mode: HarMode, har_dir: Path, base_url: str) -> None:
+        """Инициализирует маршрутизатор HAR-архивов.
+
+        Args:
+            mode (HarMode): Режим работы с HAR-архивами.
+            har_dir (Path): Каталог итоговых архивов.
+            base_url (str): Базовый URL приложения.
+        """
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.base_url = base_url.rstrip("/")
+        self.misses: dict[str, list[str]] = {}
+        self._patterns = self._build_patterns()
+
+    @property
+    def recordings_dir(self) -> Path:
+        """Каталог записей отдельных тестов в режиме `record`."""
+        return self.har_dir / "recordings"
+
+    def _build_patterns(self) -> dict[str, re.Pattern[str]]:
+        """Строит непересекающиеся шаблоны URL для каждого архива."""
+        patterns = {}
+        route_sources = []
+        for route in ARCHIVED_ROUTES:
+            source = re.escape(self.base_url + route.value) + r"(?:[/?#].*)?$"
+            patterns[route.name.lower()] = re.compile("^" + source)
+            route_sources.append(source)
+
+        patterns[COMMON_ARCHIVE] = re.compile(f"^(?!(?:{'|'.join(route_sources)})).*")
+        return patterns
+
+    def archive_path(self, name: str) -> Path:
+        """Возвращает путь к итоговому архиву с указанным именем."""
+        return self.har_dir / f"{name}.har"
+
+    def attach(self, context: BrowserContext, test_name: str) -> None:
+        """Подключает запись или воспроизведение трафика к контексту браузера.
+
+        Args:
+            context (BrowserContext): Контекст браузера теста.
+            test_name (str): Имя теста, используется для записи и учета промахов.
+        """
+        if self.mode is HarMode.RECORD:
+            self._record(context, test_name)
+        elif self.mode is HarMode.REPLAY:
+            self._replay(context, test_name)
+
+    def _record(self, context: BrowserContext, test_name: str) -> None:
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        test_dir = self.recordings_dir / worker_id / _safe_name(test_name)
+        test_dir.mkdir(parents=True, exist_ok=True)
+
+        # Архивы записываются на диск при закрытии контекста
+        for name, pattern in self._patterns.items():
+            context.route_from_har(
+                test_dir / f"{name}.har",
+                url=pattern,
+                update=True,
+                update_content="embed",
+                update_mode="minimal",
+            )
+
+    def _replay(self, context: BrowserContext, test_name: str) -> None:
+        misses = self.misses.setdefault(test_name, [])
+
+        def abort_miss(route: Route) -> None:
+            misses.append(f"{route.request.method} {route.request.url}")
+            route.abort("internetdisconnected")
+
+        # Маршрут, зарегистрированный первым, срабатывает последним: сюда попадают
+        # только запросы, не найденные ни в одном архиве
+        context.route("**/*", abort_miss)
+        for name, pattern in self._patterns.items():
+            archive = self.archive_path(name)
+            if not archive.exists():
+                logger.warning(f"HAR-архив не найден, запросы считаются промахами: {archive}")
+                continue
+            context.route_from_har(archive, url=pattern, not_found="fallback")
+
+    def pop_misses(self, test_name: str) -> list[str]:
+        """Возвращает и сбрасывает промахи воспроизведения для теста.
+
+        Args:
+            test_name (str): Имя теста.
+
+        Returns:
+            list[str]: Запросы (метод и URL), которых не оказалось в архивах.
+        """
+        return self.misses.pop(test_name, [])
+
+    def merge_recordings(self) -> None:
+        """Объединяет записи всех тестов и воркеров в итоговые архивы.
+
+        Записи добавляются поверх существующих архивов: при совпадении метода, URL
+        и тела запроса остается более свежий ответ. После объединения записи
+        отдельных тестов удаляются.
+        """
+        if not self.recordings_dir.exists():
+            return
+
+        for name in self._patterns:
+            recordings = sorted(
+                self.recordings_dir.glob(f"*/*/{name}.har"),
+                key=lambda path: path.stat().st_mtime,
+            )
+            if recordings:
+                count = self._merge(self.archive_path(name), recordings)
+                logger.info(f"HAR-архив {name}: {count} запросов")
+
+        shutil.rmtree(self.recordings_dir, ignore_errors=True)
+
+    @staticmethod
+    def _merge(archive: Path, recordings: Iterable[Path]) -> int:
+        """Объединяет записи в архив и возвращает количество записей в нем."""
+        sources = [archive, *recordings] if archive.exists() else list(recordings)
+
+        log: dict = {}
+        entries: dict[tuple[str, str, str], dict] = {}
+        for source in sources:
+            try:
+                source_log = json.loads(source.read_text(encoding="utf-8"))["log"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Пропущена поврежденная запись HAR {source}: {e}")
+                continue
+
+            log = log or source_log
+            for entry in source_log.get("entries", []):
+                request = entry["request"]
+                key = (
+                    request["method"],
+                    request["url"],
+                    request.get("postData", {}).get("text", ""),
+                )
+                entry.pop("pageref", None)
+                entries[key] = entry
+
+        log["pages"] = []
+        log["entries"] = list(entries.values())
+        archive.write_text(json.dumps({"log": log}, ensure_ascii=False), encoding="utf-8")
+        return len(entries)
+
+
+# Глобальный маршрутизатор HAR-архивов
+har_router = HarRouter(
+    mode=settings.ui.har_mode,
+    har_dir=settings.ui.har_dir,
+    base_url=settings.get_ui_base_url(),
+)
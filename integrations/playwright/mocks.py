@@ -1,18 +1,232 @@
-from playwright.sync_api import Page
+from functools import lru_cache
+import re
+from urllib.parse import urlsplit
 
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Frame, Page, Request, Response, Route
 
-def mock_static_resources(page: Page):
-    """Отключает загрузку статических ресурсов на странице.
+from config import BlockingPolicySettings, BlockingRule, settings
+from src.utils.logger import get_logger
 
-    Эта функция используется для ускорения тестирования,
-    блокируя загрузку ненужных статических файлов,
-    таких как изображения, шрифты и медиафайлы.
-    Это позволяет сократить время выполнения тестов
-    и уменьшить сетевой трафик.
+logger = get_logger(__name__.upper())
+
+
+@lru_cache(maxsize=256)
+def _glob_to_regex(glob: str) -> re.Pattern[str]:
+    """Преобразует glob-шаблон URL в стиле Playwright (`**`, `*`, `?`, `{a,b}`)."""
+    parts = []
+    index = 0
+    while index < len(glob):
+        char = glob[index]
+        if glob.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "{":
+            end = glob.index("}", index)
+            options = glob[index + 1 : end].split(",")
+            parts.append(f"(?:{'|'.join(map(re.escape, options))})")
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile("^" + "".join(parts) + "$")
+
+
+def _domain_matches(host: str, domains: list[str]) -> bool:
+    """Проверяет, совпадает ли хост с доменом из списка или является его поддоменом."""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class RequestStats:
+    """Счетчики заблокированных и пропущенных запросов страницы.
+
+    Объем пропущенных ответов берется из заголовка `Content-Length`. Объем
+    заблокированных запросов известен только в режиме `dry_run`, когда запросы
+    классифицируются, но не блокируются.
+
+    Attributes:
+        blocked (dict[str, int]): Количество заблокированных запросов по причинам.
+        blocked_bytes (int): Объем ответов на запросы, попавшие под блокировку.
+        allowed (int): Количество пропущенных запросов.
+        allowed_bytes (int): Объем ответов на пропущенные запросы.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.blocked: dict[str, int] = {}
+        self.blocked_bytes = 0
+        self.allowed = 0
+        self.allowed_bytes = 0
+
+    @property
+    def total_blocked(self) -> int:
+        """Общее количество заблокированных запросов."""
+        return sum(self.blocked.values())
+
+    def merge(self, other: "RequestStats") -> None:
+        """Добавляет к счетчикам значения другой статистики."""
+        for reason, count in other.blocked.items():
+            self.blocked[reason] = self.blocked.get(reason, 0) + count
+        self.blocked_bytes += other.blocked_bytes
+        self.allowed += other.allowed
+        self.allowed_bytes += other.allowed_bytes
+
+    def summary(self) -> str:
+        """Возвращает сводку по запросам в читаемом виде."""
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(self.blocked.items()))
+        return (
+            f"заблокировано {self.total_blocked} ({reasons or 'нет'}; "
+            f"{self.blocked_bytes / 1024:.0f} КБ), "
+            f"пропущено {self.allowed} ({self.allowed_bytes / 1024:.0f} КБ)"
+        )
+
+
+class BlockingPolicy:
+    """Декларативная политика блокировки запросов страницы.
+
+    Правила проверяются в порядке: разрешенные домены (запрос всегда пропускается),
+    запрещенные домены, типы ресурсов, шаблоны URL. Документы основной навигации
+    не блокируются никогда. Для страниц, путь которых начинается с ключа
+    `route_overrides`, указанные в переопределении поля правила заменяют общие.
+
+    Attributes:
+        settings (BlockingPolicySettings): Настройки политики.
+    """
+
+    def __init__(self, policy_settings: BlockingPolicySettings) -> None:
+        """Инициализирует политику блокировки.
+
+        Args:
+            policy_settings (BlockingPolicySettings): Настройки политики.
+        """
+        self.settings = policy_settings
+        # Более длинные пути проверяются первыми, чтобы /vakansii/x побеждал /vakansii
+        self._overrides = sorted(
+            policy_settings.route_overrides.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def rule_for(self, page_url: str) -> BlockingRule:
+        """Возвращает правило, действующее для страницы с указанным URL.
+
+        Args:
+            page_url (str): URL страницы, на которой выполняется запрос.
+
+        Returns:
+            BlockingRule: Общее правило с учетом переопределения для маршрута.
+        """
+        path = urlsplit(page_url).path or "/"
+        for prefix, override in self._overrides:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return self.settings.model_copy(
+                    update=override.model_dump(exclude_unset=True)
+                )
+        return self.settings
+
+    def decide(self, request: Request, page_url: str) -> str | None:
+        """Определяет, нужно ли заблокировать запрос.
+
+        Никогда не блокируется только навигация основного фрейма страницы:
+        навигации во iframe (сторонние виджеты) проверяются по общим правилам.
+        Правило выбирается по URL документа, которому принадлежит запрос: для
+        навигации iframe это документ родительского фрейма, для остальных
+        запросов - фрейм, выполняющий запрос.
+
+        Args:
+            request (Request): Перехваченный запрос.
+            page_url (str): URL страницы; используется, если у запроса нет фрейма
+                (например, у запросов service worker).
+
+        Returns:
+            str | None: Причина блокировки или None, если запрос нужно пропустить.
+        """
+        frame = _request_frame(request)
+        if frame is not None and request.is_navigation_request():
+            if frame.parent_frame is None:
+                return None
+            # URL самого iframe во время навигации еще указывает на прежний документ
+            frame = frame.parent_frame
+
+        rule = self.rule_for(frame.url if frame is not None else page_url)
+        host = urlsplit(request.url).hostname or ""
+        if _domain_matches(host, rule.allow_domains):
+            return None
+        if _domain_matches(host, rule.deny_domains):
+            return "domain"
+        if request.resource_type in rule.resource_types:
+            return f"type:{request.resource_type}"
+        if any(_glob_to_regex(pattern).match(request.url) for pattern in rule.url_patterns):
+            return "pattern"
+        return None
+
+
+def _request_frame(request: Request) -> Frame | None:
+    """Возвращает фрейм запроса или None, если запрос не связан с фреймом."""
+    try:
+        return request.frame
+    except PlaywrightError:
+        return None
+
+
+def _content_length(response: Response) -> int:
+    try:
+        return int(response.headers.get("content-length", 0))
+    except ValueError:
+        return 0
+
+
+def apply_blocking_policy(
+    page: Page, policy: BlockingPolicy | None = None
+) -> RequestStats:
+    """Подключает к странице политику блокировки запросов.
+
+    Блокируются аналитика, трекеры, сторонние виджеты и тяжелые статические
+    ресурсы, которые не нужны тестам и задерживают `networkidle`. Пропущенные
+    запросы передаются дальше по цепочке маршрутов (например, в HAR-архивы).
 
     Args:
         page (Page): Объект страницы Playwright.
+        policy (BlockingPolicy | None): Политика блокировки; по умолчанию
+            берется из `settings.ui.blocking`.
+
+    Returns:
+        RequestStats: Статистика запросов страницы, обновляемая по ходу теста.
     """
-    page.route(
-        "**/*.{ico,png,jpg,webp,mp3,mp4,woff,woff2}", lambda route: route.abort()
-    )
+    policy = policy or BlockingPolicy(settings.ui.blocking)
+    stats = RequestStats()
+    would_block: set[Request] = set()
+
+    def handle(route: Route) -> None:
+        reason = policy.decide(route.request, page.url)
+        if reason is None:
+            route.fallback()
+            return
+
+        stats.blocked[reason] = stats.blocked.get(reason, 0) + 1
+        if policy.settings.dry_run:
+            would_block.add(route.request)
+            route.fallback()
+        else:
+            route.abort("blockedbyclient")
+
+    def on_response(response: Response) -> None:
+        size = _content_length(response)
+        if response.request in would_block:
+            would_block.discard(response.request)
+            stats.blocked_bytes += size
+        else:
+            stats.allowed += 1
+            stats.allowed_bytes += size
+
+    if policy.settings.enabled:
+        page.route("**/*", handle)
+    page.on("response", on_response)
+    return stats
+
+
+# Сводная статистика запросов всех тестов воркера
+blocking_stats = RequestStats()
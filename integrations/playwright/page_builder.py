@@ -1,31 +1,53 @@
+from collections.abc import Callable
+import time
 import typing
 
 import allure
-from playwright.sync_api import Page, Playwright
-from playwright_stealth import Stealth
+from playwright.sync_api import Page
 
 from config import Browser, settings
-from integrations.playwright.mocks import mock_static_resources
+from integrations.allure.artifacts import artifact_pipeline
+from integrations.playwright.context_queue import ContextWarmupQueue
+from integrations.playwright.har import har_router
+from integrations.playwright.mocks import blocking_stats
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
 
 
 def playwright_page_builder(
-    playwright: Playwright,
+    context_queue: ContextWarmupQueue,
     browser_type: Browser,
     test_name: str,
     state: str | None = None,
+    is_failed: Callable[[], bool] = lambda: False,
+    attempt: int = 1,
 ) -> typing.Iterator[Page]:
     """Генератор для создания и настройки страницы Playwright в указанном браузере.
 
-    Функция запускает браузер, заданный через `browser_type`, создает новый контекст с
-    указанием начального состояния (state), записью видео и трассировкой выполнения.
-    После завершения работы браузер закрывается, а трассировка и видео прикрепляются
-    к отчету Allure.
+    Функция берет из очереди заранее подготовленную страницу браузера `browser_type`
+    с указанным начальным состоянием (state), stealth и политикой блокировки запросов. Запись видео
+    и трассировки ведется в соответствии с режимами `settings.reporting.video_recording`
+    и `settings.reporting.trace_recording`. После завершения теста закрывается только
+    контекст, браузер остается в пуле, а сохраненные трассировка и видео передаются
+    фоновому конвейеру вложений Allure. Очередь пополняется для следующего теста
+    синхронно в teardown (фонового прогрева нет): время подготовки страницы
+    переносится из setup следующего теста в teardown текущего.
+    Записи, которые по режиму не нужно сохранять, отбрасываются без упаковки
+    и прикрепления. В зависимости от `settings.ui.har_mode` трафик теста
+    записывается в HAR-архивы или воспроизводится из них; запросы, которых нет
+    в архивах, прикладываются к отчету. Статистика заблокированных и пропущенных
+    запросов теста логируется и добавляется к сводной статистике воркера.
 
     Args:
-        playwright (Playwright): Объект Playwright для управления браузером.
+        context_queue (ContextWarmupQueue): Очередь подготовленных страниц воркера.
         browser_type (Browser): Тип браузера (webkit, chromium, firefox).
         test_name (str): Имя теста, используется для формирования путей файлов.
         state (str | None, optional): Путь к файлу состояния браузера. Defaults to None.
+        is_failed (Callable[[], bool], optional): Функция, сообщающая после теста,
+            упал ли он. Defaults to lambda: False.
+        attempt (int, optional): Номер попытки запуска теста (с учетом перезапусков).
+            Defaults to 1.
 
     Yields:
         Iterator[Page]: Генератор, возвращающий объект страницы Playwright.
@@ -33,33 +55,57 @@ def playwright_page_builder(
     Returns:
         None: Ресурсы управляются внутри генератора.
     """
-    stealth = Stealth()
-    browser = playwright[browser_type].launch(headless=settings.ui.headless)
-    context = browser.new_context(
-        storage_state=state,
-        record_video_dir=settings.ui.videos_path,
-        base_url=settings.get_ui_base_url(),
-        bypass_csp=True,
+    video_mode = settings.reporting.video_recording
+    trace_mode = settings.reporting.trace_recording
+    record_video = video_mode.should_record(attempt)
+    record_trace = trace_mode.should_record(attempt)
+
+    started_at = time.monotonic()
+    queue_was_warm = context_queue.has_prepared(browser_type, state, record_video)
+    context, page, request_stats = context_queue.acquire(browser_type, state, record_video)
+    har_router.attach(context, test_name)
+    if record_trace:
+        context.tracing.start(
+            name=test_name, screenshots=True, snapshots=True, sources=True
+        )
+    context_queue.stats.record(
+        test_name, (time.monotonic() - started_at) * 1000, warm=queue_was_warm
     )
-    context.tracing.start(name=test_name, screenshots=True, snapshots=True, sources=True)
-    stealth.apply_stealth_sync(context)
-    page = context.new_page()
-    mock_static_resources(page)
-    page.mouse.move(10, 10)
-    page.wait_for_timeout(1000)
 
     yield page
 
-    context.tracing.stop(path=settings.ui.tracing_path / f"{test_name}.zip")
-    browser.close()
+    failed = is_failed()
+    trace_path = settings.ui.tracing_path / f"{test_name}.zip"
+    retain_trace = record_trace and trace_mode.should_retain(failed)
+    retain_video = record_video and video_mode.should_retain(failed)
 
-    allure.attach.file(
-        source=settings.ui.tracing_path / f"{test_name}.zip",
-        name="trace",
-        extension="zip",
-    )
-    allure.attach.file(
-        source=page.video.path(),
-        name="video",
-        attachment_type=allure.attachment_type.WEBM,
-    )
+    if record_trace:
+        # Без пути трассировка останавливается без упаковки в zip
+        context.tracing.stop(path=trace_path if retain_trace else None)
+    context.close()
+    context_queue.refill(browser_type, state, record_video)
+
+    logger.debug(f"Запросы теста '{test_name}': {request_stats.summary()}")
+    blocking_stats.merge(request_stats)
+
+    misses = har_router.pop_misses(test_name)
+    if misses:
+        logger.warning(f"Запросы теста '{test_name}' не найдены в HAR-архивах: {len(misses)}")
+        artifact_pipeline.attach_bytes(
+            "\n".join(misses).encode(),
+            name="har_misses",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+    if retain_trace:
+        artifact_pipeline.attach_file(source=trace_path, name="trace", extension="zip")
+
+    if page.video:
+        if retain_video:
+            artifact_pipeline.attach_file(
+                source=page.video.path(),
+                name="video",
+                attachment_type=allure.attachment_type.WEBM,
+            )
+        else:
+            page.video.delete()
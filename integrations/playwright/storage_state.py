@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+
+from config import Browser, Environment
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Время, после которого файл блокировки считается брошенным (упавшим воркером)
+STALE_LOCK_SECONDS = 300
+
+_LOCK_POLL_SECONDS = 0.2
+
+
+@contextmanager
+def file_lock(lock_path: Path, timeout: float = STALE_LOCK_SECONDS) -> Iterator[None]:
+    """Межпроцессная блокировка на основе атомарного создания файла.
+
+    Файл блокировки создается с флагом `O_EXCL`, что работает одинаково на всех
+    платформах. Блокировка, которую держат дольше `STALE_LOCK_SECONDS`, считается
+    брошенной и снимается.
+
+    Args:
+        lock_path (Path): Путь к файлу блокировки.
+        timeout (float): Максимальное время ожидания блокировки в секундах.
+
+    Raises:
+        TimeoutError: Если блокировку не удалось получить за `timeout`.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > STALE_LOCK_SECONDS:
+                    logger.warning(f"Снята брошенная блокировка {lock_path}")
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Не удалось получить блокировку {lock_path}")
+            time.sleep(_LOCK_POLL_SECONDS)
+
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+class StorageStateCache:
+    """Кеш файлов состояния браузера с ограниченным временем жизни.
+
+    Состояние хранится отдельно для каждого сочетания (браузер, окружение, URL
+    приложения). Рядом с файлом состояния хранится файл метаданных с моментом
+    создания и произвольными данными, сопровождающими состояние (например,
+    признаками согласия на cookies).
+
+    Построение состояния защищено файловой блокировкой: при параллельном запуске
+    состояние строит ровно один воркер, а остальные дожидаются его и переиспользуют
+    результат. Пока состояние не устарело, повторные сессии не строят его заново.
+
+    Attributes:
+        cache_dir (Path): Каталог кеша состояний.
+        ttl (int): Время жизни состояния в секундах; 0 отключает переиспользование.
+        environment (Environment): Окружение, для которого строятся состояния.
+        app_url (str): URL приложения, для которого строятся состояния.
+    """
+
+    def __init__(
+        self, cache_dir: Path, ttl: int, environment: Environment, app_url: str
+    ) -> None:
+        """Инициализирует кеш состояний браузера.
+
+        Args:
+            cache_dir (Path): Каталог кеша состояний.
+            ttl (int): Время жизни состояния в секундах.
+            environment (Environment): Окружение, для которого строятся состояния.
+            app_url (str): URL приложения, для которого строятся состояния.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.environment = environment
+        self.app_url = app_url
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def state_path(self, browser_type: Browser) -> Path:
+        """Возвращает путь к файлу состояния для указанного браузера.
+
+        Args:
+            browser_type (Browser): Тип браузера.
+
+        Returns:
+            Path: Путь к файлу состояния в каталоге кеша.
+        """
+        browser = Browser(browser_type).value
+        environment = Environment(self.environment).value
+        digest = hashlib.sha1(
+            f"{browser}|{environment}|{self.app_url}".encode()
+        ).hexdigest()[:10]
+        return self.cache_dir / f"{browser}_{environment}_{digest}.json"
+
+    @staticmethod
+    def _meta_path(state_path: Path) -> Path:
+        return state_path.with_suffix(".meta.json")
+
+    def _load_fresh_meta(self, state_path: Path) -> dict | None:
+        """Возвращает метаданные состояния, если оно существует и не устарело."""
+        meta_path = self._meta_path(state_path)
+        if self.ttl <= 0 or not state_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("created_at", 0) >= self.ttl:
+            return None
+        return meta
+
+    def get_or_create(
+        self, browser_type: Browser, build: Callable[[Path], dict | None]
+    ) -> tuple[Path, dict]:
+        """Возвращает актуальное состояние браузера, при необходимости строя его.
+
+        Если `build` возвращает None, построенное состояние используется текущей
+        сессией, но не кешируется: следующая сессия построит его заново.
+
+        Args:
+            browser_type (Browser): Тип браузера.
+            build (Callable[[Path], dict | None]): Функция, сохраняющая состояние
+                браузера по переданному пути и возвращающая сопровождающие его данные
+                или None, если состояние неполное.
+
+        Returns:
+            tuple[Path, dict]: Путь к файлу состояния и сопровождающие его данные.
+        """
+        browser = Browser(browser_type).value
+        state_path = self.state_path(browser_type)
+        meta = self._load_fresh_meta(state_path)
+        if meta is not None:
+            logger.info(f"Состояние {browser} взято из кеша: {state_path}")
+            return state_path, meta.get("data", {})
+
+        with file_lock(state_path.with_suffix(".lock")):
+            # Пока ждали блокировку, состояние мог построить другой воркер
+            meta = self._load_fresh_meta(state_path)
+            if meta is not None:
+                logger.info(f"Состояние {browser} построено другим воркером")
+                return state_path, meta.get("data", {})
+
+            logger.info(f"Построение состояния {browser}: {state_path}")
+            tmp_path = state_path.with_suffix(f".{os.getpid()}.tmp")
+            data = build(tmp_path)
+            os.replace(tmp_path, state_path)
+            if data is None:
+                self._meta_path(state_path).unlink(missing_ok=True)
+                return state_path, {}
+
+            meta = {"created_at": time.time(), "data": data}
+            tmp_meta_path = self._meta_path(tmp_path)
+            tmp_meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_meta_path, self._meta_path(state_path))
+
+        return state_path, data
@@ -1,30 +1,74 @@
-from playwright.sync_api import Page, Request, Route
+from functools import lru_cache
+from pathlib import Path
 
+from playwright.sync_api import BrowserContext, Page
 
-def add_coverage_script(page: Page):
-    """Динамически добавляет скрипт UI Coverage в html."""
+from config import settings
+from src.utils.logger import get_logger
 
-    def inject_coverage_script(route: Route, request: Request):
-        if not request.resource_type == "document":
-            route.continue_()
-            return
+logger = get_logger(__name__.upper())
 
-        response = route.fetch()
+# Вендорная копия агента, хранящаяся в репозитории
+VENDORED_AGENT_FILE = Path(__file__).parent / "vendor" / "ui-coverage-agent.global.js"
 
-        content_type = response.headers.get("content-type", "")
-        if "text/html" not in content_type:
-            route.continue_()
-            return
+# Агент запускается только в документе верхнего уровня и только после
+# построения DOM, как при подключении скрипта перед </body>
+_AGENT_WRAPPER_JS = """
+(() => {{
+  if (window !== window.top || window.__uiCoverageAgent) return;
+  window.__uiCoverageAgent = true;
+  const run = () => {{
+{agent}
+  }};
+  if (document.readyState === "loading") {{
+    document.addEventListener("DOMContentLoaded", run, {{ once: true }});
+  }} else {{
+    run();
+  }}
+}})();
+"""
 
-        html_content = response.text()
-        modified_html_content = html_content.replace(
-            "</body>",
-            "<script src='https://nikita-filonov.github.io/ui-coverage-report/agent.global.js'></script></body>",
-        )
-        route.fulfill(
-            status=response.status,
-            headers=response.headers,
-            body=modified_html_content.encode("utf-8"),
-            content_type="text/html",
+
+@lru_cache(maxsize=1)
+def load_agent_script(agent_file: Path | None = None) -> str:
+    """Возвращает init script с агентом UI Coverage.
+
+    Агент берется из зафиксированной копии в репозитории
+    (`settings.ui.coverage_agent_file`, по умолчанию `VENDORED_AGENT_FILE`) и во время
+    прогона не скачивается, поэтому покрытие собирается и без доступа к сети.
+    Копия обновляется явно скриптом `scripts/update_coverage_agent.py`. Результат
+    кешируется в памяти процесса, поэтому файл читается не чаще одного раза на воркер.
+
+    Args:
+        agent_file (Path | None): Путь к копии агента. По умолчанию
+            `settings.ui.coverage_agent_file`.
+
+    Returns:
+        str: Текст init script.
+
+    Raises:
+        RuntimeError: Если файла агента нет.
+    """
+    agent_file = agent_file or settings.ui.coverage_agent_file
+    if not agent_file.exists():
+        raise RuntimeError(
+            f"Агент UI Coverage не найден: {agent_file}. Обновите копию агента командой "
+            "`python -m scripts.update_coverage_agent` или отключите UI__COVERAGE_AGENT"
         )
-        page.route("**/*", inject_coverage_script)
+
+    return _AGENT_WRAPPER_JS.format(agent=agent_file.read_text(encoding="utf-8"))
+
+
+def add_coverage_script(target: Page | BrowserContext) -> None:
+    """Добавляет агент UI Coverage на все страницы через init script.
+
+    Документы не перехватываются и не перезапрашиваются: браузер выполняет
+    агент сам при каждой навигации, после построения DOM.
+
+    Args:
+        target (Page | BrowserContext): Страница или контекст браузера.
+
+    Raises:
+        RuntimeError: Если агент недоступен.
+    """
+    target.add_init_script(load_agent_script())
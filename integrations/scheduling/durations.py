@@ -0,0 +1,164 @@
+import json
+import os
+from pathlib import Path
+import statistics
+import time
+
+from pydantic import BaseModel, Field
+
+from config import Browser
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Оценка длительности теста, если истории нет ни для одного теста
+DEFAULT_DURATION_SECONDS = 5.0
+
+# Вес нового замера при сглаживании истории
+SMOOTHING = 0.5
+
+_BROWSERS = {browser.value for browser in Browser}
+
+
+def browser_of(nodeid: str) -> str | None:
+    """Возвращает браузер из параметров теста (например, `test_x[chromium]`).
+
+    Args:
+        nodeid (str): Идентификатор теста pytest.
+
+    Returns:
+        str | None: Имя браузера или None, если тест не параметризован браузером.
+    """
+    if not nodeid.endswith("]") or "[" not in nodeid:
+        return None
+    params = nodeid[nodeid.index("[") + 1 : -1].split("-")
+    return next((param for param in params if param in _BROWSERS), None)
+
+
+class DurationRecord(BaseModel):
+    """Сглаженная длительность теста.
+
+    Attributes:
+        seconds (float): Сглаженная длительность теста (setup + call + teardown).
+        runs (int): Количество учтенных прогонов.
+        updated_at (float): Время последнего замера (Unix time).
+    """
+
+    seconds: float
+    runs: int = 1
+    updated_at: float = Field(default_factory=time.time)
+
+
+class DurationHistory(BaseModel):
+    """Содержимое файла истории длительностей."""
+
+    tests: dict[str, DurationRecord] = Field(default={})
+
+
+class DurationStore:
+    """Хранилище исторических длительностей тестов.
+
+    Длительности хранятся по nodeid теста, в который входит параметр браузера,
+    поэтому прогоны одного теста в разных браузерах учитываются раздельно.
+    Записи старше `max_age_days` считаются устаревшими и не используются.
+    Для тестов без истории длительность оценивается медианой известных
+    длительностей тестов того же браузера, затем всех тестов, а без истории
+    совсем - `DEFAULT_DURATION_SECONDS`.
+
+    Attributes:
+        path (Path): Путь к JSON-файлу истории.
+        max_age_days (int): Срок актуальности записи в днях.
+    """
+
+    def __init__(self, path: Path, max_age_days: int = 30) -> None:
+        """Инициализирует хранилище и загружает историю из файла.
+
+        Args:
+            path (Path): Путь к JSON-файлу истории.
+            max_age_days (int): Срок актуальности записи в днях.
+        """
+        self.path = Path(path)
+        self.max_age_days = max_age_days
+        self.history = self._load()
+        self._fallbacks: dict[str | None, float] | None = None
+
+    def _load(self) -> DurationHistory:
+        if not self.path.exists():
+            logger.info(f"История длительностей тестов не найдена: {self.path}")
+            return DurationHistory()
+        try:
+            return DurationHistory.model_validate_json(self.path.read_text(encoding="utf-8"))
+        except ValueError as error:
+            logger.warning(
+                f"История длительностей {self.path} повреждена и не используется: {error}"
+            )
+            return DurationHistory()
+
+    def _is_fresh(self, record: DurationRecord) -> bool:
+        return time.time() - record.updated_at < self.max_age_days * 24 * 3600
+
+    def _fallback(self, browser: str | None) -> float:
+        if self._fallbacks is None:
+            by_browser: dict[str | None, list[float]] = {}
+            for nodeid, record in self.history.tests.items():
+                if self._is_fresh(record):
+                    by_browser.setdefault(browser_of(nodeid), []).append(record.seconds)
+            everything = [seconds for values in by_browser.values() for seconds in values]
+            self._fallbacks = {key: statistics.median(values) for key, values in by_browser.items()}
+            self._fallbacks["*"] = (
+                statistics.median(everything) if everything else DEFAULT_DURATION_SECONDS
+            )
+        return self._fallbacks.get(browser, self._fallbacks["*"])
+
+    def predict(self, nodeid: str) -> float:
+        """Возвращает ожидаемую длительность теста в секундах.
+
+        Args:
+            nodeid (str): Идентификатор теста pytest.
+
+        Returns:
+            float: Длительность по истории или оценка, если истории нет или она устарела.
+        """
+        record = self.history.tests.get(nodeid)
+        if record is not None and self._is_fresh(record):
+            return record.seconds
+        return self._fallback(browser_of(nodeid))
+
+    def known(self, nodeids: list[str]) -> int:
+        """Возвращает количество тестов с актуальной историей."""
+        return sum(
+            1
+            for nodeid in nodeids
+            if nodeid in self.history.tests and self._is_fresh(self.history.tests[nodeid])
+        )
+
+    def update(self, durations: dict[str, float]) -> None:
+        """Учитывает длительности тестов текущего прогона.
+
+        Args:
+            durations (dict[str, float]): Длительности по nodeid в секундах.
+        """
+        for nodeid, seconds in durations.items():
+            record = self.history.tests.get(nodeid)
+            if record is None or not self._is_fresh(record):
+                self.history.tests[nodeid] = DurationRecord(seconds=seconds)
+            else:
+                self.history.tests[nodeid] = DurationRecord(
+                    seconds=record.seconds * (1 - SMOOTHING) + seconds * SMOOTHING,
+                    runs=record.runs + 1,
+                )
+        self._fallbacks = None
+
+    def save(self) -> None:
+        """Сохраняет историю в файл, отбрасывая устаревшие записи."""
+        self.history.tests = {
+            nodeid: record
+            for nodeid, record in sorted(self.history.tests.items())
+            if self._is_fresh(record)
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(self.history.model_dump(), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,141 @@
+r"""Объединение результатов шардов прогона (`--shard=i/n`).
+
+Пример:
+    python -m integrations.scheduling.merge \
+        --allure shards/*/allure-results --allure-output allure-results \
+        --coverage shards/*/coverage-results --coverage-output coverage-results \
+        --durations shards/*/.test_durations.json --durations-output .test_durations.json
+"""
+
+import argparse
+from pathlib import Path
+import shutil
+
+from integrations.coverage.tracker import SHARD_SUFFIX
+from integrations.scheduling.durations import DurationHistory, DurationStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Файлы Allure, общие для всего прогона, а не для отдельных тестов
+_ALLURE_SHARED_FILES = ("environment.properties", "categories.json", "executor.json")
+
+
+def _copy_unique(sources: list[Path], target: Path, pattern: str = "*") -> int:
+    """Копирует файлы из каталогов-источников, не перезаписывая совпадающие по имени."""
+    target.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for source in sources:
+        for file in source.glob(pattern):
+            if not file.is_file() or file.name in _ALLURE_SHARED_FILES:
+                continue
+            destination = target / file.name
+            if destination.exists():
+                logger.warning(f"Файл {file.name} уже есть в {target}, пропущен")
+                continue
+            shutil.copy2(file, destination)
+            copied += 1
+    return copied
+
+
+def merge_allure_results(sources: list[Path], target: Path) -> int:
+    """Объединяет результаты Allure нескольких шардов в один каталог.
+
+    Результаты, контейнеры и вложения Allure имеют уникальные имена (UUID)
+    и копируются как есть. Свойства окружения объединяются построчно.
+
+    Args:
+        sources (list[Path]): Каталоги результатов Allure шардов.
+        target (Path): Каталог объединенных результатов.
+
+    Returns:
+        int: Количество скопированных файлов.
+    """
+    copied = _copy_unique(sources, target)
+
+    properties: dict[str, str] = {}
+    for source in sources:
+        environment = source / "environment.properties"
+        if environment.exists():
+            for line in environment.read_text(encoding="utf-8").splitlines():
+                key, _, value = line.partition("=")
+                properties.setdefault(key.strip(), value.strip())
+    if properties:
+        (target / "environment.properties").write_text(
+            "\n".join(f"{key}={value}" for key, value in properties.items()), encoding="utf-8"
+        )
+
+    for name in ("categories.json", "executor.json"):
+        shared = next((source / name for source in sources if (source / name).exists()), None)
+        if shared is not None:
+            shutil.copy2(shared, target / name)
+
+    logger.info(f"Результаты Allure {len(sources)} шардов объединены в {target}: {copied} файлов")
+    return copied
+
+
+def merge_coverage_results(sources: list[Path], target: Path) -> int:
+    """Объединяет результаты UI Coverage нескольких шардов в один каталог.
+
+    Args:
+        sources (list[Path]): Каталоги результатов покрытия шардов.
+        target (Path): Каталог объединенных результатов (`results_dir` ui-coverage-tool).
+            Файлы-шарды воркеров (`*.sqlite`) и файлы стандартного трекера копируются как есть.
+
+    Returns:
+        int: Количество скопированных файлов.
+    """
+    copied = _copy_unique(sources, target, pattern="*.json")
+    copied += _copy_unique(sources, target, pattern=f"*{SHARD_SUFFIX}")
+    logger.info(f"Результаты покрытия {len(sources)} шардов объединены в {target}: {copied} файлов")
+    return copied
+
+
+def merge_duration_histories(sources: list[Path], target: Path) -> int:
+    """Объединяет истории длительностей шардов, оставляя самые свежие записи.
+
+    Args:
+        sources (list[Path]): Файлы истории длительностей шардов.
+        target (Path): Файл объединенной истории.
+
+    Returns:
+        int: Количество тестов в объединенной истории.
+    """
+    store = DurationStore(target)
+    for source in sources:
+        history = DurationHistory.model_validate_json(source.read_text(encoding="utf-8"))
+        for nodeid, record in history.tests.items():
+            current = store.history.tests.get(nodeid)
+            if current is None or record.updated_at > current.updated_at:
+                store.history.tests[nodeid] = record
+    store.save()
+
+    logger.info(f"Истории длительностей {len(sources)} шардов объединены в {target}")
+    return len(store.history.tests)
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и объединяет результаты шардов."""
+    parser = argparse.ArgumentParser(description="Объединение результатов шардов прогона")
+    parser.add_argument("--allure", type=Path, nargs="*", default=[], help="Каталоги Allure шардов")
+    parser.add_argument("--allure-output", type=Path, default=Path("allure-results"))
+    parser.add_argument(
+        "--coverage", type=Path, nargs="*", default=[], help="Каталоги UI Coverage шардов"
+    )
+    parser.add_argument("--coverage-output", type=Path, default=Path("coverage-results"))
+    parser.add_argument(
+        "--durations", type=Path, nargs="*", default=[], help="Истории длительностей шардов"
+    )
+    parser.add_argument("--durations-output", type=Path, default=Path(".test_durations.json"))
+    args = parser.parse_args()
+
+    if args.allure:
+        merge_allure_results(args.allure, args.allure_output)
+    if args.coverage:
+        merge_coverage_results(args.coverage, args.coverage_output)
+    if args.durations:
+        merge_duration_histories(args.durations, args.durations_output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""Плагин pytest для распределения тестов по воркерам xdist с учетом длительности.
+
+Включается флагом `--duration-scheduling`. По истории длительностей тестов
+(`--durations-file`) тесты распределяются по воркерам заранее: воркеры делятся
+между браузерами пропорционально суммарной длительности их тестов, а внутри
+браузера тесты раскладываются от самых долгих к коротким (LPT). Так тесты одного
+браузера выполняются на одних и тех же воркерах и переиспользуют браузеры пула.
+Воркер, закончивший свой план, забирает самые короткие оставшиеся тесты
+у наиболее загруженного воркера, предпочитая тесты своего браузера.
+
+Параметр `--shard=i/n` оставляет в прогоне только i-й из n шардов, на которые
+тесты детерминированно делятся по той же истории, чтобы разнести набор по
+нескольким машинам CI. Результаты шардов объединяются командой
+`python -m integrations.scheduling.merge`.
+
+По завершении прогона длительности сохраняются в историю, а в итоговом отчете
+выводятся прогнозируемое и фактическое время самого загруженного воркера (makespan).
+"""
+
+from collections import deque
+from pathlib import Path
+import time
+from typing import NamedTuple
+
+import pytest
+
+from integrations.scheduling.durations import DurationStore, browser_of
+from integrations.scheduling.sharding import parse_shard, split_into_shards
+from src.utils.logger import get_logger
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist не установлен
+    LoadScheduling = object
+
+logger = get_logger(__name__.upper())
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+
+# Номер шарда, количество шардов и прогнозируемая длительность выбранного шарда
+_shard_key = pytest.StashKey[tuple[int, int, float]]()
+
+
+class SchedulePlan(NamedTuple):
+    """План распределения тестов по воркерам.
+
+    Attributes:
+        assignments (list[list[int]]): Индексы тестов каждого воркера в порядке запуска.
+        loads (list[float]): Прогнозируемая загрузка каждого воркера в секундах.
+    """
+
+    assignments: list[list[int]]
+    loads: list[float]
+
+    @property
+    def makespan(self) -> float:
+        """Прогнозируемое время работы самого загруженного воркера."""
+        return max(self.loads, default=0.0)
+
+
+def plan_schedule(predicted: list[float], nodeids: list[str], workers: int) -> SchedulePlan:
+    """Распределяет тесты по воркерам с учетом их длительности и браузера.
+
+    Args:
+        predicted (list[float]): Ожидаемые длительности тестов в секундах.
+        nodeids (list[str]): Идентификаторы тестов в порядке сбора.
+        workers (int): Количество воркеров.
+
+    Returns:
+        SchedulePlan: План распределения.
+    """
+    assignments: list[list[int]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+
+    def assign(indices: list[int], worker_ids: list[int]) -> None:
+        for index in sorted(indices, key=predicted.__getitem__, reverse=True):
+            worker = min(worker_ids, key=loads.__getitem__)
+            assignments[worker].append(index)
+            loads[worker] += predicted[index]
+
+    groups: dict[str | None, list[int]] = {}
+    for index, nodeid in enumerate(nodeids):
+        groups.setdefault(browser_of(nodeid), []).append(index)
+
+    browser_groups = {browser: indices for browser, indices in groups.items() if browser}
+    totals = {
+        browser: sum(predicted[index] for index in indices)
+        for browser, indices in browser_groups.items()
+    }
+    if browser_groups and workers >= len(browser_groups):
+        # Воркеры делятся между браузерами пропорционально суммарной длительности тестов
+        shares = dict.fromkeys(totals, 1)
+        for _ in range(workers - len(totals)):
+            browser = max(totals, key=lambda key: totals[key] / shares[key])
+            shares[browser] += 1
+
+        worker_ids = iter(range(workers))
+        for browser, share in shares.items():
+            assign(browser_groups[browser], [next(worker_ids) for _ in range(share)])
+    else:
+        # Воркеров меньше, чем браузеров: браузер целиком достается одному воркеру
+        for browser in sorted(totals, key=totals.__getitem__, reverse=True):
+            worker = min(range(workers), key=loads.__getitem__)
+            assignments[worker].extend(browser_groups[browser])
+            loads[worker] += totals[browser]
+
+    assign(groups.get(None, []), list(range(workers)))
+
+    for worker_assignments in assignments:
+        worker_assignments.sort(key=predicted.__getitem__, reverse=True)
+    return SchedulePlan(assignments=assignments, loads=loads)
+
+
+class DurationScheduling(LoadScheduling):
+    """Планировщик xdist, распределяющий тесты по заранее составленному плану.
+
+    Каждому воркеру поддерживается не более двух отправленных тестов, чтобы
+    оставшиеся тесты можно было перераспределить между освободившимися воркерами.
+
+    Attributes:
+        store (DurationStore): История длительностей тестов.
+        plan (SchedulePlan | None): Составленный план распределения.
+    """
+
+    def __init__(self, config: pytest.Config, log, store: DurationStore) -> None:
+        """Инициализирует планировщик.
+
+        Args:
+            config (pytest.Config): Конфигурация pytest.
+            log: Логгер xdist.
+            store (DurationStore): История длительностей тестов.
+        """
+        super().__init__(config, log)
+        self.store = store
+        self.plan: SchedulePlan | None = None
+        self._predicted: list[float] = []
+        self._node2plan: dict = {}
+        self._node2browser: dict = {}
+        self._requeued: deque[int] = deque()
+
+    def schedule(self) -> None:
+        """Составляет план распределения и отправляет воркерам первые тесты."""
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+
+        self._predicted = [self.store.predict(nodeid) for nodeid in self.collection]
+        self.plan = plan_schedule(self._predicted, self.collection, len(self.nodes))
+        for node, assignments in zip(self.nodes, self.plan.assignments):
+            self._node2plan[node] = deque(assignments)
+            if assignments:
+                self._node2browser[node] = browser_of(self.collection[assignments[0]])
+
+        logger.info(
+            f"План по длительностям: тестов {len(self.collection)} "
+            f"(с историей: {self.store.known(self.collection)}), воркеров {len(self.nodes)}, "
+            f"прогноз makespan {self.plan.makespan:.1f} с"
+        )
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def _steal(self, node) -> int | None:
+        """Забирает самый короткий тест у воркера с наибольшей оставшейся загрузкой."""
+        donors = [plan for plan in self._node2plan.values() if plan]
+        if not donors:
+            return None
+
+        donor = max(donors, key=lambda plan: sum(self._predicted[index] for index in plan))
+        browser = self._node2browser.get(node)
+        for index in reversed(donor):
+            if browser_of(self.collection[index]) == browser:
+                donor.remove(index)
+                return index
+        return donor.pop()
+
+    def _next_for(self, node) -> int | None:
+        if self._requeued:
+            return self._requeued.popleft()
+
+        plan = self._node2plan.get(node)
+        if plan:
+            return plan.popleft()
+        return self._steal(node)
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """Досылает воркеру тесты из его плана или чужих планов.
+
+        Args:
+            node: Воркер xdist.
+            duration (float): Длительность последнего теста воркера (не используется).
+        """
+        if node.shutting_down or self.collection is None:
+            return
+
+        node_pending = self.node2pending[node]
+        to_send = []
+        while len(node_pending) + len(to_send) < 2:
+            index = self._next_for(node)
+            if index is None:
+                break
+            to_send.append(index)
+
+        if to_send:
+            for index in to_send:
+                self.pending.remove(index)
+            node_pending.extend(to_send)
+            node.send_runtest_some(to_send)
+        elif not self.pending:
+            node.shutdown()
+
+    def mark_test_pending(self, item: str) -> None:
+        """Возвращает тест в очередь для повторного запуска."""
+        assert self.collection is not None
+        index = self.collection.index(item)
+        self.pending.insert(0, index)
+        self._requeued.appendleft(index)
+        for node in self.node2pending:
+            self.check_schedule(node)
+
+    def remove_node(self, node) -> str | None:
+        """Удаляет воркер, возвращая его неотправленные и невыполненные тесты в очередь.
+
+        Returns:
+            str | None: Тест, во время которого упал воркер, или None.
+        """
+        pending = self.node2pending.pop(node)
+        self._requeued.extend(self._node2plan.pop(node, ()))
+        crashitem = None
+        if pending:
+            assert self.collection is not None
+            crashitem = self.collection[pending.pop(0)]
+            self.pending.extend(pending)
+            self._requeued.extend(pending)
+
+        for other in self.node2pending:
+            self.check_schedule(other)
+        return crashitem
+
+
+class DurationSchedulingPlugin:
+    """Плагин сбора длительностей тестов и планирования по ним.
+
+    Attributes:
+        store (DurationStore): История длительностей тестов.
+        schedule (bool): Подменять ли планировщик xdist.
+        scheduler (DurationScheduling | None): Планировщик xdist, если прогон распределенный.
+    """
+
+    def __init__(self, store: DurationStore, schedule: bool) -> None:
+        """Инициализирует плагин.
+
+        Args:
+            store (DurationStore): История длительностей тестов.
+            schedule (bool): Подменять ли планировщик xdist (`--duration-scheduling`);
+                без него плагин только собирает длительности для шардирования.
+        """
+        self.store = store
+        self.schedule = schedule
+        self.scheduler: DurationScheduling | None = None
+        self._durations: dict[str, float] = {}
+        self._worker_loads: dict[str, float] = {}
+        self._started_at = time.monotonic()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(
+        self, config: pytest.Config, log
+    ) -> DurationScheduling | None:
+        """Подменяет планировщик xdist планировщиком по длительностям."""
+        if not self.schedule:
+            return None
+        self.scheduler = DurationScheduling(config, log, self.store)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Суммирует длительности фаз каждого теста и загрузку воркеров.
+
+        При перезапусках (pytest-rerunfailures) каждая попытка начинается с фазы
+        `setup`, поэтому в историю попадает длительность только последней попытки,
+        а в загрузку воркера - время всех попыток.
+        """
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "master"
+        previous = 0.0 if report.when == "setup" else self._durations.get(report.nodeid, 0.0)
+        self._durations[report.nodeid] = previous + report.duration
+        self._worker_loads[worker] = self._worker_loads.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        """Сохраняет длительности тестов текущего прогона в историю."""
+        if not self._durations:
+            return
+        self.store.update(self._durations)
+        self.store.save()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """Выводит прогнозируемый и фактический makespan прогона."""
+        if not self._worker_loads:
+            return
+
+        actual = max(self._worker_loads.values())
+        wall = time.monotonic() - self._started_at
+        terminalreporter.section("duration scheduling")
+        shard = terminalreporter.config.stash.get(_shard_key, None)
+        if shard is not None:
+            index, count, shard_load = shard
+            terminalreporter.write_line(
+                f"Шард {index}/{count}: прогноз {shard_load:.1f} с, "
+                f"фактически {sum(self._worker_loads.values()):.1f} с"
+            )
+        if self.scheduler is not None and self.scheduler.plan is not None:
+            predicted = self.scheduler.plan.makespan
+            terminalreporter.write_line(
+                f"Прогноз makespan: {predicted:.1f} с, фактически: {actual:.1f} с "
+                f"(отклонение {actual - predicted:+.1f} с), время сессии: {wall:.1f} с"
+            )
+        else:
+            terminalreporter.write_line(
+                f"Длительность тестов: {actual:.1f} с (без xdist прогноз не составляется)"
+            )
+        terminalreporter.write_line(f"История длительностей сохранена в {self.store.path}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Добавляет параметры планирования по длительностям."""
+    group = parser.getgroup("duration-scheduling", "Планирование тестов по длительности")
+    group.addoption(
+        "--duration-scheduling",
+        action="store_true",
+        default=False,
+        help="Распределять тесты по воркерам xdist по истории их длительностей",
+    )
+    group.addoption(
+        "--shard",
+        default=None,
+        help="Запустить i-й из n шардов, сбалансированных по длительности (формат i/n)",
+    )
+    group.addoption(
+        "--durations-file",
+        default=DEFAULT_DURATIONS_FILE,
+        help="Файл истории длительностей тестов",
+    )
+    group.addoption(
+        "--durations-max-age",
+        type=int,
+        default=30,
+        help="Срок актуальности записей истории длительностей в днях",
+    )
+
+
+def _durations_store(config: pytest.Config) -> DurationStore:
+    return DurationStore(
+        Path(config.getoption("durations_file")),
+        max_age_days=config.getoption("durations_max_age"),
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Регистрирует плагин в основном процессе, если включено планирование или шардирование."""
+    shard = config.getoption("shard")
+    if shard is not None:
+        try:
+            parse_shard(shard)
+        except ValueError as error:
+            raise pytest.UsageError(str(error)) from None
+
+    schedule = config.getoption("duration_scheduling")
+    if not (schedule or shard) or hasattr(config, "workerinput"):
+        return
+
+    config.pluginmanager.register(
+        DurationSchedulingPlugin(_durations_store(config), schedule=schedule),
+        "duration_scheduling_plugin",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Оставляет в прогоне только тесты шарда, заданного параметром `--shard`.
+
+    Выполняется после отбора тестов по маркерам и ключевым словам, чтобы шарды
+    делили именно те тесты, которые будут запущены.
+    """
+    shard = config.getoption("shard")
+    if shard is None or not items:
+        return
+
+    index, count = parse_shard(shard)
+    shards, loads = split_into_shards(
+        [item.nodeid for item in items], _durations_store(config), count
+    )
+    selected_ids = set(shards[index - 1])
+    selected = [item for item in items if item.nodeid in selected_ids]
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+
+    config.stash[_shard_key] = (index, count, loads[index - 1])
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    logger.info(
+        f"Шард {index}/{count}: тестов {len(selected)} из {len(items) + len(deselected)}, "
+        f"прогноз {loads[index - 1]:.1f} с (нагрузка шардов: "
+        f"{', '.join(f'{load:.0f}' for load in loads)} с)"
+    )
@@ -0,0 +1,54 @@
+from integrations.scheduling.durations import DurationStore
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Разбирает номер шарда в формате `i/n` (нумерация с 1).
+
+    Args:
+        value (str): Значение параметра `--shard`, например "2/4".
+
+    Returns:
+        tuple[int, int]: Номер шарда и количество шардов.
+
+    Raises:
+        ValueError: Если значение имеет неверный формат.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(
+            f"Неверный формат шарда '{value}', ожидается i/n, например 1/4"
+        ) from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Неверный номер шарда '{value}': i должен быть от 1 до n")
+    return index, count
+
+
+def split_into_shards(
+    nodeids: list[str], store: DurationStore, count: int
+) -> tuple[list[list[str]], list[float]]:
+    """Делит тесты на шарды с близкой суммарной длительностью.
+
+    Тесты раскладываются от самых долгих к коротким в наименее загруженный шард
+    (LPT). Порядок не зависит от порядка сбора: при равных длительностях тесты
+    упорядочиваются по nodeid, а при равной загрузке выбирается шард с меньшим
+    номером, поэтому все машины с одной историей получают одинаковое разбиение.
+
+    Args:
+        nodeids (list[str]): Идентификаторы тестов.
+        store (DurationStore): История длительностей тестов.
+        count (int): Количество шардов.
+
+    Returns:
+        tuple[list[list[str]], list[float]]: Тесты каждого шарда и их прогнозируемая
+            суммарная длительность в секундах.
+    """
+    shards: list[list[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    predicted = {nodeid: store.predict(nodeid) for nodeid in nodeids}
+
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-predicted[nodeid], nodeid)):
+        shard = min(range(count), key=lambda index: (loads[index], index))
+        shards[shard].append(nodeid)
+        loads[shard] += predicted[nodeid]
+    return shards, loads
@@ -0,0 +1,13 @@
+"""Локальный двойник сайта cism-ms.ru для прогонов без доступа к сайту.
+
+Двойник не воспроизводит реальный сайт: страницы генерируются шаблонами
+`pages.py` по той структуре, на которую опираются локаторы `src/ui/locators`,
+а вакансии берутся из синтетического набора данных `dataset.py`. Это не снимок
+реальной разметки, поэтому тест, прошедший на двойнике, подтверждает только
+работу фреймворка и согласованность локаторов с шаблонами, но ничего не говорит
+о том, совпадают ли они с текущим DOM сайта. Двойник предназначен для отладки
+инфраструктуры и замеров производительности; регрессионные прогоны выполняются
+на сайте из `settings.ui.app_url`.
+"""
+
+from .server import StandinServer  # noqa
@@ -0,0 +1,39 @@
+"""Запуск локального двойника сайта из командной строки.
+
+Пример:
+    python -m integrations.standin --port 8000 --latency 50 --vacancies 100
+"""
+
+import argparse
+from pathlib import Path
+
+from integrations.standin.server import StandinServer
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и запускает сервер."""
+    parser = argparse.ArgumentParser(description="Локальный двойник сайта cism-ms.ru")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес сервера")
+    parser.add_argument("--port", type=int, default=8000, help="Порт сервера")
+    parser.add_argument(
+        "--latency", type=int, default=0, help="Задержка каждого ответа в мс"
+    )
+    parser.add_argument(
+        "--vacancies", type=int, default=24, help="Количество вакансий в наборе"
+    )
+    parser.add_argument(
+        "--dataset", type=Path, default=None, help="JSON-снимок вакансий"
+    )
+    args = parser.parse_args()
+
+    StandinServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency,
+        vacancies_count=args.vacancies,
+        dataset_file=args.dataset,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+from datetime import date, datetime, timedelta
+import json
+from pathlib import Path
+import random
+from typing import Any
+
+from pydantic import BaseModel, field_serializer, field_validator
+
+CATEGORIES = ("Разработка", "Аналитика", "Дизайн", "Менеджмент")
+
+# Группы фильтров в том порядке, в котором они выводятся в меню фильтров
+FILTER_GROUPS: dict[str, tuple[str, ...]] = {
+    "Занятость": ("Полная", "Частичная"),
+    "Опыт работы": ("Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"),
+    "График работы": ("Полный день", "Удаленная работа", "Гибкий график"),
+}
+
+_POSITIONS = {
+    "Разработка": ("Python-разработчик", "Frontend-разработчик", "ML-инженер", "DevOps-инженер"),
+    "Аналитика": ("Аналитик данных", "Системный аналитик", "Бизнес-аналитик"),
+    "Дизайн": ("UI/UX-дизайнер", "Продуктовый дизайнер", "Графический дизайнер"),
+    "Менеджмент": ("Менеджер проектов", "Product owner", "Руководитель группы"),
+}
+_LEVELS = ("Junior", "Middle", "Senior", "Lead")
+
+
+class Vacancy(BaseModel):
+    """Вакансия тестового набора данных.
+
+    Attributes:
+        slug (str): Часть URL детальной страницы вакансии.
+        title (str): Название вакансии.
+        published (date): Дата публикации.
+        category (str): Категория (вкладка фильтра).
+        employment (str): Занятость.
+        experience (str): Требуемый опыт работы.
+        schedule (str): График работы.
+        tasks (list[str]): Задачи.
+        requirements (list[str]): Требования к кандидату.
+        plus (list[str]): Желательные навыки.
+        conditions (list[str]): Условия работы.
+    """
+
+    slug: str
+    title: str
+    published: date
+    category: str
+    employment: str
+    experience: str
+    schedule: str
+    tasks: list[str]
+    requirements: list[str]
+    plus: list[str]
+    conditions: list[str]
+
+    @field_validator("published", mode="before")
+    @classmethod
+    def _parse_published(cls, value: Any) -> Any:
+        """Разбирает дату публикации в формате сайта (дд.мм.гггг)."""
+        if isinstance(value, str):
+            return datetime.strptime(value, "%d.%m.%Y").date()
+        return value
+
+    @field_serializer("published")
+    def _serialize_published(self, value: date) -> str:
+        return value.strftime("%d.%m.%Y")
+
+    @property
+    def published_text(self) -> str:
+        """Дата публикации в формате, который выводит сайт (дд.мм.гггг)."""
+        return self.published.strftime("%d.%m.%Y")
+
+
+def generate_vacancies(count: int, seed: int = 0) -> list[Vacancy]:
+    """Генерирует детерминированный набор вакансий заданного размера.
+
+    Args:
+        count (int): Количество вакансий.
+        seed (int): Зерно генератора, одинаковое зерно дает одинаковый набор.
+
+    Returns:
+        list[Vacancy]: Вакансии, отсортированные от новых к старым.
+    """
+    rnd = random.Random(seed)
+    today = date(2025, 6, 30)
+    vacancies = []
+    for index in range(count):
+        category = CATEGORIES[index % len(CATEGORIES)]
+        title = f"{rnd.choice(_LEVELS)} {rnd.choice(_POSITIONS[category])}"
+        vacancies.append(
+            Vacancy(
+                slug=f"vacancy-{index + 1}",
+                title=title,
+                published=today - timedelta(days=rnd.randint(0, 365)),
+                category=category,
+                employment=rnd.choice(FILTER_GROUPS["Занятость"]),
+                experience=rnd.choice(FILTER_GROUPS["Опыт работы"]),
+                schedule=rnd.choice(FILTER_GROUPS["График работы"]),
+                tasks=[f"Задача {i} для позиции {title}" for i in range(1, 4)],
+                requirements=[f"Требование {i}" for i in range(1, 5)],
+                plus=[f"Дополнительный навык {i}" for i in range(1, 3)],
+                conditions=["Официальное оформление", "ДМС", "Гибкое начало дня"],
+            )
+        )
+
+    vacancies.sort(key=lambda vacancy: vacancy.published, reverse=True)
+    return vacancies
+
+
+def load_vacancies(path: Path) -> list[Vacancy]:
+    """Загружает снимок вакансий из JSON-файла.
+
+    Файл содержит список объектов с полями `Vacancy`, дата публикации
+    указывается в формате дд.мм.гггг.
+
+    Args:
+        path (Path): Путь к JSON-файлу снимка.
+
+    Returns:
+        list[Vacancy]: Вакансии, отсортированные от новых к старым.
+    """
+    items = json.loads(Path(path).read_text(encoding="utf-8"))
+    vacancies = [Vacancy.model_validate(item) for item in items]
+
+    vacancies.sort(key=lambda vacancy: vacancy.published, reverse=True)
+    return vacancies
+
+
+def filter_vacancies(
+    vacancies: list[Vacancy],
+    category: str | None = None,
+    filters: list[str] | None = None,
+    order: str = "desc",
+) -> list[Vacancy]:
+    """Отбирает вакансии так же, как это делает список вакансий на сайте.
+
+    Внутри одной группы фильтров значения объединяются через "или",
+    между группами - через "и".
+
+    Args:
+        vacancies (list[Vacancy]): Все вакансии.
+        category (str | None): Категория (вкладка), None или "Все" - без отбора.
+        filters (list[str] | None): Отмеченные значения фильтров.
+        order (str): Порядок по дате публикации: "desc" или "asc".
+
+    Returns:
+        list[Vacancy]: Отобранные вакансии в указанном порядке.
+    """
+    selected = set(filters or [])
+    result = []
+    for vacancy in vacancies:
+        if category and category != "Все" and vacancy.category != category:
+            continue
+
+        values = {
+            "Занятость": vacancy.employment,
+            "Опыт работы": vacancy.experience,
+            "График работы": vacancy.schedule,
+        }
+        matches = all(
+            values[group] in selected
+            for group, options in FILTER_GROUPS.items()
+            if selected.intersection(options)
+        )
+        if matches:
+            result.append(vacancy)
+
+    result.sort(key=lambda vacancy: vacancy.published, reverse=order != "asc")
+    return result
@@ -0,0 +1,336 @@
+"""HTML-страницы локального двойника сайта.
+
+Разметка повторяет структуру сайта в той мере, в какой на нее опираются локаторы
+`src/ui/locators`: навбар, хлебные крошки, заголовок, панель фильтров со вкладками,
+сортировкой и меню фильтров, список карточек вакансий, детальная страница вакансии
+с формой отклика, диалог cookies и футер.
+"""
+
+from html import escape
+import json
+
+from integrations.standin.dataset import CATEGORIES, FILTER_GROUPS, Vacancy
+
+POLICY_FILES = ("Политика конфиденциальности.pdf", "Пользовательское_соглашение.pdf")
+
+_LOGO = (
+    "data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='40' "
+    "height='40'><circle cx='20' cy='20' r='18' fill='%231f4bd8'/></svg>"
+)
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+header, main, footer { padding: 16px 32px; }
+i { display: inline-block; width: 16px; height: 16px; background: currentColor; }
+img { width: 40px; height: 40px; }
+a[role='tab'] { margin-right: 16px; }
+.q-tab { display: inline-block; padding: 8px 12px; cursor: pointer; }
+.q-tab--active { border-bottom: 2px solid #1f4bd8; }
+.q-menu { position: absolute; background: #fff; border: 1px solid #ccc; padding: 16px; }
+.q-checkbox { cursor: pointer; padding: 4px 0; }
+.q-checkbox[aria-checked='true'] { font-weight: bold; }
+.vacancy_card { display: block; padding: 16px; margin: 8px 0; background-color: #fff;
+  color: #222; transition: background-color 0.2s, color 0.2s; }
+.vacancy_card:hover { background-color: #1f4bd8; color: #fff; }
+.vacancy_card a { color: inherit; text-decoration: none; display: block; }
+.cookie-dialog { position: fixed; bottom: 16px; left: 16px; padding: 16px;
+  background: #fff; border: 1px solid #ccc; }
+div[role='alert'] { color: #c00; }
+"""
+
+_COOKIES_SCRIPT = """
+(() => {
+  if (localStorage.getItem('cookie_consent')) return;
+  const dialog = document.createElement('div');
+  dialog.className = 'cookie-dialog';
+  dialog.innerHTML = '<p>Мы используем cookies</p><button type="button">Принять</button>';
+  dialog.querySelector('button').addEventListener('click', () => {
+    localStorage.setItem('cookie_consent', 'accepted');
+    document.cookie = 'cookie_consent=accepted; path=/; max-age=31536000';
+    dialog.remove();
+  });
+  document.body.appendChild(dialog);
+})();
+"""
+
+_VACANCIES_SCRIPT = """
+(() => {
+  const state = { category: 'Все', order: 'desc', filters: [] };
+  const row = document.querySelector('article.post .row');
+  const menu = document.querySelector('.q-menu');
+  const sortButton = document.querySelector('.btn_sort');
+  const checkboxes = () => [...menu.querySelectorAll("[role='checkbox']")];
+
+  const escapeHtml = (text) => text.replace(/[&<>"']/g, (c) => `&#${c.charCodeAt(0)};`);
+  const render = (items) => {
+    if (!items.length) {
+      row.innerHTML = '<div class="not_found"><h3>Вакансии не найдены</h3>'
+        + '<p>Попробуйте изменить параметры поиска</p></div>';
+      return;
+    }
+    row.innerHTML = items.map((v) => `
+      <article class="vacancy_card">
+        <a class="vacancy_card__link" href="/vakansii/${v.slug}">
+          <h3 class="vacancy_card__title">${escapeHtml(v.title)}</h3>
+          <time>${v.published}</time>
+          <i class="vacancy_card__icon"></i>
+        </a>
+      </article>`).join('');
+  };
+  const load = async () => {
+    const params = new URLSearchParams({ category: state.category, order: state.order });
+    state.filters.forEach((f) => params.append('filters', f));
+    const response = await fetch(`/api/vacancies?${params}`);
+    render(await response.json());
+  };
+
+  document.querySelectorAll("[role='tablist'] [role='tab']").forEach((tab) => {
+    tab.addEventListener('click', () => {
+      document.querySelectorAll("[role='tablist'] [role='tab']").forEach((other) => {
+        other.classList.toggle('q-tab--active', other === tab);
+        other.classList.toggle('q-tab--inactive', other !== tab);
+      });
+      state.category = tab.innerText.trim();
+      load();
+    });
+  });
+
+  sortButton.addEventListener('click', () => {
+    state.order = state.order === 'desc' ? 'asc' : 'desc';
+    const newestFirst = state.order === 'desc';
+    sortButton.querySelector('i').className = newestFirst ? 'icon-sorting-down' : 'icon-sorting-up';
+    sortButton.querySelector('span').textContent = newestFirst ? 'Сначала новые' : 'Сначала старые';
+    load();
+  });
+
+  document.querySelector('.btn_filters').addEventListener('click', () => {
+    checkboxes().forEach((box) => box.setAttribute(
+      'aria-checked', String(state.filters.includes(box.innerText.trim()))));
+    menu.style.display = menu.style.display === 'none' ? 'block' : 'none';
+  });
+  checkboxes().forEach((box) => box.addEventListener('click', () => {
+    box.setAttribute('aria-checked', String(box.getAttribute('aria-checked') !== 'true'));
+  }));
+  const closeMenu = (filters) => {
+    state.filters = filters;
+    menu.style.display = 'none';
+    load();
+  };
+  menu.querySelector('.btn_reset').addEventListener('click', () => closeMenu([]));
+  menu.querySelector('.btn_apply').addEventListener('click', () => closeMenu(
+    checkboxes().filter((box) => box.getAttribute('aria-checked') === 'true')
+      .map((box) => box.innerText.trim())));
+})();
+"""
+
+_FORM_SCRIPT = """
+(() => {
+  const form = document.querySelector('form.vacancy_form');
+  const rules = {
+    name: (v) => v.trim() ? '' : 'Обязательное поле',
+    phone: (v) => /^\\+?[0-9()\\s-]{10,}$/.test(v) ? '' : 'Введите корректный номер телефона',
+    email: (v) => /^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$/.test(v) ? '' : 'Введите корректный Email',
+    resume: (v) => !v || /^https?:\\/\\//.test(v) ? '' : 'Введите корректную ссылку',
+  };
+  form.addEventListener('submit', async (event) => {
+    event.preventDefault();
+    let valid = true;
+    for (const [name, rule] of Object.entries(rules)) {
+      const input = form.querySelector(`input[name='${name}']`);
+      const alert = input.closest('label').querySelector("[role='alert']");
+      const error = rule(input.value);
+      alert.textContent = error;
+      alert.hidden = !error;
+      valid = valid && !error;
+    }
+    if (!valid) return;
+    await fetch('/api/responses', { method: 'POST', body: new FormData(form) });
+    form.insertAdjacentHTML('beforeend', '<div class="success">Отклик успешно отправлен</div>');
+  });
+})();
+"""
+
+
+def _navbar() -> str:
+    tabs = (
+        ("/", "О нас"),
+        ("/poleznye-materialy", "Полезные материалы"),
+        ("/novosti", "Новости"),
+        ("/vakansii", "Вакансии"),
+        ("/#feedback", "Контакты"),
+    )
+    links = "".join(f'<a role="tab" href="{href}">{title}</a>' for href, title in tabs)
+    return (
+        "<header>"
+        f'<div class="q-avatar"><img src="{_LOGO}" alt="ЦИСМ"></div>'
+        f"<nav>{links}</nav>"
+        '<div class="input_search__wrapp"><i class="input_search__icon_search"></i>'
+        '<input type="search" placeholder="Поиск"><i role="presentation"></i></div>'
+        "</header>"
+    )
+
+
+def _footer() -> str:
+    documents = "".join(
+        f'<a href="/docs/{name}" download>{escape(name.removesuffix(".pdf"))}</a> '
+        for name in POLICY_FILES
+    )
+    return (
+        '<footer class="container footer">'
+        '<div class="footer__info">© 2018 - 2025 ЦИСМ. ИНН: 9709037529</div>'
+        f'{documents}<a href="/">Главная</a><img src="{_LOGO}" alt="logo">'
+        "</footer>"
+    )
+
+
+def _breadcrumbs(*trail: tuple[str, str | None]) -> str:
+    items = []
+    for title, href in trail:
+        if href:
+            items.append(f'<a class="q-breadcrumbs__el" href="{href}">{escape(title)}</a>')
+        else:
+            items.append(f'<span class="q-breadcrumbs__el">{escape(title)}</span>')
+    return f'<div class="q-breadcrumbs">{"".join(items)}</div>'
+
+
+def _layout(title: str, body: str, script: str = "") -> str:
+    return (
+        '<!DOCTYPE html><html lang="ru"><head><meta charset="utf-8">'
+        f"<title>{escape(title)}</title><style>{_STYLE}</style></head>"
+        f"<body>{_navbar()}<main>{body}</main>{_footer()}"
+        f"<script>{_COOKIES_SCRIPT}{script}</script></body></html>"
+    )
+
+
+def render_card(vacancy: Vacancy) -> str:
+    """Возвращает разметку карточки вакансии в списке."""
+    return (
+        '<article class="vacancy_card">'
+        f'<a class="vacancy_card__link" href="/vakansii/{vacancy.slug}">'
+        f'<h3 class="vacancy_card__title">{escape(vacancy.title)}</h3>'
+        f"<time>{vacancy.published_text}</time>"
+        '<i class="vacancy_card__icon"></i></a></article>'
+    )
+
+
+def render_vacancies_page(vacancies: list[Vacancy]) -> str:
+    """Возвращает страницу списка вакансий.
+
+    Args:
+        vacancies (list[Vacancy]): Вакансии в порядке "сначала новые".
+
+    Returns:
+        str: HTML-страница.
+    """
+    tabs = "".join(
+        f'<div role="tab" class="q-tab {"q-tab--active" if index == 0 else "q-tab--inactive"}">'
+        f'<div class="q-tab__label">{escape(title)}</div></div>'
+        for index, title in enumerate(("Все", *CATEGORIES))
+    )
+    groups = "".join(
+        f"<div>{escape(group)}</div><div role=\"group\">"
+        + "".join(
+            '<div class="q-checkbox" role="checkbox" aria-checked="false">'
+            f'<div class="q-checkbox__label">{escape(option)}</div></div>'
+            for option in options
+        )
+        + "</div>"
+        for group, options in FILTER_GROUPS.items()
+    )
+    body = (
+        _breadcrumbs(("Главная", "/"), ("Все вакансии", None))
+        + '<h1 class="post__title">Присоединяйся к команде Центра</h1>'
+        '<h3 class="post__subtitle">Развивайся вместе с нами, создавай нейросети '
+        "и двигай технологические процессы</h3>"
+        '<article class="post"><div class="post__bar">'
+        f'<div class="q-tabs"><div role="tablist">{tabs}</div></div>'
+        '<button type="button" class="btn_sort"><i class="icon-sorting-down"></i>'
+        "<span>Сначала новые</span></button>"
+        '<button type="button" class="btn_filters">Фильтр</button>'
+        f'<div class="q-menu" style="display: none">{groups}'
+        '<button type="button" class="btn_reset">Сбросить</button>'
+        '<button type="button" class="btn_apply">Применить</button></div>'
+        "</div>"
+        f'<div class="row">{"".join(render_card(vacancy) for vacancy in vacancies)}</div>'
+        "</article>"
+    )
+    return _layout("Вакансии", body, _VACANCIES_SCRIPT)
+
+
+def _section(title: str, items: list[str], after: str = "") -> str:
+    rows = "".join(f"<li>{escape(item)}</li>" for item in items)
+    return f"<h2>{title}</h2><ul>{rows}</ul>" + (f"<p>{escape(after)}</p>" if after else "")
+
+
+def _form_field(label: str, name: str) -> str:
+    return (
+        f'<label class="q-field"><input name="{name}" aria-label="{label}">'
+        '<div role="alert" hidden></div></label>'
+    )
+
+
+def render_vacancy_page(vacancy: Vacancy) -> str:
+    """Возвращает детальную страницу вакансии с формой отклика.
+
+    Args:
+        vacancy (Vacancy): Вакансия.
+
+    Returns:
+        str: HTML-страница.
+    """
+    tags = "".join(
+        f'<button type="button" class="tag"><span>{label}</span> {escape(value)}</button>'
+        for label, value in (
+            ("Занятость:", vacancy.employment),
+            ("Опыт:", vacancy.experience),
+            ("График работы:", vacancy.schedule),
+        )
+    )
+    form = (
+        '<form class="vacancy_form" novalidate>'
+        + _form_field("Представьтесь, пожалуйста", "name")
+        + _form_field("Ваш номер телефона", "phone")
+        + _form_field("Ваш Email", "email")
+        + _form_field("Ваше резюме", "resume")
+        + '<p>Или <span class="file-link">прикрепите файл</span></p>'
+        '<button type="submit"><span>Отправить</span></button>'
+        '<div class="vacancy_form__footer">Нажимая кнопку, вы даете согласие '
+        "на обработку персональных данных</div></form>"
+    )
+    body = (
+        _breadcrumbs(("Главная", "/"), ("Все вакансии", "/vakansii"), (vacancy.title, None))
+        + '<article class="vacancy">'
+        f'<div class="header"><h1 class="vacancy__title">{escape(vacancy.title)}</h1>'
+        f"<time>{vacancy.published_text}</time></div>"
+        f'<div class="vacancy__tags">{tags}</div>'
+        '<div class="post">'
+        + _section("Задачи", vacancy.tasks, "Работа в команде из 5-7 человек.")
+        + _section("Ожидаем от кандидата", vacancy.requirements)
+        + _section("Будет плюсом", vacancy.plus, "Поможем прокачать остальное.")
+        + _section("Условия", vacancy.conditions)
+        + "</div>"
+        '<div class="vacancy__actions"><button type="button">'
+        "<span>Откликнуться на вакансию</span></button></div>"
+        f"{form}</article>"
+    )
+    return _layout(vacancy.title, body, _FORM_SCRIPT)
+
+
+def render_simple_page(title: str, subtitle: str) -> str:
+    """Возвращает простую страницу раздела с заголовком и подзаголовком."""
+    body = (
+        _breadcrumbs(("Главная", "/"), (title, None))
+        + f'<h1 class="post__title">{escape(title)}</h1>'
+        f'<h3 class="post__subtitle">{escape(subtitle)}</h3>'
+        '<section id="feedback"></section>'
+    )
+    return _layout(title, body)
+
+
+def vacancies_json(vacancies: list[Vacancy]) -> bytes:
+    """Возвращает краткие данные вакансий для ответа API списка."""
+    items = [
+        {"slug": v.slug, "title": v.title, "published": v.published_text}
+        for v in vacancies
+    ]
+    return json.dumps(items, ensure_ascii=False).encode()
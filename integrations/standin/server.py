@@ -0,0 +1,216 @@
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+import time
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from integrations.standin.dataset import (
+    Vacancy,
+    filter_vacancies,
+    generate_vacancies,
+    load_vacancies,
+)
+from integrations.standin.pages import (
+    POLICY_FILES,
+    render_simple_page,
+    render_vacancies_page,
+    render_vacancy_page,
+    vacancies_json,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Минимальный корректный PDF-документ для проверок скачивания файлов
+_PDF_STUB = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+)
+
+_SIMPLE_PAGES = {
+    "/": ("О нас", "Центр исследований и разработки в области искусственного интеллекта"),
+    "/novosti": ("Новости", "Последние новости Центра"),
+    "/poleznye-materialy": ("Полезные материалы", "Статьи и материалы наших экспертов"),
+}
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов локального двойника сайта."""
+
+    server: "_StandinHTTPServer"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send(
+        self,
+        body: bytes,
+        content_type: str,
+        status: HTTPStatus = HTTPStatus.OK,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_html(self, html: str, status: HTTPStatus = HTTPStatus.OK) -> None:
+        self._send(html.encode(), "text/html; charset=utf-8", status)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        path = unquote(url.path).rstrip("/") or "/"
+        vacancies = self.server.vacancies
+
+        if path == "/vakansii":
+            self._send_html(render_vacancies_page(vacancies))
+        elif path.startswith("/vakansii/"):
+            vacancy = self.server.vacancies_by_slug.get(path.removeprefix("/vakansii/"))
+            if vacancy is None:
+                self._send_html(render_simple_page("Страница не найдена", ""), HTTPStatus.NOT_FOUND)
+            else:
+                self._send_html(render_vacancy_page(vacancy))
+        elif path == "/api/vacancies":
+            query = parse_qs(url.query)
+            selected = filter_vacancies(
+                vacancies,
+                category=query.get("category", [None])[0],
+                filters=query.get("filters", []),
+                order=query.get("order", ["desc"])[0],
+            )
+            self._send(vacancies_json(selected), "application/json")
+        elif path.startswith("/docs/") and path.removeprefix("/docs/") in POLICY_FILES:
+            file_name = path.removeprefix("/docs/")
+            self._send(
+                _PDF_STUB,
+                "application/pdf",
+                headers={
+                    "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}"
+                },
+            )
+        elif path in _SIMPLE_PAGES:
+            self._send_html(render_simple_page(*_SIMPLE_PAGES[path]))
+        else:
+            self._send_html(render_simple_page("Страница не найдена", ""), HTTPStatus.NOT_FOUND)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if urlsplit(self.path).path == "/api/responses":
+            self._send(b'{"status": "ok"}', "application/json", HTTPStatus.CREATED)
+        else:
+            self._send(b"{}", "application/json", HTTPStatus.NOT_FOUND)
+
+
+class _StandinHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], vacancies: list[Vacancy], latency_ms: int
+    ) -> None:
+        super().__init__(address, _StandinHandler)
+        self.vacancies = vacancies
+        self.vacancies_by_slug = {vacancy.slug: vacancy for vacancy in vacancies}
+        self.latency_ms = latency_ms
+
+
+class StandinServer:
+    """Локальный двойник сайта cism-ms.ru для бенчмарков и офлайн-прогонов.
+
+    Сервер отдает страницы списка вакансий, детальные страницы вакансий с формой
+    отклика, меню фильтров и простые страницы разделов. Список вакансий обновляется
+    через JSON API, поэтому переключение вкладок, сортировки и фильтров вызывает
+    реальные сетевые запросы. Каждый ответ задерживается на `latency_ms`,
+    а размер набора вакансий задается `vacancies_count`.
+
+    Attributes:
+        host (str): Адрес, на котором слушает сервер.
+        port (int): Порт сервера (0 - выбрать свободный).
+        latency_ms (int): Искусственная задержка каждого ответа в мс.
+        vacancies (list[Vacancy]): Набор вакансий.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: int = 0,
+        vacancies_count: int = 24,
+        dataset_file: Path | None = None,
+    ) -> None:
+        """Инициализирует локальный двойник сайта.
+
+        Args:
+            host (str): Адрес, на котором слушает сервер.
+            port (int): Порт сервера (0 - выбрать свободный).
+            latency_ms (int): Искусственная задержка каждого ответа в мс.
+            vacancies_count (int): Количество генерируемых вакансий.
+            dataset_file (Path | None): JSON-снимок вакансий; если указан,
+                используется вместо сгенерированного набора.
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.vacancies = (
+            load_vacancies(dataset_file)
+            if dataset_file
+            else generate_vacancies(vacancies_count)
+        )
+        self._server: _StandinHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Базовый URL запущенного сервера."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "StandinServer":
+        """Запускает сервер в фоновом потоке."""
+        self._server = _StandinHTTPServer(
+            (self.host, self.port), self.vacancies, self.latency_ms
+        )
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="standin-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Локальный двойник сайта запущен на {self.url}: "
+            f"вакансий {len(self.vacancies)}, задержка {self.latency_ms} мс"
+        )
+        return self
+
+    def serve_forever(self) -> None:
+        """Запускает сервер в текущем потоке до прерывания."""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Останавливает сервер."""
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        logger.info("Локальный двойник сайта остановлен")
+
+    def __enter__(self) -> "StandinServer":
+        """Запускает сервер при входе в контекстный менеджер."""
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        """Останавливает сервер при выходе из контекстного менеджера."""
+        self.stop()
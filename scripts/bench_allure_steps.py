@@ -0,0 +1,101 @@
+"""Микробенчмарк накладных расходов на шаги элементов в отчете Allure.
+
+Моделирует тест, работающий со списком: на каждую карточку выполняется
+действие и несколько проверок. Сравнивает `allure.step` (хуки allure-commons,
+как при запуске с allure-pytest) с записью шагов `step_recorder` при разных
+уровнях детализации, а также размер итогового JSON результата теста.
+
+Запуск:
+    python -m scripts.bench_allure_steps --cards 200 --checks 3
+"""
+
+import argparse
+import json
+import time
+from uuid import uuid4
+
+import allure
+import allure_commons
+from allure_commons.model2 import TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now
+import attr
+
+from config import StepVerbosity
+from integrations.allure.steps import StepRecorder
+
+
+class _StepListener:
+    """Слушатель шагов Allure, повторяющий работу allure-pytest."""
+
+    def __init__(self, reporter: AllureReporter) -> None:
+        self.reporter = reporter
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.reporter.start_step(None, uuid, TestStepResult(name=title, start=now()))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.reporter.stop_step(uuid, stop=now())
+
+
+def _run_test(step_factory, cards: int, checks: int) -> tuple[float, int]:
+    """Выполняет сценарий и возвращает время в мс и размер JSON результата в байтах."""
+    reporter = AllureReporter()
+    test_uuid = uuid4().hex
+    reporter.schedule_test(test_uuid, TestResult(name="bench", uuid=test_uuid, start=now()))
+    listener = _StepListener(reporter)
+    allure_commons.plugin_manager.register(listener)
+    step = step_factory(reporter)
+    try:
+        started_at = time.perf_counter()
+        for card in range(cards):
+            with step(f"Клик по карточке {card}", StepVerbosity.ACTIONS):
+                for check in range(checks):
+                    with step(f"Проверка {check}", StepVerbosity.CHECKS):
+                        pass
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+    finally:
+        allure_commons.plugin_manager.unregister(listener)
+
+    result = reporter.get_test(test_uuid)
+    size = len(json.dumps(attr.asdict(result), ensure_ascii=False).encode("utf-8"))
+    return elapsed_ms, size
+
+
+def _allure_steps(reporter: AllureReporter):
+    return lambda title, level: allure.step(title)
+
+
+def _recorded_steps(verbosity: StepVerbosity):
+    def factory(reporter: AllureReporter):
+        recorder = StepRecorder(verbosity)
+        # В тестах репортер подключается в StepRecorder.start по конфигурации pytest
+        recorder._reporter = reporter
+        return recorder.step
+
+    return factory
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и выводит результаты замеров."""
+    parser = argparse.ArgumentParser(description="Накладные расходы на шаги Allure")
+    parser.add_argument("--cards", type=int, default=200, help="Количество карточек")
+    parser.add_argument("--checks", type=int, default=3, help="Проверок на карточку")
+    args = parser.parse_args()
+
+    steps = args.cards * (args.checks + 1)
+    print(f"Карточек: {args.cards}, шагов на тест: {steps}")
+    variants = [
+        ("allure.step", _allure_steps),
+        ("step_recorder, checks", _recorded_steps(StepVerbosity.CHECKS)),
+        ("step_recorder, actions", _recorded_steps(StepVerbosity.ACTIONS)),
+    ]
+    for name, factory in variants:
+        elapsed_ms, size = _run_test(factory, args.cards, args.checks)
+        print(f"{name:<24} {elapsed_ms:8.2f} мс на тест, JSON: {size / 1024:8.1f} КБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Микробенчмарк накладных расходов `BaseElement.get_locator`.
+
+Сравнивает прежнюю реализацию (форматирование пути и шаг Allure на каждый вызов)
+с кешируемой. Страница Playwright заменена объектом, создающим пустые локаторы,
+поэтому измеряются только расходы Python на стороне тестов, без браузера.
+Шаги Allure записываются тем же репортером, что и при запуске с allure-pytest.
+
+Запуск:
+    python -m scripts.bench_get_locator --calls 20000
+"""
+
+import argparse
+import time
+from uuid import uuid4
+
+import allure
+import allure_commons
+from allure_commons.model2 import TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now
+
+from src.ui.elements.base_element import BaseElement
+from src.ui.elements.locator_cache import locator_cache
+
+CARD_TITLE = "//div[@data-testid='vacancy-card'][{index}]//h3"
+
+
+class _FakeLocator:
+    def nth(self, index: int) -> "_FakeLocator":
+        return _FakeLocator()
+
+
+class _FakePage:
+    def locator(self, selector: str) -> _FakeLocator:
+        return _FakeLocator()
+
+    def get_by_test_id(self, test_id: str) -> _FakeLocator:
+        return _FakeLocator()
+
+    def on(self, event: str, handler) -> None:
+        pass
+
+
+class _StepRecorder:
+    """Слушатель шагов Allure, повторяющий работу allure-pytest."""
+
+    def __init__(self) -> None:
+        self.reporter = AllureReporter()
+        self.reporter.schedule_test(uuid4().hex, TestResult(name="bench", start=now()))
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.reporter.start_step(None, uuid, TestStepResult(name=title, start=now()))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.reporter.stop_step(uuid, stop=now())
+
+
+class _LegacyElement(BaseElement):
+    """Прежняя реализация: шаг Allure и новый локатор при каждом вызове."""
+
+    def get_locator(self, nth: int = 0, **kwargs):
+        formatted_selector = self.locator_path.format(**kwargs)
+        with allure.step(f"Получение локатора '{formatted_selector}' с индексом' {nth}'"):
+            return self.page.locator(formatted_selector).nth(nth)
+
+
+def _measure(element: BaseElement, calls: int, cards: int) -> float:
+    """Возвращает среднее время вызова в микросекундах."""
+    started_at = time.perf_counter()
+    for call in range(calls):
+        element.get_locator(nth=0, index=call % cards + 1)
+    return (time.perf_counter() - started_at) / calls * 1_000_000
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и выводит результаты замеров."""
+    parser = argparse.ArgumentParser(description="Накладные расходы get_locator")
+    parser.add_argument("--calls", type=int, default=20000, help="Количество вызовов")
+    parser.add_argument("--cards", type=int, default=24, help="Количество карточек в списке")
+    args = parser.parse_args()
+
+    recorder = _StepRecorder()
+    allure_commons.plugin_manager.register(recorder)
+    try:
+        page = _FakePage()
+        legacy = _measure(_LegacyElement(page, CARD_TITLE, "Заголовок"), args.calls, args.cards)
+        cached = _measure(BaseElement(page, CARD_TITLE, "Заголовок"), args.calls, args.cards)
+    finally:
+        allure_commons.plugin_manager.unregister(recorder)
+
+    print(f"Вызовов: {args.calls}, уникальных локаторов: {args.cards}")
+    print(f"До (шаг Allure на вызов): {legacy:.2f} мкс/вызов")
+    print(f"После (кеш, без шага):    {cached:.2f} мкс/вызов ({legacy / cached:.1f}x)")
+    print(f"Кеш локаторов: {locator_cache.stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
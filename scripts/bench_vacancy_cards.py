@@ -0,0 +1,81 @@
+"""Бенчмарк извлечения данных карточек вакансий в зависимости от их количества.
+
+Сравнивает прежний способ (по 4-5 обращений к браузеру на карточку: название,
+атрибут и текст даты, ссылка) с `VacanciesListComponent.get_all_vacancies_cards`,
+извлекающим все карточки одним вызовом `evaluate_all`. Страницы отдает локальный
+двойник сайта (integrations/standin) с заданным количеством вакансий, поэтому
+сеть не влияет на замеры. Требуется установленный браузер Playwright.
+
+Запуск:
+    python -m scripts.bench_vacancy_cards --cards 10 50 200 --latency 0
+"""
+
+import argparse
+import time
+
+from playwright.sync_api import sync_playwright
+
+from integrations.standin import StandinServer
+from src.ui.components.vacancies.vacancies_list_component import (
+    VacanciesListComponent,
+    VacancyCardData,
+)
+from src.ui.routes import AppRoute
+
+
+def _legacy_extract(component: VacanciesListComponent) -> list[VacancyCardData]:
+    """Прежнее извлечение: отдельные обращения к браузеру для каждого поля карточки."""
+    cards = []
+    for index in range(component.get_vacancies_count()):
+        date_locator = component.card_date.get_locator(nth=index)
+        cards.append(
+            VacancyCardData(
+                title=component.card_title.get_locator(nth=index).inner_text().strip(),
+                date=date_locator.get_attribute("datetime") or date_locator.inner_text().strip(),
+                link=component.card_link.get_locator(nth=index).get_attribute("href"),
+            )
+        )
+    return cards
+
+
+def _measure(extract, component: VacanciesListComponent, repeats: int) -> tuple[float, list]:
+    """Возвращает лучшее время извлечения в мс и результат."""
+    best_ms, cards = float("inf"), []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        cards = extract(component)
+        best_ms = min(best_ms, (time.perf_counter() - started_at) * 1000)
+    return best_ms, cards
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и выводит результаты замеров."""
+    parser = argparse.ArgumentParser(description="Извлечение данных карточек вакансий")
+    parser.add_argument("--cards", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeats", type=int, default=3, help="Повторов каждого замера")
+    parser.add_argument("--latency", type=int, default=0, help="Задержка ответов сервера в мс")
+    args = parser.parse_args()
+
+    print(f"{'карточек':>9} {'по полям, мс':>14} {'evaluate_all, мс':>17} {'ускорение':>10}")
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        for count in args.cards:
+            with StandinServer(vacancies_count=count, latency_ms=args.latency) as server:
+                page = browser.new_page()
+                page.goto(f"{server.url}{AppRoute.VACANCIES}")
+                component = VacanciesListComponent(page)
+                component.should_have_vacancies(min_count=count)
+
+                legacy_ms, legacy_cards = _measure(_legacy_extract, component, args.repeats)
+                bulk_ms, bulk_cards = _measure(
+                    VacanciesListComponent.get_all_vacancies_cards, component, args.repeats
+                )
+                assert legacy_cards == bulk_cards, "Результаты извлечения не совпадают"
+                page.close()
+
+            print(f"{count:>9} {legacy_ms:>14.1f} {bulk_ms:>17.1f} {legacy_ms / bulk_ms:>9.1f}x")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Обновление вендорной копии агента UI Coverage.
+
+Во время прогона агент не скачивается: init script строится из копии
+в `integrations/playwright/vendor`. Скрипт скачивает агент указанной версии отчета
+ui-coverage-report, добавляет в начало файла комментарий с источником и SHA-256
+и сохраняет его на место копии. Обновленный файл нужно закоммитить.
+
+Запуск:
+    python -m scripts.update_coverage_agent
+    python -m scripts.update_coverage_agent --url <адрес agent.global.js>
+"""
+
+import argparse
+from datetime import UTC, datetime
+import hashlib
+import os
+from pathlib import Path
+import urllib.request
+
+from integrations.playwright.ui_coverage_script import VENDORED_AGENT_FILE
+
+AGENT_URL = "https://nikita-filonov.github.io/ui-coverage-report/agent.global.js"
+
+
+def download_agent(url: str, agent_file: Path) -> str:
+    """Скачивает агент и атомарно сохраняет его с комментарием об источнике.
+
+    Args:
+        url (str): Адрес скрипта агента.
+        agent_file (Path): Путь к вендорной копии.
+
+    Returns:
+        str: SHA-256 содержимого агента.
+    """
+    with urllib.request.urlopen(url, timeout=30) as response:
+        body = response.read()
+
+    digest = hashlib.sha256(body).hexdigest()
+    fetched_at = datetime.now(UTC).strftime("%Y-%m-%d")
+    header = f"// Source: {url}\n// Fetched: {fetched_at}\n// SHA-256: {digest}\n"
+
+    agent_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = agent_file.with_name(f"{agent_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(header.encode() + body)
+    os.replace(tmp_file, agent_file)
+    return digest
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и обновляет копию агента."""
+    parser = argparse.ArgumentParser(description="Обновление копии агента UI Coverage")
+    parser.add_argument("--url", default=AGENT_URL, help="Адрес скрипта агента")
+    parser.add_argument(
+        "--output", type=Path, default=VENDORED_AGENT_FILE, help="Путь к копии агента"
+    )
+    args = parser.parse_args()
+
+    digest = download_agent(args.url, args.output)
+    size_kb = args.output.stat().st_size / 1024
+    print(f"Агент сохранен в {args.output} ({size_kb:.0f} КБ), SHA-256: {digest}")
+
+
+if __name__ == "__main__":
+    main()
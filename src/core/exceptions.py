@@ -20,3 +20,9 @@ class ElementInteractionError(LocatorError):
     """Исключение при взаимодействии с элементом."""
 
     pass
+
+
+class InvalidSelectorError(LocatorError):
+    """Исключение когда селектор локатора синтаксически неверен."""
+
+    pass
@@ -1,8 +1,17 @@
+from contextlib import AbstractContextManager
 from re import Pattern
 
 import allure
 from playwright.sync_api import Locator, Page, expect
 
+from src.ui.snapshot import (
+    DEFAULT_TIMEOUT_MS,
+    ComponentSnapshot,
+    SnapshotCheck,
+    SoftAssertions,
+    capture_snapshot,
+    expect_all,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -21,6 +30,9 @@ class BaseComponent:
         check_current_url: Проверяет, что текущий URL соответствует ожидаемому.
         check_locator: Проверяет видимость локатора и его текстовое содержимое.
         check_input_locator: Проверяет видимость поля ввода и его значение.
+        take_snapshot: Снимает состояние элементов компонента одним обращением к браузеру.
+        check_snapshot: Проверяет условия на снимке состояния элементов компонента.
+        expect_all: Собирает условия и проверяет их вместе с общим таймаутом.
     """
 
     def __init__(self, page: Page) -> None:
@@ -63,3 +75,57 @@ class BaseComponent:
         expect(locator).to_be_visible()
         if text:
             expect(locator).to_have_value(text)
+
+    def take_snapshot(self, *checks: SnapshotCheck) -> ComponentSnapshot:
+        """Снимает состояние элементов условий одним обращением к браузеру без проверок.
+
+        Args:
+            *checks (SnapshotCheck): Условия, элементы которых входят в снимок.
+
+        Returns:
+            ComponentSnapshot: Снимок состояния элементов.
+        """
+        return capture_snapshot(self.page, [check.target for check in checks])
+
+    def check_snapshot(
+        self, *checks: SnapshotCheck, timeout: float = DEFAULT_TIMEOUT_MS
+    ) -> ComponentSnapshot:
+        """Проверяет условия на снимке состояния элементов компонента.
+
+        Состояние всех элементов читается одним вызовом; при невыполненных условиях
+        снимок повторяется до истечения таймаута (см. `src.ui.snapshot`).
+
+        Args:
+            *checks (SnapshotCheck): Проверяемые условия.
+            timeout (float): Максимальное время ожидания в мс.
+
+        Returns:
+            ComponentSnapshot: Снимок, на котором выполнились все условия.
+
+        Raises:
+            AssertionError: Если за таймаут выполнились не все условия.
+        """
+        with self.expect_all(timeout) as soft:
+            soft.add(*checks)
+        return soft.snapshot
+
+    def expect_all(
+        self, timeout: float = DEFAULT_TIMEOUT_MS
+    ) -> AbstractContextManager[SoftAssertions]:
+        """Собирает условия в блоке и проверяет их вместе при выходе из него.
+
+        Все условия проверяются в одном цикле опроса с общим таймаутом, и при
+        ошибке перечисляются все невыполненные условия, а не только первое.
+
+        Пример:
+            with self.expect_all() as soft:
+                soft.add(visible(self.title), contains_text(self.title, "Вакансии"))
+
+        Args:
+            timeout (float): Общий таймаут проверки в мс.
+
+        Returns:
+            AbstractContextManager[SoftAssertions]: Контекст со сборщиком условий.
+        """
+        title = f"Проверка состояния компонента {type(self).__name__}"
+        return expect_all(self.page, title, timeout)
@@ -1,5 +1,7 @@
+import allure
 from playwright.sync_api import Page, expect
 
+from integrations.allure.artifacts import artifact_pipeline
 from src.ui.components.base_component import BaseComponent
 from src.ui.elements.container import Container
 from src.ui.elements.text import Text
@@ -87,9 +89,13 @@ class EmptyViewComponent(BaseComponent):
         return self.container.get_locator().is_visible()
 
     def take_screenshot(self, name: str = "empty_state"):
-        """Делает скриншот компонента."""
+        """Делает скриншот компонента и прикладывает его к отчету Allure."""
         if self.is_displayed():
-            self.container.get_locator().screenshot(path=f"{name}.png")
+            artifact_pipeline.attach_bytes(
+                self.container.get_locator().screenshot(),
+                name=name,
+                attachment_type=allure.attachment_type.PNG,
+            )
         return self
 
     def verify_complete_empty_state(
@@ -9,6 +9,7 @@ from src.ui.elements.icon import Icon
 from src.ui.elements.link import Link
 from src.ui.elements.text import Text
 from src.ui.locators import FooterLocators
+from src.ui.snapshot import SnapshotCheck, contains_text, visible
 
 
 class FooterComponent(BaseComponent):
@@ -59,16 +60,23 @@ class FooterComponent(BaseComponent):
         self.footer_icon.check_visible()
         return self
 
+    def visible_checks(
+        self, years: str = "2018 - 2025", inn: str = "9709037529"
+    ) -> list[SnapshotCheck]:
+        """Возвращает условия видимости футера для проверки на снимке."""
+        return [
+            contains_text(self.info, f"© {years}"),
+            contains_text(self.info, f"ИНН: {inn}"),
+            visible(self.user_agreement_link),
+            visible(self.privacy_policy_link),
+            visible(self.main_page_link),
+            visible(self.footer_icon),
+        ]
+
     @allure.step("Проверка наличия всех элементов в футере")
     def check_visible(self) -> Self:
-        """Проверяет, что все элементы футера видимы."""
-        (
-            self.should_contain_copyright()
-            .should_contain_inn()
-            .should_have_all_links()
-            .should_have_icon()
-        )
-
+        """Проверяет, что все элементы футера видимы, одним снимком состояния."""
+        self.check_snapshot(*self.visible_checks())
         return self
 
     @allure.step("Проверка перехода на главную страницу")
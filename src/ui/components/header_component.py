@@ -3,6 +3,7 @@ from playwright.sync_api import Page
 from src.ui.components.base_component import BaseComponent
 from src.ui.elements.text import Text
 from src.ui.locators import HeaderPageLocators
+from src.ui.snapshot import SnapshotCheck, contains_text, visible
 
 
 class HeaderComponent(BaseComponent):
@@ -26,7 +27,27 @@ class HeaderComponent(BaseComponent):
             *HeaderPageLocators.SUBTITLE.format(location=location),
         )
 
-    def check_visible(self):
-        """Проверяет, что компонент видим."""
-        self.title.check_visible()
-        self.subtitle.check_visible()
+    def visible_checks(
+        self, title: str | None = None, subtitle: str | None = None
+    ) -> list[SnapshotCheck]:
+        """Возвращает условия видимости заголовка для проверки на снимке.
+
+        Args:
+            title (str | None): Текст, который должен содержать заголовок.
+            subtitle (str | None): Текст, который должен содержать подзаголовок.
+        """
+        checks = [visible(self.title), visible(self.subtitle)]
+        if title:
+            checks.append(contains_text(self.title, title))
+        if subtitle:
+            checks.append(contains_text(self.subtitle, subtitle))
+        return checks
+
+    def check_visible(self, title: str | None = None, subtitle: str | None = None):
+        """Проверяет, что компонент видим и, если заданы, тексты заголовков.
+
+        Args:
+            title (str | None): Текст, который должен содержать заголовок.
+            subtitle (str | None): Текст, который должен содержать подзаголовок.
+        """
+        self.check_snapshot(*self.visible_checks(title, subtitle))
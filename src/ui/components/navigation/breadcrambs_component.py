@@ -6,6 +6,7 @@ from src.ui.elements.container import Container
 from src.ui.elements.link import Link
 from src.ui.elements.text import Text
 from src.ui.locators import BreadcrumbsLocators
+from src.ui.snapshot import SnapshotCheck, contains_text, has_count, has_text, visible
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -17,6 +18,7 @@ class BreadcrumbsComponent(BaseComponent):
     Attributes:
         count_of_elements (int): количество элементов хлебных крошек
         items (Locator): локатор для элементов хлебных крошек
+        item (Text): элемент хлебных крошек (для проверок на снимке)
         container (Container): контейнер с хлебными крошками
         home_link (Link): ссылка на главную
         current_page (Text): текущая страница
@@ -28,19 +30,26 @@ class BreadcrumbsComponent(BaseComponent):
 
         self.count_of_elements = count_of_elements
         self.items = page.locator(BreadcrumbsLocators.ITEMS.selector)
+        self.item = Text.by_xpath(page, *BreadcrumbsLocators.ITEMS)
         self.container = Container.by_xpath(page, *BreadcrumbsLocators.CONTAINER)
         self.home_link = Link.by_xpath(page, *BreadcrumbsLocators.HOME_LINK)
         self.current_page = Text.by_xpath(page, *BreadcrumbsLocators.CURRENT_PAGE)
 
+    def visible_checks(self, page_name: str) -> list[SnapshotCheck]:
+        """Возвращает условия видимости хлебных крошек для проверки на снимке."""
+        return [
+            visible(self.container),
+            visible(self.home_link),
+            contains_text(self.home_link, "Главная"),
+            has_count(self.item, self.count_of_elements),
+            visible(self.current_page),
+            has_text(self.current_page, page_name, ignore_case=True),
+        ]
+
     @allure.step("Проверка наличия всех элементов хлебных крошек {page_name}")
     def check_visible(self, page_name: str):
-        """Проверяет наличие всех элементов хлебных крошек."""
-        (
-            self.should_be_visible()
-            .should_contain_home_link()
-            .should_have_items_count(self.count_of_elements)
-            .should_contain_current_page(page_name)
-        )
+        """Проверяет наличие всех элементов хлебных крошек одним снимком состояния."""
+        self.check_snapshot(*self.visible_checks(page_name))
 
     def should_be_visible(self):
         """Проверяет, что контейнер с хлебными крошками виден."""
@@ -6,6 +6,7 @@ from src.ui.elements.icon import Icon
 from src.ui.elements.tab import Tab
 from src.ui.locators import NavBarLocators
 from src.ui.routes import AppRoute
+from src.ui.snapshot import SnapshotCheck, visible
 
 
 class NavbarComponent(BaseComponent):
@@ -33,18 +34,21 @@ class NavbarComponent(BaseComponent):
         self.contacts_tab = Tab.by_xpath(page, *NavBarLocators.CONTACT_TAB)
         self.search = SearchComponent(page)
 
-    def check_visible(self):
-        """Проверяет, что все элементы навбара отображаются на странице."""
-        for component in [
+    def visible_checks(self) -> list[SnapshotCheck]:
+        """Возвращает условия видимости навбара, включая поиск, для проверки на снимке."""
+        elements = [
             self.logo,
             self.about_tab,
             self.materials_tab,
             self.news_tab,
             self.vacancies_tab,
             self.contacts_tab,
-            self.search,
-        ]:
-            component.check_visible()
+        ]
+        return [visible(element) for element in elements] + self.search.visible_checks()
+
+    def check_visible(self):
+        """Проверяет, что все элементы навбара отображаются на странице."""
+        self.check_snapshot(*self.visible_checks())
 
     def click_about_tab(self) -> None:
         """Кликает по табу "О Нас" и проверяет, что пользователь перешел на главную страницу."""
@@ -3,6 +3,7 @@ from src.ui.elements.icon import Icon
 from src.ui.elements.input import Input
 from src.ui.elements.label import Label
 from src.ui.locators import NavBarLocators
+from src.ui.snapshot import SnapshotCheck, visible
 
 
 class SearchComponent(BaseComponent):
@@ -24,7 +25,10 @@ class SearchComponent(BaseComponent):
         self.input = Input.by_xpath(page, *NavBarLocators.SEARCH_INPUT)
         self.inter_icon = Icon.by_xpath(page, *NavBarLocators.SEARCH_ENTER_ICON)
 
+    def visible_checks(self) -> list[SnapshotCheck]:
+        """Возвращает условия видимости компонента поиска для проверки на снимке."""
+        return [visible(self.search_tab), visible(self.icon)]
+
     def check_visible(self):
         """Проверка, что компонент поиска видим."""
-        self.search_tab.check_visible()
-        self.icon.check_visible()
+        self.check_snapshot(*self.visible_checks())
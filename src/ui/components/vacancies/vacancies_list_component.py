@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Any, Self
+from typing import Any, NamedTuple, Self
 
 import allure
 from playwright.sync_api import Locator, Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from src.ui.components.base_component import BaseComponent
 from src.ui.elements.container import Container
@@ -10,10 +11,58 @@ from src.ui.elements.icon import Icon
 from src.ui.elements.link import Link
 from src.ui.elements.text import Text
 from src.ui.locators import VacanciesListLocators
+from src.ui.styles import StyleValues
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
 
+# Извлекает данные карточек в браузере за один вызов. XPath элементов карточки
+# передаются из VacanciesListLocators и вычисляются относительно карточки.
+_EXTRACT_CARDS_JS = """
+(cards, [titlePath, datePath, linkPath]) => {
+  const find = (card, path) => document.evaluate(
+    "." + path, card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+  ).singleNodeValue;
+  const extract = (card) => {
+    const title = find(card, titlePath);
+    const date = find(card, datePath);
+    const link = find(card, linkPath);
+    return [
+      title ? title.innerText.trim() : "",
+      date ? (date.getAttribute("datetime") || date.innerText.trim()) : "",
+      link ? link.getAttribute("href") : null,
+    ];
+  };
+  return Array.isArray(cards) ? cards.map(extract) : extract(cards);
+}
+"""
+
+
+# Свойства стиля карточки, меняющиеся при наведении
+HOVER_STYLES = ("background-color", "color")
+
+
+class VacancyCardData(NamedTuple):
+    """Данные карточки вакансии из списка.
+
+    Attributes:
+        title (str): Название вакансии.
+        date (str): Дата публикации: атрибут `datetime` или текст элемента.
+        link (str | None): Ссылка на страницу вакансии.
+    """
+
+    title: str
+    date: str
+    link: str | None
+
+    @property
+    def published_at(self) -> datetime | None:
+        """Возвращает дату публикации или None, если ее не удалось разобрать."""
+        try:
+            return datetime.strptime(self.date, "%d.%m.%Y")
+        except ValueError:
+            return None
+
 
 class VacanciesListComponent(BaseComponent):
     """Класс представления компонента списка вакансий.
@@ -21,6 +70,7 @@ class VacanciesListComponent(BaseComponent):
     Attributes:
         container (Container): контейнер списка вакансий
         vacancy_cards (Locator): локатор для карточек вакансий
+        card (Container): карточка вакансии (для действий и проверок по индексу)
         card_title (Text): заголовок карточки вакансии
         card_date (Text): дата публикации карточки вакансии
         card_link (Link): ссылка на карточку вакансии
@@ -35,6 +85,7 @@ class VacanciesListComponent(BaseComponent):
         self.container = Container.by_xpath(self.page, *VacanciesListLocators.CONTAINER)
 
         # Элементы карточки
+        self.card = Container.by_xpath(self.page, *VacanciesListLocators.VACANCY_CARDS)
         self.card_title = Text.by_xpath(self.page, *VacanciesListLocators.CARD_TITLE)
         self.card_date = Text.by_xpath(self.page, *VacanciesListLocators.CARD_DATE)
         self.card_link = Link.by_xpath(self.page, *VacanciesListLocators.CARD_LINK)
@@ -74,55 +125,75 @@ class VacanciesListComponent(BaseComponent):
         return self.vacancy_cards.filter(has_text=title).first
 
     # Получение данных
+    @property
+    def _card_paths(self) -> list[str]:
+        return [
+            VacanciesListLocators.CARD_TITLE.selector,
+            VacanciesListLocators.CARD_DATE.selector,
+            VacanciesListLocators.CARD_LINK.selector,
+        ]
+
+    def get_all_vacancies_cards(self) -> list[VacancyCardData]:
+        """Возвращает данные всех карточек вакансий за одно обращение к браузеру."""
+        rows = self.vacancy_cards.evaluate_all(_EXTRACT_CARDS_JS, self._card_paths)
+        return [VacancyCardData(*row) for row in rows]
+
+    def get_vacancy_card(self, index: int = 0) -> VacancyCardData:
+        """Возвращает данные карточки вакансии по индексу за одно обращение к браузеру."""
+        row = self.get_vacancy_by_index(index).evaluate(_EXTRACT_CARDS_JS, self._card_paths)
+        return VacancyCardData(*row)
+
     def get_vacancy_data(self, index: int = 0) -> dict[str, Any]:
         """Возвращает данные вакансии по индексу."""
-        vacancy = self.get_vacancy_by_index(index)
-        return {
-            "title": self.card_title.get_locator(nth=index).inner_text().strip(),
-            "date": self.card_date.get_locator(nth=index).get_attribute("datetime")
-            or self.card_date.get_locator(nth=index).inner_text().strip(),
-            "link": self.card_link.get_locator(nth=index).get_attribute("href"),
-            "element": vacancy,
-        }
+        card = self.get_vacancy_card(index)
+        return {**card._asdict(), "element": self.get_vacancy_by_index(index)}
 
     def get_all_vacancies_data(self) -> list[dict[str, Any]]:
         """Возвращает данные всех вакансий."""
-        vacancies_data = []
-        for i in range(self.get_vacancies_count()):
-            vacancies_data.append(self.get_vacancy_data(i))
-        return vacancies_data
+        return [
+            {**card._asdict(), "element": self.get_vacancy_by_index(index)}
+            for index, card in enumerate(self.get_all_vacancies_cards())
+        ]
 
     def get_vacancies_titles(self) -> list[str]:
         """Возвращает список названий вакансий."""
-        return [
-            self.card_title.get_locator(nth=ind).inner_text().strip()
-            for ind in range(self.get_vacancies_count())
-        ]
+        return [card.title for card in self.get_all_vacancies_cards()]
 
     @allure.step(
         "Проверяем, что при наведении на карточку вакансии меняется цвет фона и текста"
     )
     def check_hover_on_vacancy(self, index: int = 1) -> None:
         """Проверяет, что при наведении на карточку вакансии меняется цвет фона и текста."""
-        vacancy = self.get_vacancy_by_index(index)
-        bg_before = vacancy.evaluate(
-            "el => window.getComputedStyle(el).backgroundColor"
-        )
-        color_before = vacancy.evaluate("el => window.getComputedStyle(el).color")
+        self._check_hover_styles(index, self.card.get_styles(HOVER_STYLES, nth=index))
+
+    @allure.step("Проверяем изменение цвета фона и текста при наведении на все карточки")
+    def check_hover_on_all_vacancies(self) -> None:
+        """Проверяет hover-состояние всех карточек.
+
+        Исходные стили всех карточек читаются одним вызовом, далее на каждую
+        карточку приходится наведение и ожидание изменения ее стилей. Перед
+        чтением курсор уводится в угол страницы, чтобы карточка под ним после
+        предыдущих действий не дала hover-стили вместо исходных.
+        """
+        self.page.mouse.move(0, 0)
+        for index, before in enumerate(self.card.get_all_styles(HOVER_STYLES)):
+            self._check_hover_styles(index, before)
+
+    def _check_hover_styles(self, index: int, before: StyleValues) -> None:
+        self.card.hover(nth=index)
+        try:
+            after = self.card.wait_for_style_change(before, index)
+        except PlaywrightTimeoutError:
+            after = before
 
-        vacancy.hover()
-        self.page.wait_for_timeout(1000)
-        bg_after = vacancy.evaluate("el => window.getComputedStyle(el).backgroundColor")
-        color_after = vacancy.evaluate("el => window.getComputedStyle(el).color")
         logger.info(
-            "Проверяем, что цвет текста и фон карточки вакансии меняется при наведении"
+            f"Проверяем, что цвет текста и фон карточки вакансии {index} меняется при наведении"
         )
-        assert (
-            bg_before != bg_after
-        ), f"Цвет фона карточки вакансии не изменился. {bg_before} == {bg_after}"
-        assert (
-            color_before != color_after
-        ), f"Цвет текста карточки вакансии не изменился. {color_before} == {color_after}"
+        for name, title in (("background-color", "фона"), ("color", "текста")):
+            assert before[name] != after[name], (
+                f"Цвет {title} карточки вакансии {index} не изменился. "
+                f"{before[name]} == {after[name]}"
+            )
 
     @allure.step("Проверяем, что вакансии отсортированы по дате публикации: {order}")
     def check_vacancies_sorted_by_date(self, order: str = "desc") -> None:
@@ -135,8 +206,8 @@ class VacanciesListComponent(BaseComponent):
             AssertionError: Если вакансии не отсортированы в указанном порядке.
         """
         self.container.check_visible()
-        vacancies_data = self.get_all_vacancies_data()
-        dates = self._extract_dates(vacancies_data)
+        cards = self.get_all_vacancies_cards()
+        dates = self._extract_dates(cards)
 
         logger.info(
             f"Проверяем, что вакансии отсортированы по дате публикации: '{order}'"
@@ -149,8 +220,7 @@ class VacanciesListComponent(BaseComponent):
         except AssertionError as e:
 
             current_order = "\n".join(
-                f"{i}) {vcancy['title']} - {vcancy['date']}"
-                for i, vcancy in enumerate(vacancies_data, start=1)
+                f"{i}) {card.title} - {card.date}" for i, card in enumerate(cards, start=1)
             )
 
             error_msg = (
@@ -182,20 +252,18 @@ class VacanciesListComponent(BaseComponent):
                 f"Некорректное значение order: '{order}'. Ожидается 'asc' или 'desc'."
             )
 
-    def _extract_dates(self, vacancies_data: list[dict[str, Any]]) -> list[datetime]:
-        """Извлекает и парсит даты из данных вакансий."""
+    def _extract_dates(self, cards: list[VacancyCardData]) -> list[datetime]:
+        """Извлекает и парсит даты из данных карточек вакансий."""
         dates = []
-        for vacancy in vacancies_data:
-            date_str = vacancy.get("date")
-            if date_str:
-                try:
-                    parsed_date = datetime.strptime(date_str, "%d.%m.%Y")
-                    dates.append(parsed_date)
-
-                except ValueError:
-                    err_msg = (
-                        f"Некорректный формат даты: {date_str}"
-                        f" в вакансии {vacancy.get('title', 'N/A')}"
-                    )
-                    logger.warning(err_msg)
+        for card in cards:
+            if not card.date:
+                continue
+
+            published_at = card.published_at
+            if published_at is None:
+                logger.warning(
+                    f"Некорректный формат даты: {card.date} в вакансии {card.title or 'N/A'}"
+                )
+                continue
+            dates.append(published_at)
         return dates
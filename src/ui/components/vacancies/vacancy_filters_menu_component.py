@@ -1,4 +1,4 @@
-from typing import Self
+from typing import NamedTuple, Self
 
 import allure
 from playwright.sync_api import Page, expect
@@ -8,10 +8,89 @@ from src.ui.elements.button import Button
 from src.ui.elements.checkbox import Checkbox
 from src.ui.elements.container import Container
 from src.ui.locators import VacancyFiltersMenuLocators
+from src.ui.snapshot import checked, contains_text, visible
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
 
+# Ожидаемые группы фильтров и метки их чекбоксов в порядке отображения
+EXPECTED_FILTERS: dict[str, tuple[str, ...]] = {
+    "Занятость": ("Полная", "Частичная"),
+    "Опыт работы": ("Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"),
+    "График работы": ("Полный день", "Удаленная работа", "Гибкий график"),
+}
+
+# Собирает модель меню за один вызов: для каждой группы - заголовок и чекбоксы
+# с меткой (aria-label или текст метки) и состоянием aria-checked. Пути передаются
+# из VacancyFiltersMenuLocators; пути чекбоксов вычисляются относительно группы.
+# Вместе с моделью возвращается версия меню: идентификатор документа и счетчик
+# изменений, который увеличивается при открытии и закрытии меню и, через
+# MutationObserver на его корне, при перерисовке и отметке чекбоксов. Если версия
+# совпадает с переданной, модель не собирается и вместо групп возвращается null.
+_DISCOVER_MENU_JS = """
+([knownVersion, containerPath, groupsPath, titlePath, itemsPath, labelPath]) => {
+  const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+  const first = (path, root) => document.evaluate(
+    path, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+  ).singleNodeValue;
+  const all = (path, root) => {
+    const result = document.evaluate(
+      path, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+  };
+  const root = first(containerPath, document);
+  let state = window.__vacancyFiltersMenu;
+  if (!state || state.root !== root) {
+    if (state && state.observer) state.observer.disconnect();
+    state = window.__vacancyFiltersMenu = {
+      root, generation: state ? state.generation + 1 : 0, observer: null,
+    };
+    if (root) {
+      const current = state;
+      current.observer = new MutationObserver(() => { current.generation += 1; });
+      current.observer.observe(root, {
+        subtree: true, childList: true, characterData: true,
+        attributes: true, attributeFilter: ["aria-checked", "aria-label"],
+      });
+    }
+  }
+  const version = `${performance.timeOrigin}:${state.generation}`;
+  if (version === knownVersion) return [version, null];
+  if (!root) return [version, []];
+  return [version, all(groupsPath, document).map((group) => {
+    const title = first(titlePath, group);
+    const boxes = all("." + itemsPath, group).map((box) => {
+      const label = first(labelPath, box);
+      return [
+        normalize(box.getAttribute("aria-label") || (label || box).textContent),
+        normalize((label || box).textContent),
+        box.getAttribute("aria-checked") === "true",
+      ];
+    });
+    return [normalize(title ? title.textContent : ""), boxes];
+  })];
+}
+"""
+
+
+class FilterCheckboxData(NamedTuple):
+    """Чекбокс меню фильтров в модели меню.
+
+    Attributes:
+        group (str): Заголовок группы (например, "Опыт работы").
+        label (str): Метка чекбокса: aria-label или текст метки.
+        text (str): Текст метки чекбокса.
+        index (int): Номер чекбокса в группе, начиная с 1 (как в `CHECKBOX_ITEM`).
+        checked (bool): Чекбокс был отмечен на момент построения модели.
+    """
+
+    group: str
+    label: str
+    text: str
+    index: int
+    checked: bool
+
 
 class VacancyFiltersMenuComponent(BaseComponent):
     """Компонент меню фильтров вакансий.
@@ -27,6 +106,8 @@ class VacancyFiltersMenuComponent(BaseComponent):
         employment_checkboxes (list[Checkbox]): Список чекбоксов для группы "Занятость".
         schedule_checkboxes (list[Checkbox]): Список чекбоксов для группы "График работы".
         all_checkboxes_by_label (dict[str, Checkbox]): Словарь всех чекбоксов.
+        menu_model (list[FilterCheckboxData]): Актуальная модель меню: группы, метки,
+            индексы и состояние чекбоксов.
     """
 
     def __init__(self, page: Page):
@@ -37,8 +118,10 @@ class VacancyFiltersMenuComponent(BaseComponent):
         """
         super().__init__(page)
         self.container = Container.by_xpath(page, *VacancyFiltersMenuLocators.CONTAINER)
-        self._checkboxes_cache: dict[str, list[Checkbox]] = {}
-        self._all_checkboxes_by_label: dict[str, Checkbox] | None = None
+        self._menu_model: list[FilterCheckboxData] = []
+        self._menu_version: str | None = None
+        self._checkboxes_by_group: dict[str, list[Checkbox]] = {}
+        self._checkboxes_by_label: dict[str, Checkbox] = {}
         self.reset_btn = Button.by_xpath(page, *VacancyFiltersMenuLocators.RESET_BUTTON)
         self.apply_btn = Button.by_xpath(page, *VacancyFiltersMenuLocators.APPLY_BUTTON)
 
@@ -76,19 +159,77 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Returns:
             dict[str, Checkbox]: Словарь чекбоксов.
         """
-        if self._all_checkboxes_by_label is None:
-            all_checkboxes = [
-                *self.employment_checkboxes,
-                *self.experience_checkboxes,
-                *self.schedule_checkboxes,
-            ]
-            self._all_checkboxes_by_label = {
-                checkbox.get_label_text(): checkbox for checkbox in all_checkboxes
-            }
-        return self._all_checkboxes_by_label
+        self._ensure_menu_model()
+        return self._checkboxes_by_label
+
+    @property
+    def menu_model(self) -> list[FilterCheckboxData]:
+        """Возвращает модель меню фильтров, обновленную, если меню изменилось.
+
+        Returns:
+            list[FilterCheckboxData]: Чекбоксы меню в порядке отображения.
+        """
+        self._ensure_menu_model()
+        return self._menu_model
+
+    def discover_menu(self) -> list[FilterCheckboxData]:
+        """Строит модель меню фильтров одним обращением к браузеру.
+
+        Модель (группы, метки, индексы и состояние чекбоксов) и созданные по ней
+        чекбоксы кешируются вместе с версией меню, пока меню не изменится:
+        не откроется или закроется, не перерисуется или не изменится отметка
+        чекбоксов. Закрытое меню кешируется как пустая модель.
+
+        Returns:
+            list[FilterCheckboxData]: Чекбоксы меню в порядке отображения.
+        """
+        self._refresh_menu_model(known_version=None)
+        return self._menu_model
+
+    def _ensure_menu_model(self) -> None:
+        """Обновляет модель меню, если меню изменилось с последнего обнаружения.
+
+        Проверка версии и сборка новой модели выполняются одним вызовом `page.evaluate`.
+        """
+        self._refresh_menu_model(known_version=self._menu_version)
+
+    def _refresh_menu_model(self, known_version: str | None) -> None:
+        paths = [
+            VacancyFiltersMenuLocators.CONTAINER.selector,
+            VacancyFiltersMenuLocators.CHECKBOX_GROUPS.selector,
+            VacancyFiltersMenuLocators.CHECKBOX_GROUP_TITLE.selector,
+            VacancyFiltersMenuLocators.CHECKBOX_ITEMS.selector,
+            VacancyFiltersMenuLocators.CHECKBOX_LABEL.selector,
+        ]
+        self._menu_version, groups = self.page.evaluate(_DISCOVER_MENU_JS, [known_version, *paths])
+        if groups is None:
+            return
+
+        self._menu_model = [
+            FilterCheckboxData(group_title, label, text, index, is_checked)
+            for group_title, boxes in groups
+            for index, (label, text, is_checked) in enumerate(boxes, start=1)
+        ]
+
+        checkbox_path, checkbox_name = VacancyFiltersMenuLocators.CHECKBOX_ITEM
+        self._checkboxes_by_group = {}
+        self._checkboxes_by_label = {}
+        for item in self._menu_model:
+            checkbox = Checkbox.by_xpath(
+                self.page,
+                checkbox_path.format(group_title=item.group, index=item.index),
+                checkbox_name.format(group_title=item.group, label=item.text),
+            )
+            self._checkboxes_by_group.setdefault(item.group, []).append(checkbox)
+            self._checkboxes_by_label[item.label] = checkbox
+
+        logger.info(
+            f"Меню фильтров: групп {len(self._checkboxes_by_group)}, "
+            f"чекбоксов {len(self._menu_model)}"
+        )
 
     def _create_checkboxes_by_group(self, group_title: str) -> list[Checkbox]:
-        """Создаёт список чекбоксов для указанной группы.
+        """Возвращает список чекбоксов указанной группы из модели меню.
 
         Args:
             group_title (str): Название группы (например, "Опыт работы").
@@ -96,32 +237,8 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Returns:
             list[Checkbox]: Список чекбоксов в группе.
         """
-        if group_title not in self._checkboxes_cache:
-            filter_group = self.page.locator(
-                VacancyFiltersMenuLocators.CHECKBOX_GROUP_BY_TITLE.selector.format(
-                    group_title=group_title
-                )
-            )
-            checkbox_elements = filter_group.locator(
-                VacancyFiltersMenuLocators.CHECKBOX_ITEMS.selector
-            ).all()
-            checkbox_path, checkbox_name = VacancyFiltersMenuLocators.CHECKBOX_ITEM
-            checkboxes = []
-            for index, element in enumerate(checkbox_elements, start=1):
-                label_text = element.inner_text().strip()
-                checkbox = Checkbox.by_xpath(
-                    self.page,
-                    checkbox_path.format(group_title=group_title, index=index),
-                    checkbox_name.format(
-                        group_title=group_title,
-                        label=label_text,
-                    ),
-                )
-                checkboxes.append(checkbox)
-
-            self._checkboxes_cache[group_title] = checkboxes
-
-        return self._checkboxes_cache[group_title]
+        self._ensure_menu_model()
+        return self._checkboxes_by_group.get(group_title, [])
 
     def get_checkbox_by_label(self, label: str) -> Checkbox:
         """Возвращает чекбокс по тексту его метки (aria-label).
@@ -135,10 +252,11 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Raises:
             ValueError: Если чекбокс с указанной меткой не найден.
         """
-        if label in self.all_checkboxes_by_label:
-            return self.all_checkboxes_by_label[label]
+        checkboxes = self.all_checkboxes_by_label
+        if label in checkboxes:
+            return checkboxes[label]
 
-        available_labels = ", ".join(self.all_checkboxes_by_label.keys())
+        available_labels = ", ".join(checkboxes.keys())
         raise ValueError(
             f"Чекбокс с меткой '{label}' не найден. Доступные метки: {available_labels}."
         )
@@ -160,23 +278,21 @@ class VacancyFiltersMenuComponent(BaseComponent):
 
     @allure.step("Проверка отображения чекбоксов меню фильтров")
     def check_expected_checkboxes(self):
-        """Проверяет, что все чекбоксы меню фильтров отображаются."""
-        checkboxes = [
-            *self.employment_checkboxes,
-            *self.experience_checkboxes,
-            *self.schedule_checkboxes,
-        ]
-        employment_labels = ["Полная", "Частичная"]
-        experience_labels = [
-            "Нет опыта",
-            "От 1 года до 3 лет",
-            "От 3 до 6 лет",
-            "Более 6 лет",
-        ]
-        schdule_labels = ["Полный день", "Удаленная работа", "Гибкий график"]
-        labels = [*employment_labels, *experience_labels, *schdule_labels]
-        for i in range(len(labels)):
-            checkboxes[i].check_visible().check_contain_text(labels[i])
+        """Проверяет, что все ожидаемые чекбоксы меню фильтров отображаются.
+
+        Все чекбоксы проверяются на одном снимке состояния меню.
+        """
+        checkbox_path, checkbox_name = VacancyFiltersMenuLocators.CHECKBOX_ITEM
+        checks = []
+        for group_title, labels in EXPECTED_FILTERS.items():
+            for index, label in enumerate(labels, start=1):
+                checkbox = Checkbox.by_xpath(
+                    self.page,
+                    checkbox_path.format(group_title=group_title, index=index),
+                    checkbox_name.format(group_title=group_title, label=label),
+                )
+                checks += [visible(checkbox), contains_text(checkbox, label)]
+        self.check_snapshot(*checks)
 
     @allure.step("Выбор фильтров по лейблам {filters}")
     def select_filters(self, filters: list[str]) -> Self:
@@ -189,10 +305,10 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Returns:
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
-        for label in filters:
-            checkbox = self.get_checkbox_by_label(label)
+        # Чекбоксы находятся до первой отметки: после нее модель меню собирается заново
+        checkboxes = [self.get_checkbox_by_label(label) for label in filters]
+        for checkbox in checkboxes:
             checkbox.check()
-
         return self
 
     @allure.step("Проверка, что выбраны фильтры: {filters}")
@@ -206,10 +322,7 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Returns:
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
-        for label in filters:
-            checkbox = self.get_checkbox_by_label(label)
-            checkbox.is_checked()
-
+        self.check_snapshot(*[checked(self.get_checkbox_by_label(label)) for label in filters])
         return self
 
     @allure.step("Проверка отмены фильтров кнопкой 'Сбросить'")
@@ -219,7 +332,7 @@ class VacancyFiltersMenuComponent(BaseComponent):
         Returns:
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
-        for checkbox in self.all_checkboxes_by_label.values():
-            checkbox.is_not_checked()
-
+        self.check_snapshot(
+            *[checked(checkbox, False) for checkbox in self.all_checkboxes_by_label.values()]
+        )
         return self
@@ -8,6 +8,7 @@ from src.ui.elements.button import Button
 from src.ui.elements.input import Input
 from src.ui.elements.text import Text
 from src.ui.locators import VacancyResponseFormLocators
+from src.ui.snapshot import has_value, visible
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -22,6 +23,7 @@ class VacancyResponseFormComponent(BaseComponent):
         email_input (Input): Поле ввода email.
         phone_input (Input): Поле ввода телефона.
         resume_link_input (Input): Поле ввода ссылки на резюме.
+        fields (list[Input]): Поля ввода формы в порядке отображения.
         submit_button (Button): Кнопка отправки формы.
         fill_name_error_message (Text): Текст ошибки под полем 'Имя'.
         fill_email_error_message (Text): Текст ошибки под полем 'Email'.
@@ -61,6 +63,11 @@ class VacancyResponseFormComponent(BaseComponent):
             page, *VacancyResponseFormLocators.RESUME_LINK_ERROR
         )
 
+    @property
+    def fields(self) -> list[Input]:
+        """Возвращает поля ввода формы в порядке отображения."""
+        return [self.name_input, self.phone_input, self.email_input, self.resume_link_input]
+
     def fill_phone(self, value: str) -> Self:
         """Заполняет поле номера телефона."""
         self.phone_input.fill(value)
@@ -85,20 +92,19 @@ class VacancyResponseFormComponent(BaseComponent):
 
     @allure.step("Проверка, что форма отклика на вакансию видима")
     def check_visible(self) -> None:
-        """Проверяет, что форма отклика видима."""
-        self.name_input.check_visible()
-        self.phone_input.check_visible()
-        self.email_input.check_visible()
-        self.resume_link_input.check_visible()
-        self.submit_button.check_visible()
+        """Проверяет, что форма отклика видима.
+
+        Все элементы проверяются вместе с общим таймаутом; в ошибке перечисляются
+        все невидимые элементы.
+        """
+        with self.expect_all() as soft:
+            soft.add(*[visible(field) for field in self.fields], visible(self.submit_button))
 
     @allure.step("Проверка, что все поля формы пустые.")
     def check_all_fields_are_empty(self) -> None:
-        """Проверяет, что все поля формы пустые."""
-        self.name_input.check_have_value("")
-        self.phone_input.check_have_value("")
-        self.email_input.check_have_value("")
-        self.resume_link_input.check_have_value("")
+        """Проверяет, что все поля формы пустые; в ошибке перечисляются все непустые поля."""
+        with self.expect_all() as soft:
+            soft.add(*[has_value(field, "") for field in self.fields])
 
     def fill_form(
         self, full_name: str, phone: str, email: str, resume_link: str = ""
@@ -0,0 +1,130 @@
+"""Учет согласия на использование cookies.
+
+При подготовке состояния браузера согласие принимается один раз, а cookies
+и ключи localStorage, появившиеся после нажатия "Принять", запоминаются как
+признаки согласия. Если при последующих переходах все признаки уже есть
+в контексте, проверка диалога cookies пропускается.
+"""
+
+from collections.abc import Callable
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+class ConsentStats:
+    """Счетчики проверок диалога cookies.
+
+    Attributes:
+        performed (int): Количество переходов, на которых диалог проверялся.
+        skipped (int): Количество переходов, на которых проверка пропущена,
+            так как согласие уже дано.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.performed = 0
+        self.skipped = 0
+
+    def summary(self) -> str:
+        """Возвращает сводку по проверкам в читаемом виде."""
+        return f"проверок диалога cookies: {self.performed}, пропущено: {self.skipped}"
+
+
+class CookieConsent:
+    """Признаки согласия на использование cookies.
+
+    Attributes:
+        cookies (set[str]): Имена cookies, появляющихся после принятия согласия.
+        local_storage (set[str]): Ключи localStorage, появляющиеся после принятия согласия.
+        stats (ConsentStats): Счетчики выполненных и пропущенных проверок диалога.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой набор признаков согласия."""
+        self.cookies: set[str] = set()
+        self.local_storage: set[str] = set()
+        self.stats = ConsentStats()
+
+    @property
+    def has_markers(self) -> bool:
+        """Известны ли признаки, по которым можно определить согласие."""
+        return bool(self.cookies or self.local_storage)
+
+    @staticmethod
+    def _snapshot(page: Page) -> tuple[set[str], set[str]]:
+        """Возвращает имена cookies и ключи localStorage текущей страницы."""
+        cookies = {cookie["name"] for cookie in page.context.cookies(page.url)}
+        try:
+            local_storage = set(page.evaluate("() => Object.keys(window.localStorage)"))
+        except PlaywrightError:
+            # localStorage недоступен, например, на about:blank
+            local_storage = set()
+        return cookies, local_storage
+
+    def capture(self, page: Page, accept: Callable[[], None]) -> dict[str, list[str]]:
+        """Принимает согласие и запоминает появившиеся после этого признаки.
+
+        Args:
+            page (Page): Открытая страница приложения.
+            accept (Callable[[], None]): Функция, принимающая согласие на странице.
+
+        Returns:
+            dict[str, list[str]]: Признаки, появившиеся на этой странице, в формате
+                `dump`; пустые списки, если признаки определить не удалось.
+        """
+        cookies_before, storage_before = self._snapshot(page)
+        accept()
+        cookies_after, storage_after = self._snapshot(page)
+
+        cookies = cookies_after - cookies_before
+        local_storage = storage_after - storage_before
+        self.cookies |= cookies
+        self.local_storage |= local_storage
+        if cookies or local_storage:
+            logger.info(
+                f"Признаки согласия на cookies: cookies {sorted(cookies)}, "
+                f"localStorage {sorted(local_storage)}"
+            )
+        else:
+            logger.warning("Не удалось определить признаки согласия на cookies")
+        return {"cookies": sorted(cookies), "local_storage": sorted(local_storage)}
+
+    def dump(self) -> dict[str, list[str]]:
+        """Возвращает признаки согласия в виде, пригодном для сохранения в JSON."""
+        return {
+            "cookies": sorted(self.cookies),
+            "local_storage": sorted(self.local_storage),
+        }
+
+    def load(self, data: dict[str, list[str]]) -> None:
+        """Добавляет признаки согласия, ранее сохраненные методом `dump`.
+
+        Args:
+            data (dict[str, list[str]]): Сохраненные признаки согласия.
+        """
+        self.cookies |= set(data.get("cookies", []))
+        self.local_storage |= set(data.get("local_storage", []))
+
+    def is_granted(self, page: Page) -> bool:
+        """Проверяет, что согласие на cookies уже дано в контексте страницы.
+
+        Args:
+            page (Page): Открытая страница приложения.
+
+        Returns:
+            bool: True, если все признаки согласия присутствуют.
+        """
+        if not self.has_markers:
+            return False
+
+        cookies, local_storage = self._snapshot(page)
+        return self.cookies <= cookies and self.local_storage <= local_storage
+
+
+# Глобальные признаки согласия на cookies
+cookie_consent = CookieConsent()
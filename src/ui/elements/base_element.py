@@ -13,14 +13,21 @@
 - Трекинг покрытия UI для анализа качества тестирования
 """
 
+from collections.abc import Callable, Sequence
 from typing import Self
 
 import allure
 from playwright.sync_api import Locator, Page, expect
 from ui_coverage_tool import ActionType, SelectorType
 
-from src.core.exceptions import LocatorNotFoundError
+from config import StepVerbosity
+from integrations.allure.artifacts import artifact_pipeline
+from integrations.allure.steps import step_recorder
+from src.core.exceptions import LocatorFormatError, LocatorNotFoundError
+from src.ui.elements.locator_cache import locator_cache
 from src.ui.elements.ui_coverage import tracker
+from src.ui.styles import StyleValues, read_all_styles, read_styles, wait_for_style_change
+from src.ui.waits import DEFAULT_TIMEOUT_MS
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -40,6 +47,8 @@ class BaseElement:
     Methods:
         get_locator: Получает локатор элемента.
         click: Выполняет клик по элементу.
+        hover: Наводит курсор на элемент.
+        get_styles: Читает вычисленные свойства стиля элемента.
         check_visible: Проверяет видимость элемента.
         check_have_text: Проверяет, что элемент содержит ожидаемый текст.
     """
@@ -59,6 +68,7 @@ class BaseElement:
         self.locator_path = locator_path
         self.name = name
         self.use_xpath = use_xpath
+        self._raw_locators: dict[tuple, str] = {}
 
     @classmethod
     def by_test_id(cls, page: Page, test_id: str, name: str) -> Self:
@@ -100,24 +110,61 @@ class BaseElement:
     def get_locator(self, nth: int = 0, **kwargs) -> Locator:
         """Возвращает локатор элемента, используя переданные параметры для форматирования пути.
 
+        Локатор берется из кеша страницы (`locator_cache`). Шаг Allure создается
+        только при создании локатора и только с детализацией `StepVerbosity.DEBUG`.
+
         Args:
             nth (int): Индекс элемента, если на странице несколько одинаковых элементов.
             **kwargs: Параметры для форматирования локатора.
 
         Returns:
             Locator: Локатор элемента на странице.
+
+        Raises:
+            LocatorFormatError: Если для шаблона пути не хватает параметров.
         """
-        formatted_selector = self.locator_path.format(**kwargs)
-        step = f"Получение локатора '{formatted_selector}' с индексом' {nth}'"
+        return self._cached_locator(nth, kwargs, lambda: self._resolve_locator(nth, **kwargs))
+
+    def format_selector(self, **kwargs) -> str:
+        """Подставляет параметры в шаблон пути локатора.
+
+        Args:
+            **kwargs: Параметры для форматирования локатора.
+
+        Returns:
+            str: Отформатированный путь локатора.
 
-        with allure.step(step):
+        Raises:
+            LocatorFormatError: Если для шаблона пути не хватает параметров.
+        """
+        try:
+            return self.locator_path.format(**kwargs)
+        except (KeyError, IndexError) as e:
+            raise LocatorFormatError(
+                f"Не удалось сформировать локатор '{self.name}' из '{self.locator_path}': {e}"
+            ) from e
+
+    def _cached_locator(
+        self, nth: int | None, kwargs: dict, resolve: Callable[[], Locator]
+    ) -> Locator:
+        try:
+            key = (self.locator_path, self.use_xpath, nth, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Нехешируемые параметры форматирования кешировать нельзя
+            return resolve()
+
+        return locator_cache.get(self.page, key, resolve)
+
+    def _resolve_locator(self, nth: int = 0, **kwargs) -> Locator:
+        formatted_selector = self.format_selector(**kwargs)
+
+        step = f"Получение локатора '{formatted_selector}' с индексом {nth}"
+        with step_recorder.step(step, StepVerbosity.DEBUG):
             try:
                 if self.use_xpath:
-                    locator = self.page.locator(formatted_selector).nth(nth)
-                else:
-                    locator = self.page.get_by_test_id(locator).nth(nth)
-
-                return locator
+                    return self.page.locator(formatted_selector).nth(nth)
+                return self.page.get_by_test_id(formatted_selector).nth(nth)
 
             except Exception as e:
                 error_msg = f"Элемент '{self.name}' не найден по {formatted_selector}"
@@ -125,7 +172,7 @@ class BaseElement:
                 logger.exception("Детали ошибки:")
 
                 # Скриншот для отладки
-                allure.attach(
+                artifact_pipeline.attach_bytes(
                     self.page.screenshot(),
                     name=f"element_not_found_{self.name}",
                     attachment_type=allure.attachment_type.PNG,
@@ -133,6 +180,28 @@ class BaseElement:
 
                 raise LocatorNotFoundError(error_msg) from e
 
+    def get_all_locator(self, **kwargs) -> Locator:
+        """Возвращает локатор всех элементов, найденных по пути локатора, без индекса.
+
+        Локатор берется из кеша страницы (`locator_cache`) так же, как в `get_locator`.
+
+        Args:
+            **kwargs: Параметры для форматирования локатора.
+
+        Returns:
+            Locator: Локатор всех подходящих элементов на странице.
+
+        Raises:
+            LocatorFormatError: Если для шаблона пути не хватает параметров.
+        """
+        return self._cached_locator(None, kwargs, lambda: self._resolve_all_locator(**kwargs))
+
+    def _resolve_all_locator(self, **kwargs) -> Locator:
+        formatted_selector = self.format_selector(**kwargs)
+        if self.use_xpath:
+            return self.page.locator(formatted_selector)
+        return self.page.get_by_test_id(formatted_selector)
+
     def get_raw_locator(self, nth: int = 0, **kwargs) -> str:
         """Возвращает строковый путь локатора элемента.
 
@@ -144,8 +213,11 @@ class BaseElement:
 
         Returns:
             str: Строковый путь локатора.
+
+        Raises:
+            LocatorFormatError: Если для шаблона пути не хватает параметров.
         """
-        formatted_selector = self.locator_path.format(**kwargs)
+        formatted_selector = self.format_selector(**kwargs)
 
         if self.use_xpath:
             return formatted_selector
@@ -153,17 +225,28 @@ class BaseElement:
         return f"//*[@data-testid='{formatted_selector}'][{nth + 1}]"
 
     def track_coverage(self, action_type: ActionType, nth: int = 0, **kwargs) -> None:
-        """Отправляет информацию о выполнении действия в трекер.
+        """Отправляет информацию о выполнении действия в буфер трекера покрытия.
+
+        Строковый путь локатора вычисляется один раз для каждого набора параметров.
 
         Args:
             action_type (ActionType): Тип действия (клик, ввод, проверка).
             nth (int): Индекс элемента.
             **kwargs: Дополнительные аргументы для форматирования локатора.
         """
+        try:
+            key = (nth, tuple(sorted(kwargs.items())))
+            selector = self._raw_locators.get(key)
+        except TypeError:
+            key, selector = None, None
+
+        if selector is None:
+            selector = self.get_raw_locator(nth=nth, **kwargs)
+            if key is not None:
+                self._raw_locators[key] = selector
+
         tracker.track_coverage(
-            selector=self.get_raw_locator(nth=nth, **kwargs),
-            action_type=action_type,
-            selector_type=SelectorType.XPATH,
+            selector=selector, action_type=action_type, selector_type=SelectorType.XPATH
         )
 
     def click(self, nth: int = 0, **kwargs) -> None:
@@ -174,12 +257,81 @@ class BaseElement:
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Клик по {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).click()
 
         self.track_coverage(ActionType.CLICK, nth, **kwargs)
 
+    def hover(self, nth: int = 0, **kwargs) -> Self:
+        """Наводит курсор на элемент.
+
+        Args:
+            nth (int): Индекс элемента, если на странице несколько одинаковых элементов.
+            **kwargs: Дополнительные параметры для форматирования локатора.
+
+        Returns:
+            Self: Экземпляр текущего объекта для цепочки вызовов.
+        """
+        step = f"Наведение курсора на {self.type_of} '{self.name}'"
+        with step_recorder.step(step):
+            logger.info(step)
+            self.get_locator(nth, **kwargs).hover()
+
+        self.track_coverage(ActionType.HOVER, nth, **kwargs)
+        return self
+
+    def get_styles(self, properties: Sequence[str], nth: int = 0, **kwargs) -> StyleValues:
+        """Читает вычисленные свойства стиля элемента за одно обращение к браузеру.
+
+        Args:
+            properties (Sequence[str]): Имена свойств (`background-color` или `backgroundColor`).
+            nth (int): Индекс элемента, если на странице несколько одинаковых элементов.
+            **kwargs: Дополнительные параметры для форматирования локатора.
+
+        Returns:
+            StyleValues: Значения свойств по имени.
+        """
+        return read_styles(self.get_locator(nth, **kwargs), properties)
+
+    def get_all_styles(self, properties: Sequence[str], **kwargs) -> list[StyleValues]:
+        """Читает вычисленные свойства стиля всех подходящих элементов за одно обращение.
+
+        Args:
+            properties (Sequence[str]): Имена свойств (`background-color` или `backgroundColor`).
+            **kwargs: Дополнительные параметры для форматирования локатора.
+
+        Returns:
+            list[StyleValues]: Значения свойств каждого элемента в порядке документа.
+        """
+        return read_all_styles(self.get_all_locator(**kwargs), properties)
+
+    def wait_for_style_change(
+        self,
+        before: StyleValues,
+        nth: int = 0,
+        timeout: float = DEFAULT_TIMEOUT_MS,
+        **kwargs,
+    ) -> StyleValues:
+        """Ждет, пока хотя бы одно из свойств стиля `before` изменится.
+
+        Ожидание выполняется в браузере за одно обращение и завершается после
+        окончания CSS-переходов элемента, поэтому возвращаются итоговые значения.
+
+        Args:
+            before (StyleValues): Исходные значения свойств (результат `get_styles`).
+            nth (int): Индекс элемента, если на странице несколько одинаковых элементов.
+            timeout (float): Максимальное время ожидания в мс.
+            **kwargs: Дополнительные параметры для форматирования локатора.
+
+        Returns:
+            StyleValues: Новые значения свойств.
+
+        Raises:
+            TimeoutError: Если свойства не изменились за `timeout`.
+        """
+        return wait_for_style_change(self.get_locator(nth, **kwargs), before, timeout)
+
     def check_visible(self, nth: int = 0, **kwargs) -> Self:
         """Проверяет, что элемент отображается на странице.
 
@@ -187,7 +339,7 @@ class BaseElement:
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' видим"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).to_be_visible()
 
@@ -203,7 +355,7 @@ class BaseElement:
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' имеет текст '{text}'"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).to_contain_text(text)
 
@@ -220,7 +372,7 @@ class BaseElement:
         step = (
             f"Проверка, что {self.type_of} '{self.name}' содкржит класс '{class_name}'"
         )
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).to_have_class(class_name)
 
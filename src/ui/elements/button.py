@@ -1,9 +1,10 @@
 from typing import Self
 
-import allure
 from playwright.sync_api import expect
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
 from src.utils.logger import get_logger
 
@@ -30,7 +31,7 @@ class Button(BaseElement):
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что  {self.type_of} '{self.name}' доступна для нажатия"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             expect(locator).to_be_enabled()
@@ -46,7 +47,7 @@ class Button(BaseElement):
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' недоступна для нажатия"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             expect(locator).to_be_disabled()
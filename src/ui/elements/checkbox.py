@@ -1,9 +1,10 @@
 from typing import Self
 
-import allure
 from playwright.sync_api import expect
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
 from src.utils.logger import get_logger
 
@@ -38,7 +39,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' выбран"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).to_be_checked()
 
@@ -55,7 +56,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' не выбран"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).not_to_be_checked()
 
@@ -74,7 +75,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Выбор {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).check()
 
@@ -94,7 +95,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Снятие выбора с {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).uncheck()
         self.track_coverage(ActionType.UNCHECKED, nth, **kwargs)
@@ -114,7 +115,7 @@ class Checkbox(BaseElement):
             str: Текст метки чекбокса.
         """
         step = f"Получение текста метки для {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.DEBUG):
             logger.info(step)
             text = self.get_locator(nth, **kwargs).get_attribute("aria-label").strip()
             logger.info(f"Текст метки: '{text}'")
@@ -134,7 +135,7 @@ class Checkbox(BaseElement):
         step = (
             f"Проверка ARIA-атрибута aria-checked='{expected_value}' у {self.type_of} '{self.name}'"
         )
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             logger.info(step)
             expect(self.get_locator(nth, **kwargs)).to_have_attribute(
                 "aria-checked", expected_value
@@ -152,7 +153,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Наведение курсора на {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).hover()
         return self
@@ -168,7 +169,7 @@ class Checkbox(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Фокусировка на {self.type_of} '{self.name}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).focus()
         return self
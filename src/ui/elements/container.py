@@ -1,9 +1,12 @@
 from typing import Self
 
-import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
+from src.ui.waits import wait_for_dom_quiet
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -37,9 +40,15 @@ class Container(BaseElement):
             f" не должно превышать {expected_max_count}"
         )
 
-        with allure.step(step_description):
+        with step_recorder.step(step_description, StepVerbosity.CHECKS):
             container = self.get_locator(nth, **kwargs)
-            container.page.wait_for_timeout(5000)
+            # Дожидаемся окончания перерисовки списка после фильтрации. Ждем только
+            # затихания DOM: фоновый трафик (аналитика, long polling) на перерисовку
+            # не влияет, но не дал бы странице затихнуть целиком
+            try:
+                wait_for_dom_quiet(container.page)
+            except PlaywrightTimeoutError:
+                logger.warning(f"DOM не затих перед подсчетом элементов {self.name}")
             actual_count = container.locator(inner_item_path).count()
             logger.info(
                 step_description + f", актуальное количество элементов: {actual_count}"
@@ -1,9 +1,10 @@
 from typing import Self
 
-import allure
 from playwright.sync_api import expect
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
 from src.utils.logger import get_logger
 
@@ -35,7 +36,7 @@ class Input(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Заполняем {self.type_of} '{self.name}' значением: '{value}'"
-        with allure.step(step):
+        with step_recorder.step(step):
             logger.info(step)
             self.get_locator(nth, **kwargs).fill(value)
 
@@ -51,7 +52,7 @@ class Input(BaseElement):
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' имеет значение '{value}'"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             expect(locator).to_have_value(value)
@@ -69,7 +70,7 @@ class Input(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Очищение {self.type_of} '{self.name}' от содержимого"
-        with allure.step(step):
+        with step_recorder.step(step):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             locator.clear()
@@ -99,7 +100,7 @@ class Input(BaseElement):
             Self: Экземпляр текущего объекта для цепочки вызовов.
         """
         step = f"Заполнение {self.type_of} '{self.name}' значением {text} с задержкой {delay}"
-        with allure.step(step):
+        with step_recorder.step(step):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             locator.type(
@@ -1,9 +1,10 @@
 from typing import Self
 
-import allure
 from playwright.sync_api import Download, expect
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
 from src.utils.logger import get_logger
 
@@ -21,7 +22,7 @@ class Link(BaseElement):
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' активна"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             expect(locator).to_be_enabled()
@@ -37,7 +38,7 @@ class Link(BaseElement):
             **kwargs: Дополнительные параметры для форматирования локатора.
         """
         step = f"Проверка, что {self.type_of} '{self.name}' неактивна"
-        with allure.step(step):
+        with step_recorder.step(step, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
             logger.info(step)
             expect(locator).to_be_disabled()
@@ -62,14 +63,14 @@ class Link(BaseElement):
         check_file_name_step = (
             f"Проверяем соответствие имени файла ожидаемому '{file_name}'"
         )
-        with allure.step(check_file_name_step):
+        with step_recorder.step(check_file_name_step, StepVerbosity.CHECKS):
             logger.info(check_file_name_step)
             assert (
                 file_name == downloaded_file_name
             ), f"Название '{downloaded_file_name}' не соответствует ожидаемому '{file_name}'"
 
         is_empty_file_step = f"Проверяем, что файл '{downloaded_file_name}' не пустой"
-        with allure.step(is_empty_file_step):
+        with step_recorder.step(is_empty_file_step, StepVerbosity.CHECKS):
             logger.info(is_empty_file_step)
             file_path = download.path()
             file_size = file_path.stat().st_size
@@ -0,0 +1,123 @@
+"""Кеш разрешенных локаторов элементов.
+
+`BaseElement.get_locator` вызывается многократно для одного и того же элемента:
+в каждой проверке и при чтении данных списков (например, по несколько раз
+на карточку вакансии). Локаторы Playwright ленивые и не обращаются к странице
+при создании, поэтому готовый объект `Locator` можно переиспользовать.
+Кеш ведется отдельно для каждой страницы и очищается при навигации
+основного фрейма, чтобы локаторы не переживали смену документа.
+"""
+
+from collections.abc import Callable, Hashable
+import threading
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Frame, Locator, Page
+
+from config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+class LocatorCacheStats:
+    """Статистика обращений к кешу локаторов.
+
+    Attributes:
+        hits (int): Количество локаторов, взятых из кеша.
+        misses (int): Количество созданных локаторов.
+        invalidations (int): Количество очисток кеша при навигации.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустую статистику."""
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def summary(self) -> str:
+        """Возвращает сводку по кешу в читаемом виде."""
+        total = self.hits + self.misses
+        if not total:
+            return "нет данных"
+        return (
+            f"обращений: {total}, из кеша: {self.hits} ({self.hits / total:.0%}), "
+            f"очисток при навигации: {self.invalidations}"
+        )
+
+
+class LocatorCache:
+    """Кеш объектов `Locator` по страницам.
+
+    Ключом служит кортеж (шаблон пути, способ поиска, индекс или None для
+    локатора всех совпадений, параметры форматирования). Страницы хранятся
+    по слабым ссылкам и не удерживают закрытые страницы в памяти.
+
+    Attributes:
+        stats (LocatorCacheStats): Статистика обращений к кешу.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой кеш."""
+        self.stats = LocatorCacheStats()
+        self._pages: WeakKeyDictionary[Page, dict[Hashable, Locator]] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _page_cache(self, page: Page) -> dict[Hashable, Locator]:
+        cache = self._pages.get(page)
+        if cache is not None:
+            return cache
+
+        with self._lock:
+            cache = self._pages.get(page)
+            if cache is None:
+                cache = self._pages[page] = {}
+                page.on("framenavigated", lambda frame: self._on_navigated(page, frame))
+        return cache
+
+    def _on_navigated(self, page: Page, frame: Frame) -> None:
+        if frame.parent_frame is not None:
+            return
+        cache = self._pages.get(page)
+        if cache:
+            cache.clear()
+            self.stats.invalidations += 1
+
+    def get(self, page: Page, key: Hashable, factory: Callable[[], Locator]) -> Locator:
+        """Возвращает локатор из кеша страницы или создает и кеширует его.
+
+        Args:
+            page (Page): Страница, которой принадлежит локатор.
+            key (Hashable): Ключ локатора.
+            factory (Callable[[], Locator]): Функция создания локатора.
+
+        Returns:
+            Locator: Локатор элемента на странице.
+        """
+        if not settings.ui.locator_cache:
+            return factory()
+
+        cache = self._page_cache(page)
+        locator = cache.get(key)
+        if locator is None:
+            self.stats.misses += 1
+            locator = cache[key] = factory()
+        else:
+            self.stats.hits += 1
+        return locator
+
+    def clear(self, page: Page | None = None) -> None:
+        """Очищает кеш страницы или всех страниц.
+
+        Args:
+            page (Page | None): Страница; если не указана, очищается кеш всех страниц.
+        """
+        if page is None:
+            for cache in self._pages.values():
+                cache.clear()
+        elif page in self._pages:
+            self._pages[page].clear()
+
+
+# Глобальный кеш локаторов воркера
+locator_cache = LocatorCache()
@@ -1,9 +1,10 @@
 import re
 
-import allure
 from playwright.sync_api import expect
 from ui_coverage_tool import ActionType
 
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
 from src.ui.elements.base_element import BaseElement
 from src.utils.logger import get_logger
 
@@ -25,7 +26,7 @@ class Tab(BaseElement):
         """
         step_description = f"Проверка: таб '{self.name}' активен (имеет класс 'q-tab--active')."
 
-        with allure.step(step_description):
+        with step_recorder.step(step_description, StepVerbosity.CHECKS):
             locator = self.get_locator(nth, **kwargs)
 
             try:
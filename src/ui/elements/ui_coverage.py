@@ -1,3 +1,3 @@
-from ui_coverage_tool import UICoverageTracker
+from integrations.coverage.tracker import BufferedCoverageTracker
 
-tracker = UICoverageTracker("cism-ms")
+tracker = BufferedCoverageTracker("cism-ms")
@@ -36,3 +36,11 @@ class VacancyFiltersMenuLocators:
         selector="//div[normalize-space(text()) = '{group_title}']/following-sibling::div[@role='group'][1]",
         description="Группа чекбоксов, следующая за заголовком '{group_title}'",
     )
+    CHECKBOX_GROUPS = UILocator(
+        selector="//div[contains(@class,'q-menu')]//div[@role='group']",
+        description="Группы чекбоксов в меню фильтров",
+    )
+    CHECKBOX_GROUP_TITLE = UILocator(
+        selector="./preceding-sibling::div[not(@role='group')][1]",
+        description="Заголовок группы чекбоксов",
+    )
@@ -5,7 +5,9 @@ from playwright.sync_api import Page, expect
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
+from src.ui.consent import cookie_consent
 from src.ui.locators.cookies import CookiesLocators
+from src.ui.waits import wait_for_page_settled
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__.upper())
@@ -44,11 +46,20 @@ class BasePage:
             if accept_button.is_visible():
                 accept_button.click()
                 logger.info("Куки приняты")
-                self.page.wait_for_timeout(1000)
+                cookies_dialog.wait_for(state="hidden")
+                try:
+                    wait_for_page_settled(self.page)
+                except PlaywrightTimeoutError:
+                    # Непрерывный фоновый трафик (аналитика, long polling) не дает
+                    # странице затихнуть; диалог уже скрыт, поэтому это не ошибка
+                    logger.warning("Страница не затихла после принятия куки, продолжаем")
 
     def visit(self, url: str) -> None:
         """Открывает указанную URL-страницу и ждет завершения загрузки.
 
+        Если согласие на cookies уже дано в контексте браузера (например, загружено
+        из файла состояния), проверка диалога cookies пропускается.
+
         Args:
             url (str): Адрес страницы, на которую нужно перейти.
         """
@@ -56,6 +67,12 @@ class BasePage:
         with allure.step(step):
             logger.info(step)
             self.page.goto(url, wait_until="networkidle", timeout=50000)
+            if cookie_consent.is_granted(self.page):
+                cookie_consent.stats.skipped += 1
+                logger.debug("Согласие на cookies уже дано, проверка диалога пропущена")
+                return
+
+            cookie_consent.stats.performed += 1
             try:
                 self.accept_cookies_if_present()
             except PlaywrightTimeoutError as e:
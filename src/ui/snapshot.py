@@ -0,0 +1,631 @@
+"""Снимки состояния компонентов: одно чтение DOM на много проверок.
+
+Каждый вызов `expect(...)` Playwright - отдельный цикл опроса страницы, и проверка
+компонента из десятка элементов стоит десятка обращений к браузеру. Модуль
+собирает состояние всех проверяемых элементов (количество совпадений, видимость,
+текст, классы, атрибуты, значение поля ввода) одним вызовом `page.evaluate` и проверяет условия на
+полученном снимке в памяти. Снимок повторяется, только если какое-то условие
+не выполнено, с теми же интервалами и таймаутом, что и у `expect`.
+
+Условия создаются функциями модуля (`visible`, `contains_text`, `checked` и др.)
+и проверяются `assert_snapshot` или `BaseComponent.check_snapshot`:
+
+    component.check_snapshot(
+        visible(component.logo),
+        contains_text(component.info, "ИНН: 9709037529"),
+    )
+
+Условия нескольких компонентов можно собрать в `expect_all` (мягкие проверки):
+они проверяются вместе при выходе из блока в одном цикле опроса с общим таймаутом,
+а в ошибке перечисляются все невыполненные условия:
+
+    with expect_all(page, "Проверка страницы вакансий") as soft:
+        soft.add(*navbar.visible_checks())
+        soft.add(*footer.visible_checks())
+
+Синтаксически неверный селектор не ждет таймаута: остальные условия проверяются
+как обычно, а затем выбрасывается `InvalidSelectorError` со списком неверных
+селекторов и невыполненных условий.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+import json
+import re
+from re import Pattern
+import time
+from typing import Any, NamedTuple, Self
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+from ui_coverage_tool import ActionType
+
+from config import StepVerbosity
+from integrations.allure.steps import step_recorder
+from src.core.exceptions import InvalidSelectorError
+from src.ui.elements.base_element import BaseElement
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Таймаут и интервалы повторных снимков, как у expect Playwright
+DEFAULT_TIMEOUT_MS = 5000
+POLL_INTERVALS_MS = (100, 250, 500, 1000)
+
+# Как в page.locator: селектор, начинающийся с "/", "..", "./" или "(", - XPath
+_XPATH_PREFIX_RE = re.compile(r"^(?:/|\.\.|\./|\()")
+
+# Собирает состояние элементов за один вызов. Для каждого элемента передаются
+# селектор, индекс среди совпадений и признак XPath. Для синтаксически неверного
+# селектора вместо состояния возвращается текст ошибки: повтор снимка ее не исправит.
+# Текст нормализуется так же, как в проверках текста Playwright.
+_CAPTURE_JS = """
+(targets) => {
+  const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+  const query = (selector, xpath) => {
+    if (!xpath) {
+      return Array.from(document.querySelectorAll(selector));
+    }
+    const result = document.evaluate(
+      selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+  };
+  const isVisible = (el) => {
+    if (getComputedStyle(el).visibility !== "visible") return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+  };
+  return targets.map(([selector, nth, xpath]) => {
+    let nodes;
+    try {
+      nodes = query(selector, xpath);
+    } catch (error) {
+      if (error instanceof DOMException || error instanceof SyntaxError) return error.message;
+      throw error;
+    }
+    const el = nodes[nth];
+    if (!el) return [nodes.length, false, "", [], {}, null];
+    const attributes = Object.fromEntries(
+      el.getAttributeNames().map((name) => [name, el.getAttribute(name)])
+    );
+    return [
+      nodes.length, isVisible(el), normalize(el.textContent), Array.from(el.classList), attributes,
+      typeof el.value === "string" ? el.value : null,
+    ];
+  });
+}
+"""
+
+
+def is_xpath_selector(selector: str) -> bool:
+    """Проверяет, что селектор будет разобран как XPath, как это делает `page.locator`."""
+    return _XPATH_PREFIX_RE.match(selector.lstrip()) is not None
+
+
+class SnapshotTarget(NamedTuple):
+    """Элемент снимка: селектор и индекс среди совпадений.
+
+    Attributes:
+        selector (str): Отформатированный селектор элемента (XPath или CSS).
+        nth (int): Индекс элемента среди совпадений.
+        xpath (bool): Селектор - XPath.
+    """
+
+    selector: str
+    nth: int
+    xpath: bool = False
+
+    @classmethod
+    def of(cls, element: BaseElement, nth: int = 0, **kwargs) -> "SnapshotTarget":
+        """Создает элемент снимка по элементу интерфейса.
+
+        Args:
+            element (BaseElement): Элемент интерфейса.
+            nth (int): Индекс элемента, если на странице несколько одинаковых элементов.
+            **kwargs: Параметры для форматирования локатора.
+
+        Raises:
+            LocatorFormatError: Если для шаблона пути не хватает параметров.
+        """
+        selector = element.format_selector(**kwargs)
+        if not element.use_xpath:
+            selector = f"[data-testid={json.dumps(selector, ensure_ascii=False)}]"
+            return cls(selector=selector, nth=nth)
+        return cls(selector=selector, nth=nth, xpath=is_xpath_selector(selector))
+
+
+class ElementState(NamedTuple):
+    """Состояние элемента в снимке.
+
+    Attributes:
+        count (int): Количество элементов, найденных по селектору.
+        visible (bool): Элемент виден (как в `to_be_visible`).
+        text (str): Текст элемента с нормализованными пробелами.
+        classes (tuple[str, ...]): Классы элемента.
+        attributes (dict[str, str]): Атрибуты элемента.
+        value (str | None): Значение поля ввода; None, если у элемента нет значения.
+    """
+
+    count: int
+    visible: bool
+    text: str
+    classes: tuple[str, ...]
+    attributes: dict[str, str]
+    value: str | None
+
+    def describe(self) -> str:
+        """Возвращает состояние элемента в читаемом виде для сообщений об ошибках."""
+        return (
+            f"найдено {self.count}, видим: {self.visible}, текст: '{self.text}', "
+            f"классы: {' '.join(self.classes) or '-'}"
+            + ("" if self.value is None else f", значение: '{self.value}'")
+        )
+
+
+class ComponentSnapshot:
+    """Снимок состояния элементов компонента.
+
+    Attributes:
+        states (dict[SnapshotTarget, ElementState]): Состояния элементов.
+        errors (dict[SnapshotTarget, str]): Ошибки разбора неверных селекторов.
+        taken_at (float): Время снимка по `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        states: dict[SnapshotTarget, ElementState],
+        errors: dict[SnapshotTarget, str] | None = None,
+    ) -> None:
+        """Инициализирует снимок.
+
+        Args:
+            states (dict[SnapshotTarget, ElementState]): Состояния элементов.
+            errors (dict[SnapshotTarget, str] | None): Ошибки разбора неверных селекторов.
+        """
+        self.states = states
+        self.errors = errors or {}
+        self.taken_at = time.monotonic()
+
+    def state(self, element: BaseElement, nth: int = 0, **kwargs) -> ElementState:
+        """Возвращает состояние элемента из снимка.
+
+        Args:
+            element (BaseElement): Элемент интерфейса.
+            nth (int): Индекс элемента.
+            **kwargs: Параметры для форматирования локатора.
+
+        Raises:
+            InvalidSelectorError: Если селектор элемента синтаксически неверен.
+            KeyError: Если элемент не входил в снимок.
+        """
+        target = SnapshotTarget.of(element, nth, **kwargs)
+        if target in self.errors:
+            raise InvalidSelectorError(
+                f"Неверный селектор '{target.selector}': {self.errors[target]}"
+            )
+        return self.states[target]
+
+
+class SnapshotCheck(NamedTuple):
+    """Условие, проверяемое на снимке.
+
+    Attributes:
+        element (BaseElement): Проверяемый элемент.
+        target (SnapshotTarget): Элемент снимка.
+        description (str): Описание условия для шагов и сообщений об ошибках.
+        predicate (Callable[[ElementState], bool]): Условие на состояние элемента.
+        action_type (ActionType): Тип действия для трекера покрытия.
+        nth (int): Индекс элемента.
+        kwargs (dict[str, Any]): Параметры для форматирования локатора.
+    """
+
+    element: BaseElement
+    target: SnapshotTarget
+    description: str
+    predicate: Callable[[ElementState], bool]
+    action_type: ActionType
+    nth: int
+    kwargs: dict[str, Any]
+
+
+class SnapshotStats:
+    """Статистика проверок на снимках.
+
+    Attributes:
+        snapshots (int): Количество сделанных снимков.
+        checks (int): Количество проверенных условий.
+        retries (int): Количество повторных снимков из-за невыполненных условий.
+        failures (int): Количество проверок, не прошедших за таймаут.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует нулевые счетчики."""
+        self.snapshots = 0
+        self.checks = 0
+        self.retries = 0
+        self.failures = 0
+
+    def summary(self) -> str:
+        """Возвращает сводку статистики в читаемом виде."""
+        if not self.snapshots:
+            return "нет данных"
+        return (
+            f"снимков: {self.snapshots}, условий: {self.checks}, "
+            f"повторов: {self.retries}, не прошло: {self.failures}"
+        )
+
+
+# Глобальная статистика снимков воркера
+snapshot_stats = SnapshotStats()
+
+
+def _check(
+    element: BaseElement,
+    description: str,
+    predicate: Callable[[ElementState], bool],
+    action_type: ActionType,
+    nth: int,
+    kwargs: dict[str, Any],
+) -> SnapshotCheck:
+    return SnapshotCheck(
+        element=element,
+        target=SnapshotTarget.of(element, nth, **kwargs),
+        description=f"{element.type_of} '{element.name}' {description}",
+        predicate=predicate,
+        action_type=action_type,
+        nth=nth,
+        kwargs=kwargs,
+    )
+
+
+def _matches(actual: str, expected: str | Pattern[str], ignore_case: bool) -> bool:
+    if isinstance(expected, Pattern):
+        return expected.search(actual) is not None
+    if ignore_case:
+        return actual.lower() == expected.lower()
+    return actual == expected
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def visible(element: BaseElement, nth: int = 0, **kwargs) -> SnapshotCheck:
+    """Условие: элемент виден."""
+    return _check(
+        element, "видим", lambda state: state.visible, ActionType.VISIBLE, nth, kwargs
+    )
+
+
+def hidden(element: BaseElement, nth: int = 0, **kwargs) -> SnapshotCheck:
+    """Условие: элемент не виден или отсутствует."""
+    return _check(
+        element, "скрыт", lambda state: not state.visible, ActionType.HIDDEN, nth, kwargs
+    )
+
+
+def has_text(
+    element: BaseElement,
+    text: str | Pattern[str],
+    ignore_case: bool = False,
+    nth: int = 0,
+    **kwargs,
+) -> SnapshotCheck:
+    """Условие: текст элемента совпадает с ожидаемым (или с регулярным выражением)."""
+    expected = text if isinstance(text, Pattern) else _normalize(text)
+    description = f"имеет текст '{getattr(text, 'pattern', text)}'"
+    return _check(
+        element,
+        description,
+        lambda state: _matches(state.text, expected, ignore_case),
+        ActionType.TEXT,
+        nth,
+        kwargs,
+    )
+
+
+def contains_text(element: BaseElement, text: str, nth: int = 0, **kwargs) -> SnapshotCheck:
+    """Условие: элемент содержит текст."""
+    expected = _normalize(text)
+    return _check(
+        element,
+        f"содержит текст '{text}'",
+        lambda state: expected in state.text,
+        ActionType.TEXT,
+        nth,
+        kwargs,
+    )
+
+
+def contains_class(
+    element: BaseElement, class_name: str | Pattern[str], nth: int = 0, **kwargs
+) -> SnapshotCheck:
+    """Условие: элемент имеет класс (или класс, подходящий под регулярное выражение)."""
+    if isinstance(class_name, Pattern):
+        return _check(
+            element,
+            f"содержит класс '{class_name.pattern}'",
+            lambda state: class_name.search(" ".join(state.classes)) is not None,
+            ActionType.VISIBLE,
+            nth,
+            kwargs,
+        )
+    return _check(
+        element,
+        f"содержит класс '{class_name}'",
+        lambda state: class_name in state.classes,
+        ActionType.VISIBLE,
+        nth,
+        kwargs,
+    )
+
+
+def has_attribute(
+    element: BaseElement, name: str, value: str | None = None, nth: int = 0, **kwargs
+) -> SnapshotCheck:
+    """Условие: у элемента есть атрибут (и, если задано, с указанным значением)."""
+    if value is None:
+        return _check(
+            element,
+            f"имеет атрибут '{name}'",
+            lambda state: name in state.attributes,
+            ActionType.VISIBLE,
+            nth,
+            kwargs,
+        )
+    return _check(
+        element,
+        f"имеет атрибут {name}='{value}'",
+        lambda state: state.attributes.get(name) == value,
+        ActionType.VISIBLE,
+        nth,
+        kwargs,
+    )
+
+
+def has_value(element: BaseElement, value: str, nth: int = 0, **kwargs) -> SnapshotCheck:
+    """Условие: значение поля ввода совпадает с ожидаемым."""
+    return _check(
+        element,
+        f"имеет значение '{value}'",
+        lambda state: state.value == value,
+        ActionType.VALUE,
+        nth,
+        kwargs,
+    )
+
+
+def checked(element: BaseElement, value: bool = True, nth: int = 0, **kwargs) -> SnapshotCheck:
+    """Условие: чекбокс (`aria-checked`) отмечен или, при `value=False`, не отмечен."""
+    return _check(
+        element,
+        "выбран" if value else "не выбран",
+        lambda state: (
+            state.count > nth and (state.attributes.get("aria-checked") == "true") == value
+        ),
+        ActionType.CHECKED if value else ActionType.UNCHECKED,
+        nth,
+        kwargs,
+    )
+
+
+def has_count(element: BaseElement, count: int, **kwargs) -> SnapshotCheck:
+    """Условие: по локатору элемента найдено ровно `count` элементов."""
+    return _check(
+        element,
+        f"найден {count} раз",
+        lambda state: state.count == count,
+        ActionType.VISIBLE,
+        0,
+        kwargs,
+    )
+
+
+def capture_snapshot(page: Page, targets: Iterable[SnapshotTarget]) -> ComponentSnapshot:
+    """Собирает состояние элементов одним вызовом `page.evaluate`.
+
+    Args:
+        page (Page): Страница браузера.
+        targets (Iterable[SnapshotTarget]): Элементы снимка.
+
+    Returns:
+        ComponentSnapshot: Снимок состояния элементов.
+    """
+    targets = list(dict.fromkeys(targets))
+    raw_states = page.evaluate(_CAPTURE_JS, [list(target) for target in targets])
+    snapshot_stats.snapshots += 1
+    states, errors = {}, {}
+    for target, raw_state in zip(targets, raw_states, strict=True):
+        if isinstance(raw_state, str):
+            errors[target] = raw_state
+            continue
+        count, visible, text, classes, attributes, value = raw_state
+        states[target] = ElementState(count, visible, text, tuple(classes), attributes, value)
+    return ComponentSnapshot(states, errors)
+
+
+def poll_snapshot(
+    page: Page, checks: Iterable[SnapshotCheck], timeout: float = DEFAULT_TIMEOUT_MS
+) -> tuple[ComponentSnapshot, list[SnapshotCheck]]:
+    """Делает снимки, пока все условия не выполнятся или не истечет таймаут.
+
+    Первый снимок делается сразу; повторный - только если какое-то условие
+    не выполнено, с интервалами `POLL_INTERVALS_MS`. Ошибка снимка во время
+    навигации (контекст выполнения страницы уничтожен) считается неудачной
+    попыткой: снимок повторяется до истечения таймаута. Условия с синтаксически
+    неверными селекторами не повторяются и не считаются невыполненными: ошибки
+    их селекторов накапливаются в `errors` последнего снимка.
+
+    Args:
+        page (Page): Страница браузера.
+        checks (Iterable[SnapshotCheck]): Проверяемые условия.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Returns:
+        tuple[ComponentSnapshot, list[SnapshotCheck]]: Последний снимок
+            и условия с верными селекторами, не выполненные на нем.
+
+    Raises:
+        PlaywrightError: Если снимок не удалось сделать до истечения таймаута.
+    """
+    checks = list(checks)
+    targets = [check.target for check in checks]
+    errors: dict[SnapshotTarget, str] = {}
+    deadline = time.monotonic() + timeout / 1000
+    intervals = iter(POLL_INTERVALS_MS)
+    while True:
+        try:
+            snapshot = capture_snapshot(page, targets)
+        except PlaywrightError as error:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                raise
+            logger.debug(f"Снимок не сделан, повтор: {error.message}")
+        else:
+            if snapshot.errors:
+                errors.update(snapshot.errors)
+                targets = [target for target in targets if target not in errors]
+            snapshot.errors = dict(errors)
+            failed = [
+                check
+                for check in checks
+                if check.target not in errors and not check.predicate(snapshot.states[check.target])
+            ]
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if not failed or remaining_ms <= 0:
+                return snapshot, failed
+
+        snapshot_stats.retries += 1
+        page.wait_for_timeout(min(next(intervals, POLL_INTERVALS_MS[-1]), remaining_ms))
+
+
+def assert_snapshot(
+    page: Page, checks: Iterable[SnapshotCheck], timeout: float = DEFAULT_TIMEOUT_MS
+) -> ComponentSnapshot:
+    """Проверяет условия на снимке состояния и отправляет их в трекер покрытия.
+
+    Args:
+        page (Page): Страница браузера.
+        checks (Iterable[SnapshotCheck]): Проверяемые условия.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Returns:
+        ComponentSnapshot: Снимок, на котором выполнились все условия.
+
+    Raises:
+        InvalidSelectorError: Если селектор какого-то условия синтаксически неверен;
+            в сообщении перечисляются и невыполненные условия с верными селекторами.
+        AssertionError: Если за таймаут выполнились не все условия.
+    """
+    checks = list(checks)
+    for check in checks:
+        logger.debug(f"Проверка на снимке: {check.description}")
+
+    snapshot, failed = poll_snapshot(page, checks, timeout)
+    snapshot_stats.checks += len(checks)
+    invalid = [check for check in checks if check.target in snapshot.errors]
+    if failed or invalid:
+        snapshot_stats.failures += len(failed) + len(invalid)
+        details = "\n".join(
+            f"  {check.description}; фактически: {snapshot.states[check.target].describe()}"
+            for check in failed
+        )
+        message = (
+            f"Не выполнено условий: {len(failed)} из {len(checks)} за {timeout:.0f} мс\n{details}"
+        )
+        if invalid:
+            errors = "\n".join(
+                f"  {check.description}: '{check.target.selector}': {snapshot.errors[check.target]}"
+                for check in invalid
+            )
+            raise InvalidSelectorError(
+                f"Неверных селекторов: {len(invalid)} из {len(checks)}\n{errors}"
+                + (f"\n{message}" if failed else "")
+            )
+        raise AssertionError(message)
+
+    for check in checks:
+        check.element.track_coverage(check.action_type, check.nth, **check.kwargs)
+    return snapshot
+
+
+class SoftAssertions:
+    """Сборщик условий, проверяемых вместе в одном цикле опроса.
+
+    Условия регистрируются без обращений к браузеру; `verify` проверяет их все
+    на снимках состояния с общим таймаутом и сообщает обо всех невыполненных
+    условиях сразу.
+
+    Attributes:
+        page (Page): Страница браузера.
+        timeout (float): Общий таймаут проверки в мс.
+        checks (list[SnapshotCheck]): Зарегистрированные условия.
+        snapshot (ComponentSnapshot | None): Снимок, на котором выполнились условия.
+    """
+
+    def __init__(self, page: Page, timeout: float = DEFAULT_TIMEOUT_MS) -> None:
+        """Инициализирует пустой сборщик.
+
+        Args:
+            page (Page): Страница браузера.
+            timeout (float): Общий таймаут проверки в мс.
+        """
+        self.page = page
+        self.timeout = timeout
+        self.checks: list[SnapshotCheck] = []
+        self.snapshot: ComponentSnapshot | None = None
+
+    def add(self, *checks: SnapshotCheck) -> Self:
+        """Регистрирует условия.
+
+        Returns:
+            Self: Экземпляр текущего объекта для цепочки вызовов.
+        """
+        self.checks.extend(checks)
+        return self
+
+    def verify(self) -> ComponentSnapshot:
+        """Проверяет все зарегистрированные условия.
+
+        Returns:
+            ComponentSnapshot: Снимок, на котором выполнились все условия.
+
+        Raises:
+            InvalidSelectorError: Если селектор какого-то условия синтаксически неверен.
+            AssertionError: Со списком всех условий, не выполненных за таймаут.
+        """
+        if not self.checks:
+            self.snapshot = ComponentSnapshot({})
+        else:
+            self.snapshot = assert_snapshot(self.page, self.checks, self.timeout)
+        return self.snapshot
+
+
+@contextmanager
+def expect_all(
+    page: Page, title: str, timeout: float = DEFAULT_TIMEOUT_MS
+) -> Iterator[SoftAssertions]:
+    """Собирает условия в блоке и проверяет их вместе при выходе из него.
+
+    Если в блоке возникло исключение, условия не проверяются.
+
+    Args:
+        page (Page): Страница браузера.
+        title (str): Название шага проверки.
+        timeout (float): Общий таймаут проверки в мс.
+
+    Yields:
+        Iterator[SoftAssertions]: Сборщик условий.
+
+    Raises:
+        InvalidSelectorError: Если селектор какого-то условия синтаксически неверен.
+        AssertionError: Со списком всех условий, не выполненных за таймаут.
+    """
+    soft = SoftAssertions(page, timeout)
+    yield soft
+
+    step = f"{title}: условий {len(soft.checks)}"
+    with step_recorder.step(step, StepVerbosity.CHECKS):
+        logger.info(step)
+        soft.verify()
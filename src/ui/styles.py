@@ -0,0 +1,125 @@
+"""Чтение вычисленных стилей элементов за одно обращение к браузеру.
+
+Проверка состояния элемента (наведение, фокус, активность) обычно сравнивает
+несколько свойств `getComputedStyle` до и после действия. Чтение каждого
+свойства отдельным `evaluate` - отдельное обращение к браузеру, поэтому модуль
+читает произвольный набор свойств одного или всех найденных элементов одним
+вызовом, а ожидание изменения стилей выполняется в браузере и тоже занимает
+одно обращение.
+
+Свойства задаются CSS-именами (`background-color`) или именами свойств
+`CSSStyleDeclaration` (`backgroundColor`); в результате ключи совпадают с переданными.
+"""
+
+from collections.abc import Sequence
+import time
+
+from playwright.sync_api import Locator
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from src.ui.waits import DEFAULT_TIMEOUT_MS, wait_stats
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Вычисленные значения свойств стиля по имени свойства
+StyleValues = dict[str, str]
+
+_READ_STYLES_JS = """
+const readStyles = (el, properties) => {
+  const style = getComputedStyle(el);
+  return Object.fromEntries(properties.map((name) => [
+    name, name.includes("-") ? style.getPropertyValue(name) : String(style[name] ?? ""),
+  ]));
+};
+"""
+
+_STYLES_JS = f"""
+(target, properties) => {{
+  {_READ_STYLES_JS}
+  return Array.isArray(target)
+    ? target.map((el) => readStyles(el, properties))
+    : readStyles(target, properties);
+}}
+"""
+
+# Опрашивает стили на каждом кадре, пока хотя бы одно свойство не отличится
+# от исходного значения и не завершатся переходы элемента (чтобы вернуть
+# итоговые, а не промежуточные значения). По таймауту возвращает null.
+_WAIT_STYLE_CHANGE_JS = f"""
+async (el, {{ before, timeoutMs }}) => {{
+  {_READ_STYLES_JS}
+  const properties = Object.keys(before);
+  const deadline = performance.now() + timeoutMs;
+  while (performance.now() < deadline) {{
+    const current = readStyles(el, properties);
+    const changed = properties.some((name) => current[name] !== before[name]);
+    const settled = el.getAnimations().every(
+      (a) => a.playState !== "running" || a.effect?.getComputedTiming().endTime === Infinity
+    );
+    if (changed && settled) return current;
+    await new Promise((resolve) => requestAnimationFrame(resolve));
+  }}
+  return null;
+}}
+"""
+
+
+def read_styles(locator: Locator, properties: Sequence[str]) -> StyleValues:
+    """Читает вычисленные свойства стиля элемента одним вызовом.
+
+    Args:
+        locator (Locator): Локатор элемента.
+        properties (Sequence[str]): Имена свойств стиля.
+
+    Returns:
+        StyleValues: Значения свойств по имени.
+    """
+    return locator.evaluate(_STYLES_JS, list(properties))
+
+
+def read_all_styles(locator: Locator, properties: Sequence[str]) -> list[StyleValues]:
+    """Читает вычисленные свойства стиля всех элементов локатора одним вызовом.
+
+    Args:
+        locator (Locator): Локатор элементов (без индекса).
+        properties (Sequence[str]): Имена свойств стиля.
+
+    Returns:
+        list[StyleValues]: Значения свойств каждого элемента в порядке документа.
+    """
+    return locator.evaluate_all(_STYLES_JS, list(properties))
+
+
+def wait_for_style_change(
+    locator: Locator, before: StyleValues, timeout: float = DEFAULT_TIMEOUT_MS
+) -> StyleValues:
+    """Ждет, пока хотя бы одно свойство стиля элемента изменится.
+
+    Проверяются свойства из `before`; ожидание выполняется в браузере на каждом
+    кадре отрисовки и завершается после окончания CSS-переходов элемента.
+
+    Args:
+        locator (Locator): Локатор элемента.
+        before (StyleValues): Исходные значения свойств.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Returns:
+        StyleValues: Новые значения свойств.
+
+    Raises:
+        TimeoutError: Если свойства не изменились за `timeout`.
+    """
+    started_at = time.monotonic()
+    after = locator.evaluate(
+        _WAIT_STYLE_CHANGE_JS, {"before": before, "timeoutMs": timeout}, timeout=timeout
+    )
+    duration_ms = (time.monotonic() - started_at) * 1000
+    wait_stats.record("style_change", duration_ms, timed_out=after is None)
+    if after is None:
+        raise PlaywrightTimeoutError(
+            f"Стили {', '.join(before)} не изменились за {timeout:.0f} мс: {before}"
+        )
+
+    logger.debug(f"Ожидание изменения стилей заняло {duration_ms:.0f} мс")
+    return after
@@ -0,0 +1,228 @@
+"""Ожидания по реальным условиям страницы вместо фиксированных пауз.
+
+Модуль предоставляет примитивы ожидания, которые завершаются сразу, как только
+выполнено условие:
+- DOM не изменялся заданное время (MutationObserver)
+- нет незавершенных запросов fetch/XHR
+- завершены CSS-переходы и конечные анимации
+- положение и размер элемента не меняются между кадрами отрисовки
+
+Для отслеживания мутаций и запросов на страницу внедряется вспомогательный скрипт:
+заранее через `install_wait_helpers` (init script контекста) или лениво при первом
+ожидании. Длительность каждого ожидания сохраняется в `wait_stats`.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+
+from playwright.sync_api import BrowserContext, Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+# Максимальное время ожидания условия по умолчанию
+DEFAULT_TIMEOUT_MS = 10000
+
+# Время без мутаций DOM и сетевых запросов, после которого страница считается затихшей
+DEFAULT_QUIET_MS = 300
+
+# Устанавливает на странице счетчики мутаций DOM и незавершенных запросов.
+# Повторный запуск ничего не делает, поэтому скрипт безопасно вызывать многократно.
+_HELPERS_JS = """
+(() => {
+  if (window.__csimWaits) return;
+  const state = { lastChange: performance.now(), inflight: 0 };
+  window.__csimWaits = state;
+
+  const touch = () => { state.lastChange = performance.now(); };
+  const observe = () => new MutationObserver(touch).observe(document, {
+    subtree: true, childList: true, attributes: true, characterData: true,
+  });
+  if (document.documentElement) observe();
+  else document.addEventListener('DOMContentLoaded', observe, { once: true });
+
+  const done = () => { state.inflight = Math.max(0, state.inflight - 1); touch(); };
+  const originalFetch = window.fetch;
+  if (originalFetch) {
+    window.fetch = function (...args) {
+      state.inflight++;
+      return originalFetch.apply(this, args).finally(done);
+    };
+  }
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    state.inflight++;
+    this.addEventListener('loadend', done, { once: true });
+    return originalSend.apply(this, args);
+  };
+})();
+"""
+
+# Завершены ли все CSS-переходы и конечные анимации (бесконечные, вроде спиннеров,
+# игнорируются, иначе ожидание никогда бы не закончилось)
+_ANIMATIONS_DONE_JS = """
+(animations) => animations.every(
+  (a) => a.playState !== 'running'
+    || a.effect?.getComputedTiming().endTime === Infinity
+)
+"""
+
+_PAGE_SETTLED_JS = f"""
+({{ quietMs, network, animations }}) => {{
+  {_HELPERS_JS}
+  const state = window.__csimWaits;
+  if (performance.now() - state.lastChange < quietMs) return false;
+  if (network && state.inflight > 0) return false;
+  return !animations || ({_ANIMATIONS_DONE_JS})(document.getAnimations());
+}}
+"""
+
+# Элемент стабилен, если его прямоугольник совпал с замером на предыдущем кадре
+_ELEMENT_STABLE_JS = f"""
+(el) => {{
+  const r = el.getBoundingClientRect();
+  const rect = [r.x, r.y, r.width, r.height].join();
+  const same = el.__csimRect === rect;
+  el.__csimRect = rect;
+  return same && ({_ANIMATIONS_DONE_JS})(el.getAnimations());
+}}
+"""
+
+
+class WaitStats:
+    """Статистика длительности ожиданий по видам условий.
+
+    Attributes:
+        samples (dict[str, list[float]]): Длительности ожиданий в мс по видам условий.
+        timeouts (dict[str, int]): Количество ожиданий, завершившихся по таймауту.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустую статистику."""
+        self.samples: dict[str, list[float]] = {}
+        self.timeouts: dict[str, int] = {}
+
+    def record(self, kind: str, duration_ms: float, timed_out: bool = False) -> None:
+        """Сохраняет замер длительности ожидания."""
+        self.samples.setdefault(kind, []).append(duration_ms)
+        if timed_out:
+            self.timeouts[kind] = self.timeouts.get(kind, 0) + 1
+
+    def summary(self) -> str:
+        """Возвращает сводку по видам ожиданий: количество, среднее и максимум."""
+        if not self.samples:
+            return "ожиданий не было"
+
+        lines = []
+        for kind, durations in sorted(self.samples.items()):
+            lines.append(
+                f"  {kind}: {len(durations)} шт., "
+                f"среднее {sum(durations) / len(durations):.0f} мс, "
+                f"максимум {max(durations):.0f} мс, "
+                f"таймаутов {self.timeouts.get(kind, 0)}"
+            )
+        return "\n".join(lines)
+
+
+# Глобальная статистика ожиданий
+wait_stats = WaitStats()
+
+
+@contextmanager
+def _measure(kind: str) -> Iterator[None]:
+    """Замеряет длительность ожидания и сохраняет ее в статистику.
+
+    Таймаутом считается только `PlaywrightTimeoutError`; прочие ошибки (например,
+    закрытие страницы) пробрасываются без записи в статистику.
+    """
+    started_at = time.monotonic()
+    try:
+        yield
+    except PlaywrightTimeoutError:
+        wait_stats.record(kind, (time.monotonic() - started_at) * 1000, timed_out=True)
+        raise
+
+    duration_ms = (time.monotonic() - started_at) * 1000
+    wait_stats.record(kind, duration_ms)
+    logger.debug(f"Ожидание '{kind}' заняло {duration_ms:.0f} мс")
+
+
+def install_wait_helpers(context: BrowserContext) -> None:
+    """Внедряет вспомогательный скрипт ожиданий во все страницы контекста.
+
+    Скрипт выполняется до скриптов страницы, поэтому учитываются и запросы,
+    отправленные сразу при загрузке.
+
+    Args:
+        context (BrowserContext): Контекст браузера.
+    """
+    context.add_init_script(_HELPERS_JS)
+
+
+def wait_for_dom_quiet(
+    page: Page, quiet_ms: int = DEFAULT_QUIET_MS, timeout: float = DEFAULT_TIMEOUT_MS
+) -> None:
+    """Ждет, пока DOM страницы не будет изменяться в течение `quiet_ms`.
+
+    Args:
+        page (Page): Страница браузера.
+        quiet_ms (int): Время без мутаций DOM в мс.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Raises:
+        TimeoutError: Если условие не выполнилось за `timeout`.
+    """
+    with _measure("dom_quiet"):
+        page.wait_for_function(
+            _PAGE_SETTLED_JS,
+            arg={"quietMs": quiet_ms, "network": False, "animations": False},
+            timeout=timeout,
+        )
+
+
+def wait_for_page_settled(
+    page: Page, quiet_ms: int = DEFAULT_QUIET_MS, timeout: float = DEFAULT_TIMEOUT_MS
+) -> None:
+    """Ждет, пока страница полностью затихнет.
+
+    Страница считается затихшей, если DOM и сетевые запросы не менялись `quiet_ms`,
+    нет незавершенных fetch/XHR и завершены CSS-переходы и конечные анимации.
+
+    Args:
+        page (Page): Страница браузера.
+        quiet_ms (int): Время без мутаций DOM и сетевой активности в мс.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Raises:
+        TimeoutError: Если условие не выполнилось за `timeout`.
+    """
+    with _measure("page_settled"):
+        page.wait_for_function(
+            _PAGE_SETTLED_JS,
+            arg={"quietMs": quiet_ms, "network": True, "animations": True},
+            timeout=timeout,
+        )
+
+
+def wait_for_element_stable(
+    locator: Locator, timeout: float = DEFAULT_TIMEOUT_MS
+) -> None:
+    """Ждет, пока элемент перестанет двигаться и завершит свои переходы и анимации.
+
+    Положение и размер элемента сравниваются между соседними кадрами отрисовки.
+
+    Args:
+        locator (Locator): Локатор элемента.
+        timeout (float): Максимальное время ожидания в мс.
+
+    Raises:
+        TimeoutError: Если условие не выполнилось за `timeout`.
+    """
+    with _measure("element_stable"):
+        handle = locator.element_handle(timeout=timeout)
+        locator.page.wait_for_function(
+            _ELEMENT_STABLE_JS, arg=handle, polling="raf", timeout=timeout
+        )
@@ -1,27 +1,113 @@
 from collections.abc import Iterator
+from pathlib import Path
 
 from playwright.sync_api import Page, Playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
-from config import settings
+from config import Browser, HarMode, settings
+from integrations.playwright.asset_cache import asset_cache
+from integrations.playwright.browser_pool import BrowserPool
+from integrations.playwright.context_queue import ContextWarmupQueue
+from integrations.playwright.har import har_router
+from integrations.playwright.mocks import blocking_stats
 from integrations.playwright.page_builder import playwright_page_builder
+from integrations.playwright.storage_state import StorageStateCache
+from src.ui.consent import cookie_consent
+from src.ui.elements.locator_cache import locator_cache
+from src.ui.pages.base_page import BasePage
+from src.ui.snapshot import snapshot_stats
+from src.ui.waits import wait_stats
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__.upper())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Сохраняет отчеты фаз теста в атрибутах `rep_setup`, `rep_call`, `rep_teardown`.
+
+    Отчеты используются фикстурами браузера, чтобы при завершении теста узнать,
+    упал ли он, и решить, сохранять ли видео и трассировку.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Объединяет HAR-записи всех воркеров после завершения сессии в режиме `record`."""
+    is_worker = hasattr(session.config, "workerinput")
+    if settings.ui.har_mode is HarMode.RECORD and not is_worker:
+        har_router.merge_recordings()
+
+
+def _is_test_failed(item: pytest.Item) -> bool:
+    """Проверяет, упал ли тест на этапе подготовки или выполнения."""
+    reports = (getattr(item, f"rep_{when}", None) for when in ("setup", "call"))
+    return any(report is not None and report.failed for report in reports)
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright: Playwright) -> Iterator[BrowserPool]:
+    """Фикстура пула браузеров, общего для всех тестов воркера.
+
+    Браузер каждого типа запускается один раз за сессию воркера и переиспользуется
+    тестами, которые получают собственные контексты. По завершении сессии браузеры
+    закрываются, а в лог выводится статистика запусков и переиспользований.
+
+    Args:
+        playwright (Playwright): Объект Playwright для управления браузером.
+
+    Yields:
+        Iterator[BrowserPool]: Пул браузеров текущего воркера.
+    """
+    pool = BrowserPool(playwright)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def context_queue(browser_pool: BrowserPool) -> Iterator[ContextWarmupQueue]:
+    """Фикстура очереди заранее подготовленных страниц.
+
+    Глубина очереди задается настройкой `settings.ui.warmup_queue_depth`.
+    По завершении сессии неиспользованные контексты закрываются, а в лог выводится
+    метрика времени подготовки страниц к тестам, статистика ожиданий
+    и проверок диалога cookies.
+
+    Args:
+        browser_pool (BrowserPool): Пул браузеров текущего воркера.
+
+    Yields:
+        Iterator[ContextWarmupQueue]: Очередь подготовленных страниц.
+    """
+    queue = ContextWarmupQueue(browser_pool, depth=settings.ui.warmup_queue_depth)
+    yield queue
+    queue.close()
+    logger.info(f"Статистика ожиданий:\n{wait_stats.summary()}")
+    logger.info(f"Согласие на cookies: {cookie_consent.stats.summary()}")
+    logger.info(f"Запросы страниц: {blocking_stats.summary()}")
+    logger.info(f"Кеш статики: {asset_cache.stats.summary()}")
+    logger.info(f"Кеш локаторов: {locator_cache.stats.summary()}")
+    logger.info(f"Снимки компонентов: {snapshot_stats.summary()}")
 
 
 @pytest.fixture(params=settings.ui.browsers)
 def chromium_page(
     request: pytest.FixtureRequest,
-    playwright: Playwright,
+    context_queue: ContextWarmupQueue,
 ) -> Iterator[Page]:
     """Фикстура для создания страницы Chromium без предварительно загруженного состояния.
 
     Эта фикстура использует `playwright_page_builder` для настройки и запуска страницы
-    в браузере Chromium. Имя теста автоматически извлекается из `request.node.name`.
-    Используется для запуска тестов без сохраненного состояния браузера.
+    из очереди подготовленных страниц. Имя теста автоматически извлекается
+    из `request.node.name`. Используется для запуска тестов без сохраненного состояния браузера.
 
     Args:
         request (pytest.FixtureRequest): Объект запроса Pytest, используется для
                                          получения имени текущего теста.
-        playwright (Playwright): Объект Playwright для управления браузером.
+        context_queue (ContextWarmupQueue): Очередь подготовленных страниц.
 
     Yields:
         Iterator[Page]: Генератор, возвращающий объект страницы Playwright.
@@ -30,51 +116,105 @@ def chromium_page(
         None: Ресурсы управляются через генератор.
     """
     yield from playwright_page_builder(
-        playwright=playwright,
+        context_queue=context_queue,
         browser_type=request.param,
         test_name=request.node.name,
+        is_failed=lambda: _is_test_failed(request.node),
+        attempt=getattr(request.node, "execution_count", 1),
     )
 
 
-@pytest.fixture(scope="session")
-def initialize_browser_state(playwright: Playwright) -> None:
-    """Фикстура для инициализации браузера и сохранения состояния после регистрации.
+def _build_browser_state(
+    browser_pool: BrowserPool, browser_type: Browser, state_path: Path
+) -> dict | None:
+    """Принимает согласие на cookies в браузере и сохраняет состояние контекста.
 
-    Эта фикстура запускается один раз за сессию тестирования. Она открывает браузер,
-    сохраняет состояние контекста в файл `browser-state.json`,
-    чтобы использовать его в последующих тестах.
+    Returns:
+        dict | None: Признаки согласия на cookies этого браузера для сохранения вместе
+            с состоянием; None, если согласие принять не удалось и состояние
+            не должно попасть в кеш.
+    """
+    context = browser_pool.new_context(browser_type, base_url=settings.get_ui_base_url())
+    har_router.attach(context, f"browser_state_{Browser(browser_type).value}")
+    page = context.new_page()
+    consent = None
+    try:
+        page.goto(settings.get_ui_base_url(), wait_until="networkidle", timeout=50000)
+        consent = cookie_consent.capture(page, BasePage(page).accept_cookies_if_present)
+    except PlaywrightTimeoutError as e:
+        logger.debug(f"Диалог cookies в {browser_type} не обработан: {e}")
+    context.storage_state(path=state_path)
+    context.close()
+
+    if not consent or not any(consent.values()):
+        logger.warning(
+            f"Не удалось принять согласие на cookies в {browser_type}, "
+            "состояние используется без него и не кешируется"
+        )
+        return None
+    return {"consent": consent}
+
+
+@pytest.fixture(scope="session")
+def initialize_browser_state(browser_pool: BrowserPool) -> dict[Browser, Path]:
+    """Фикстура для инициализации браузера и сохранения состояния с согласием на cookies.
+
+    Эта фикстура запускается один раз за сессию тестирования. Для каждого браузера
+    из `settings.ui.browsers` она берет состояние из кеша `StorageStateCache`, ключом
+    которого служат браузер, окружение и URL приложения. Если состояния нет или оно
+    старше `settings.ui.browser_state_ttl`, приложение открывается, согласие на cookies
+    принимается один раз, а состояние контекста сохраняется в кеш. При параллельном
+    запуске состояние строит один воркер, остальные переиспользуют его.
+    Признаки согласия сохраняются вместе с состоянием, и при переходах в тестах
+    проверка диалога cookies пропускается.
 
     Аргументы:
-        playwright (Playwright): Объект Playwright для управления браузером.
+        browser_pool (BrowserPool): Пул браузеров текущего воркера.
 
     Возвращает:
-        None
+        dict[Browser, Path]: Пути к файлам состояния для каждого браузера.
     """
-    browser = playwright.chromium.launch(headless=settings.ui.headless)
-    context = browser.new_context(base_url=settings.get_ui_base_url())
-    context.storage_state(path=settings.ui.browser_state_file)
-    browser.close()
+    cache = StorageStateCache(
+        cache_dir=settings.ui.browser_state_dir,
+        ttl=settings.ui.browser_state_ttl,
+        environment=settings.environment,
+        app_url=settings.get_ui_base_url(),
+    )
+
+    state_files = {}
+    for browser_type in settings.ui.browsers:
+        state_path, data = cache.get_or_create(
+            browser_type,
+            lambda path, browser=browser_type: _build_browser_state(
+                browser_pool, browser, path
+            ),
+        )
+        cookie_consent.load(data.get("consent", {}))
+        state_files[browser_type] = state_path
+
+    return state_files
 
 
 @pytest.fixture(params=settings.ui.browsers)
 def chromium_page_with_state(
     request: pytest.FixtureRequest,
-    initialize_browser_state,
-    playwright: Playwright,
+    initialize_browser_state: dict[Browser, Path],
+    context_queue: ContextWarmupQueue,
 ) -> Iterator[Page]:
     """Фикстура для создания страницы Chromium с предварительно загруженным состоянием браузера.
 
     Эта фикстура использует `playwright_page_builder` для настройки и запуска страницы
-    в браузере Chromium. Используется состояние браузера из файла `browser-state.json`,
-    что позволяет сохранить авторизацию или другие данные между тестами.
+    из очереди подготовленных страниц. Используется состояние браузера из файла,
+    подготовленного `initialize_browser_state`, что позволяет сохранить согласие
+    на cookies, авторизацию или другие данные между тестами.
     Также имя теста автоматически извлекается из `request.node.name`.
 
     Args:
         request (pytest.FixtureRequest): Объект запроса Pytest, используется для
                                          получения имени текущего теста.
-        initialize_browser_state: Дополнительная фикстура, используемая для
-                                  инициализации состояния браузера перед тестом.
-        playwright (Playwright): Объект Playwright для управления браузером.
+        initialize_browser_state (dict[Browser, Path]): Пути к файлам состояния
+                                  браузеров, подготовленным перед тестами.
+        context_queue (ContextWarmupQueue): Очередь подготовленных страниц.
 
     Yields:
         Iterator[Page]: Генератор, возвращающий объект страницы Playwright.
@@ -83,8 +223,10 @@ def chromium_page_with_state(
         None: Ресурсы управляются через генератор.
     """
     yield from playwright_page_builder(
-        playwright=playwright,
+        context_queue=context_queue,
         browser_type=request.param,
         test_name=request.node.name,
-        state=settings.ui.browser_state_file,
+        state=str(initialize_browser_state[request.param]),
+        is_failed=lambda: _is_test_failed(request.node),
+        attempt=getattr(request.node, "execution_count", 1),
     )
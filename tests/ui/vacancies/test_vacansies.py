@@ -37,10 +37,11 @@ class TestVacancyList:
         vacancies_page.visit(AppRoute.VACANCIES)
         vacancies_page.nav_bar.check_visible()
         vacancies_page.breadcrumbs.check_visible("Все вакансии")
-        vacancies_page.header.check_visible()
-        vacancies_page.header.title.check_contain_text("Присоединяйся к команде Центра")
-        vacancies_page.header.subtitle.check_contain_text(
-            "Развивайся вместе с нами, создавай нейросети и двигай технологические процессы"
+        vacancies_page.header.check_visible(
+            title="Присоединяйся к команде Центра",
+            subtitle=(
+                "Развивайся вместе с нами, создавай нейросети и двигай технологические процессы"
+            ),
         )
         vacancies_page.filter_bar.check_visible()
         vacancies_page.vacancies_list.check_visible()
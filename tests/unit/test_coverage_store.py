@@ -0,0 +1,129 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from ui_coverage_tool import ActionType, SelectorType
+from ui_coverage_tool.src.tracker.models import CoverageResult
+
+from integrations.coverage.store import CoverageStore
+from src.ui.locators.base import UILocator
+
+pytestmark = pytest.mark.unit
+
+APP = "cism-ms"
+BUTTON = "//button[@id='save']"
+ITEM = "//li[@data-index='3']"
+
+
+def event_counts(store: CoverageStore) -> dict[tuple[str, str, ActionType, SelectorType], int]:
+    """Возвращает счетчики событий хранилища по приложению, селектору, действию и типу."""
+    return {
+        (event.app, event.selector, event.action_type, event.selector_type): event.count
+        for event in store.events()
+    }
+
+
+def test_selectors_are_interned(tmp_path: Path):
+    """Селектор хранится один раз и сохраняет идентификатор после переоткрытия."""
+    path = tmp_path / "shard.sqlite"
+    with CoverageStore(path) as store:
+        store.add(
+            APP,
+            {
+                (BUTTON, ActionType.CLICK, SelectorType.XPATH): 1,
+                (BUTTON, ActionType.VISIBLE, SelectorType.XPATH): 1,
+                (BUTTON, ActionType.CLICK, SelectorType.CSS): 1,
+            },
+        )
+        store.add("other", {(BUTTON, ActionType.CLICK, SelectorType.XPATH): 1})
+        first = store.selector_id(APP, BUTTON, SelectorType.XPATH)
+        assert store.selector_id(APP, BUTTON, SelectorType.CSS) != first
+        assert store.selector_id("other", BUTTON, SelectorType.XPATH) != first
+
+    with CoverageStore(path) as store:
+        assert store.selector_id(APP, BUTTON, SelectorType.XPATH) == first
+        rows = store._connection.execute("SELECT COUNT(*) FROM selectors").fetchone()
+        assert rows == (3,)
+
+
+def test_counts_are_accumulated(tmp_path: Path):
+    """Повторные добавления одного действия суммируются в одном счетчике."""
+    with CoverageStore(tmp_path / "shard.sqlite") as store:
+        store.add(APP, {(BUTTON, ActionType.CLICK, SelectorType.XPATH): 2})
+        store.add(
+            APP,
+            {
+                (BUTTON, ActionType.CLICK, SelectorType.XPATH): 3,
+                (BUTTON, ActionType.VISIBLE, SelectorType.XPATH): 1,
+            },
+        )
+
+        assert event_counts(store) == {
+            (APP, BUTTON, ActionType.CLICK, SelectorType.XPATH): 5,
+            (APP, BUTTON, ActionType.VISIBLE, SelectorType.XPATH): 1,
+        }
+        assert store.action_totals(APP) == {ActionType.CLICK: 5, ActionType.VISIBLE: 1}
+
+
+def test_shards_are_merged(tmp_path: Path):
+    """Объединение шардов суммирует счетчики одинаковых селекторов."""
+    shards = [tmp_path / "gw0.sqlite", tmp_path / "gw1.sqlite"]
+    with CoverageStore(shards[0]) as store:
+        store.add(APP, {(BUTTON, ActionType.CLICK, SelectorType.XPATH): 2})
+    with CoverageStore(shards[1]) as store:
+        store.add(
+            APP,
+            {
+                (ITEM, ActionType.HOVER, SelectorType.XPATH): 1,
+                (BUTTON, ActionType.CLICK, SelectorType.XPATH): 1,
+            },
+        )
+
+    with CoverageStore(":memory:") as merged:
+        for shard in shards:
+            merged.merge(shard)
+        merged.add(APP, {(BUTTON, ActionType.CLICK, SelectorType.XPATH): 1})
+
+        assert event_counts(merged) == {
+            (APP, BUTTON, ActionType.CLICK, SelectorType.XPATH): 4,
+            (APP, ITEM, ActionType.HOVER, SelectorType.XPATH): 1,
+        }
+
+
+def test_export_round_trip(tmp_path: Path):
+    """Выгрузка дает по одному результату ui-coverage-tool на каждое действие."""
+    counts = {
+        (BUTTON, ActionType.CLICK, SelectorType.XPATH): 3,
+        ("#search", ActionType.FILL, SelectorType.CSS): 1,
+    }
+    path = tmp_path / "shard.sqlite"
+    with CoverageStore(path) as store:
+        store.add(APP, counts)
+    results_dir = tmp_path / "results"
+
+    with CoverageStore(path, readonly=True) as store:
+        assert store.export_results(results_dir) == 4
+
+    results = [
+        CoverageResult.model_validate_json(file.read_text()) for file in results_dir.glob("*.json")
+    ]
+    exported = Counter(
+        (result.selector, result.action_type, result.selector_type) for result in results
+    )
+    assert {result.app for result in results} == {APP}
+    assert exported == counts
+
+
+def test_untouched_locators(tmp_path: Path):
+    """Шаблонные локаторы считаются покрытыми при действии с любым значением параметра."""
+    with CoverageStore(tmp_path / "shard.sqlite") as store:
+        store.add(APP, {(ITEM, ActionType.CLICK, SelectorType.XPATH): 1})
+        store.declare(
+            APP,
+            [
+                UILocator("//li[@data-index='{index}']", "Пункт списка {index}"),
+                UILocator("//button[@id='reset']", "Кнопка сброса"),
+            ],
+        )
+
+        assert store.untouched(APP) == [UILocator("//button[@id='reset']", "Кнопка сброса")]
@@ -0,0 +1,153 @@
+import json
+from pathlib import Path
+import random
+import time
+
+import pytest
+
+from integrations.scheduling.durations import (
+    DEFAULT_DURATION_SECONDS,
+    DurationHistory,
+    DurationRecord,
+    DurationStore,
+    browser_of,
+)
+from integrations.scheduling.merge import merge_duration_histories
+from integrations.scheduling.plugin import plan_schedule
+from integrations.scheduling.sharding import parse_shard, split_into_shards
+
+pytestmark = pytest.mark.unit
+
+
+def make_store(tmp_path: Path, durations: dict[str, float]) -> DurationStore:
+    """Создает хранилище длительностей с заданной историей."""
+    store = DurationStore(tmp_path / "durations.json")
+    store.update(durations)
+    return store
+
+
+@pytest.mark.parametrize(
+    ("nodeid", "browser"),
+    [
+        ("tests/test_a.py::test_x[chromium]", "chromium"),
+        ("tests/test_a.py::test_x[firefox-2]", "firefox"),
+        ("tests/test_a.py::test_x[2-webkit]", "webkit"),
+        ("tests/test_a.py::test_x[2]", None),
+        ("tests/test_a.py::test_x", None),
+    ],
+)
+def test_browser_of(nodeid: str, browser: str | None):
+    """Браузер определяется по параметрам теста."""
+    assert browser_of(nodeid) == browser
+
+
+def test_plan_splits_workers_between_browsers():
+    """Воркеры делятся между браузерами пропорционально длительности их тестов."""
+    nodeids = [f"t.py::test_{i}[chromium]" for i in range(9)]
+    nodeids += [f"t.py::test_{i}[firefox]" for i in range(3)]
+    predicted = [1.0] * len(nodeids)
+
+    plan = plan_schedule(predicted, nodeids, workers=4)
+
+    assigned = sorted(index for worker in plan.assignments for index in worker)
+    assert assigned == list(range(len(nodeids)))
+    browsers = [{browser_of(nodeids[index]) for index in worker} for worker in plan.assignments]
+    assert all(len(worker_browsers) == 1 for worker_browsers in browsers)
+    assert sum(worker_browsers == {"chromium"} for worker_browsers in browsers) == 3
+    assert plan.makespan == 3.0
+
+
+def test_plan_balances_long_tests_first():
+    """Внутри браузера тесты раскладываются от долгих к коротким (LPT)."""
+    predicted = [8.0, 7.0, 6.0, 5.0, 4.0]
+    nodeids = [f"t.py::test_{i}[chromium]" for i in range(len(predicted))]
+
+    plan = plan_schedule(predicted, nodeids, workers=2)
+
+    assert sorted(plan.loads) == [13.0, 17.0]
+    for worker in plan.assignments:
+        assert [predicted[index] for index in worker] == sorted(
+            (predicted[index] for index in worker), reverse=True
+        )
+
+
+def test_plan_with_fewer_workers_than_browsers():
+    """Если воркеров меньше, чем браузеров, браузер целиком достается одному воркеру."""
+    nodeids = ["t.py::a[chromium]", "t.py::b[chromium]", "t.py::a[firefox]", "t.py::a[webkit]"]
+    predicted = [3.0, 3.0, 4.0, 1.0]
+
+    plan = plan_schedule(predicted, nodeids, workers=2)
+
+    browsers = [{browser_of(nodeids[index]) for index in worker} for worker in plan.assignments]
+    assert {"chromium"} in browsers
+    assert plan.makespan == 6.0
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1/1", (1, 1)), ("2/4", (2, 4))])
+def test_parse_shard(value: str, expected: tuple[int, int]):
+    """Номер шарда разбирается из формата i/n."""
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0/2", "3/2", "1/0", "1", "a/b", "1/2/3"])
+def test_parse_shard_rejects_invalid(value: str):
+    """Неверный номер шарда отклоняется с понятной ошибкой."""
+    with pytest.raises(ValueError, match="шард"):
+        parse_shard(value)
+
+
+def test_shards_are_balanced_and_deterministic(tmp_path: Path):
+    """Шарды покрывают все тесты, близки по длительности и не зависят от порядка сбора."""
+    durations = {f"t.py::test_{i}[chromium]": float(i % 7 + 1) for i in range(40)}
+    store = make_store(tmp_path, durations)
+    nodeids = list(durations)
+
+    shards, loads = split_into_shards(nodeids, store, count=3)
+    shuffled = random.Random(1).sample(nodeids, len(nodeids))
+
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(nodeids)
+    assert max(loads) - min(loads) <= max(durations.values())
+    assert split_into_shards(shuffled, store, count=3) == (shards, loads)
+
+
+def test_unknown_tests_are_predicted_by_browser_median(tmp_path: Path):
+    """Для тестов без истории берется медиана браузера, затем общая медиана."""
+    store = make_store(
+        tmp_path,
+        {"t.py::a[chromium]": 2.0, "t.py::b[chromium]": 4.0, "t.py::a[firefox]": 10.0},
+    )
+
+    assert store.predict("t.py::new[chromium]") == 3.0
+    assert store.predict("t.py::new[webkit]") == 4.0
+    assert DurationStore(tmp_path / "missing.json").predict("t.py::x") == DEFAULT_DURATION_SECONDS
+
+
+def test_history_is_smoothed_and_saved_without_stale_records(tmp_path: Path):
+    """Новые замеры сглаживаются, а устаревшие записи не сохраняются."""
+    store = make_store(tmp_path, {"t.py::a[chromium]": 2.0})
+    store.update({"t.py::a[chromium]": 4.0})
+    store.history.tests["t.py::old[chromium]"] = DurationRecord(
+        seconds=1.0, updated_at=time.time() - 365 * 24 * 3600
+    )
+    store.save()
+
+    reloaded = DurationStore(store.path)
+    assert reloaded.history.tests.keys() == {"t.py::a[chromium]"}
+    assert reloaded.predict("t.py::a[chromium]") == 3.0
+    assert reloaded.history.tests["t.py::a[chromium]"].runs == 2
+
+
+def test_merge_keeps_newest_records(tmp_path: Path):
+    """При объединении историй шардов остается самая свежая запись теста."""
+    now = time.time()
+    sources = []
+    for index, (seconds, updated_at) in enumerate([(1.0, now - 60), (2.0, now)]):
+        history = DurationHistory(
+            tests={"t.py::a[chromium]": DurationRecord(seconds=seconds, updated_at=updated_at)}
+        )
+        source = tmp_path / f"shard-{index}.json"
+        source.write_text(json.dumps(history.model_dump()), encoding="utf-8")
+        sources.append(source)
+
+    assert merge_duration_histories(sources, tmp_path / "merged.json") == 1
+    assert DurationStore(tmp_path / "merged.json").predict("t.py::a[chromium]") == 2.0
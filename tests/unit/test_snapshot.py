@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+from src.core.exceptions import InvalidSelectorError
+from src.ui.elements.base_element import BaseElement
+from src.ui.snapshot import SnapshotTarget, SoftAssertions, has_text, is_xpath_selector, visible
+
+pytestmark = pytest.mark.unit
+
+VISIBLE_STATE = [1, True, "Вакансии", [], {}, None]
+HIDDEN_STATE = [0, False, "", [], {}, None]
+
+
+class FakePage:
+    """Страница-заглушка: возвращает заданные состояния селекторов вместо `page.evaluate`."""
+
+    def __init__(self, states: dict[str, list | str]) -> None:
+        """Запоминает состояния по селектору; строка вместо состояния - ошибка разбора."""
+        self.states = states
+        self.evaluated: list[list[str]] = []
+
+    def evaluate(self, _script: str, targets: list[list]) -> list[list | str]:
+        """Возвращает состояния запрошенных элементов снимка."""
+        self.evaluated.append([selector for selector, _, _ in targets])
+        return [self.states[selector] for selector, _, _ in targets]
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        """Ждет между снимками."""
+        time.sleep(timeout / 1000)
+
+
+def xpath_element(page: FakePage, xpath: str, name: str) -> BaseElement:
+    """Создает элемент с локатором XPath."""
+    return BaseElement.by_xpath(page, xpath, name)
+
+
+@pytest.mark.parametrize(
+    "selector",
+    ["//div", "/html/body", "(//li)[2]", "..", "../span", "./a", " //div"],
+)
+def test_xpath_selectors_are_detected(selector: str):
+    """XPath определяется по тем же префиксам, что и в `page.locator`."""
+    assert is_xpath_selector(selector)
+
+
+@pytest.mark.parametrize("selector", ["div.card", ".title", "#search", "[data-testid='x']"])
+def test_css_selectors_are_not_xpath(selector: str):
+    """Селекторы CSS не считаются XPath."""
+    assert not is_xpath_selector(selector)
+
+
+def test_target_kind():
+    """Элементы по data-testid ищутся через CSS, элементы по локатору - по его виду."""
+    page = FakePage({})
+
+    assert SnapshotTarget.of(BaseElement.by_test_id(page, "logo", "Логотип")) == SnapshotTarget(
+        '[data-testid="logo"]', 0, False
+    )
+    assert SnapshotTarget.of(xpath_element(page, "(//li)[{i}]", "Пункт"), i=2).xpath
+    assert not SnapshotTarget.of(xpath_element(page, "nav a", "Ссылка")).xpath
+
+
+def test_invalid_selector_is_raised_without_retries():
+    """Неверный селектор сообщается сразу, без ожидания таймаута и повторных снимков."""
+    page = FakePage({"//ul[": "'//ul[' is not a valid XPath expression.", "//h1": VISIBLE_STATE})
+    soft = SoftAssertions(page, timeout=5000).add(
+        visible(xpath_element(page, "//ul[", "Список")),
+        visible(xpath_element(page, "//h1", "Заголовок")),
+    )
+
+    started = time.monotonic()
+    with pytest.raises(InvalidSelectorError, match="not a valid XPath") as error:
+        soft.verify()
+
+    assert not isinstance(error.value, AssertionError)
+    assert time.monotonic() - started < 1
+    assert page.evaluated == [["//ul[", "//h1"]]
+
+
+def test_invalid_selector_does_not_hide_failed_checks():
+    """Остальные условия проверяются до таймаута и попадают в сообщение об ошибке."""
+    page = FakePage({"//ul[": "'//ul[' is not a valid XPath expression.", "//h1": HIDDEN_STATE})
+    soft = SoftAssertions(page, timeout=300).add(
+        visible(xpath_element(page, "//ul[", "Список")),
+        has_text(xpath_element(page, "//h1", "Заголовок"), "Вакансии"),
+    )
+
+    with pytest.raises(InvalidSelectorError) as error:
+        soft.verify()
+
+    assert "Неверных селекторов: 1 из 2" in str(error.value)
+    assert "Не выполнено условий: 1 из 2" in str(error.value)
+    assert len(page.evaluated) > 1
+    assert all(selectors == ["//h1"] for selectors in page.evaluated[1:])
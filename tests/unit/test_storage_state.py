@@ -0,0 +1,124 @@
+import json
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from config import Browser, Environment
+from integrations.playwright.storage_state import StorageStateCache, file_lock
+
+pytestmark = pytest.mark.unit
+
+
+class StateBuilder:
+    """Заглушка построения состояния: записывает файл и считает вызовы."""
+
+    def __init__(self, complete: bool = True) -> None:
+        """Инициализирует заглушку; неполное состояние возвращает None вместо данных."""
+        self.calls = 0
+        self.data = {"consent": {"cookies": ["accepted"]}} if complete else None
+
+    def __call__(self, path: Path) -> dict | None:
+        """Сохраняет пустое состояние по пути и возвращает данные."""
+        self.calls += 1
+        path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+        return self.data
+
+
+def make_cache(tmp_path: Path, ttl: int = 3600) -> StorageStateCache:
+    """Создает кеш состояний во временном каталоге."""
+    return StorageStateCache(
+        cache_dir=tmp_path, ttl=ttl, environment=Environment.DEV, app_url="http://app"
+    )
+
+
+def expire(cache: StorageStateCache, browser: Browser) -> None:
+    """Сдвигает момент создания состояния за пределы TTL."""
+    meta_path = cache.state_path(browser).with_suffix(".meta.json")
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["created_at"] -= cache.ttl + 1
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def test_fresh_state_is_reused(tmp_path: Path):
+    """Пока состояние не устарело, оно берется из кеша без построения."""
+    cache, build = make_cache(tmp_path), StateBuilder()
+
+    first_path, first_data = cache.get_or_create(Browser.CHROMIUM, build)
+    second_path, second_data = cache.get_or_create(Browser.CHROMIUM, build)
+
+    assert build.calls == 1
+    assert first_path == second_path and first_path.exists()
+    assert first_data == second_data == build.data
+
+
+def test_expired_state_is_rebuilt(tmp_path: Path):
+    """Состояние старше TTL строится заново."""
+    cache, build = make_cache(tmp_path), StateBuilder()
+
+    cache.get_or_create(Browser.CHROMIUM, build)
+    expire(cache, Browser.CHROMIUM)
+    cache.get_or_create(Browser.CHROMIUM, build)
+
+    assert build.calls == 2
+
+
+def test_zero_ttl_disables_reuse(tmp_path: Path):
+    """При нулевом TTL состояние строится в каждой сессии."""
+    cache, build = make_cache(tmp_path, ttl=0), StateBuilder()
+
+    cache.get_or_create(Browser.CHROMIUM, build)
+    cache.get_or_create(Browser.CHROMIUM, build)
+
+    assert build.calls == 2
+
+
+def test_incomplete_state_is_not_cached(tmp_path: Path):
+    """Состояние, для которого построение вернуло None, не попадает в кеш."""
+    cache = make_cache(tmp_path)
+    incomplete, complete = StateBuilder(complete=False), StateBuilder()
+
+    state_path, data = cache.get_or_create(Browser.CHROMIUM, incomplete)
+    assert state_path.exists() and data == {}
+    assert not state_path.with_suffix(".meta.json").exists()
+
+    cache.get_or_create(Browser.CHROMIUM, complete)
+    assert complete.calls == 1
+
+
+def test_states_are_keyed_by_browser_environment_and_url(tmp_path: Path):
+    """Ключ кеша включает браузер, окружение и URL приложения."""
+    cache = make_cache(tmp_path)
+    other_env = StorageStateCache(tmp_path, 3600, Environment.STAGING, "http://app")
+    other_url = StorageStateCache(tmp_path, 3600, Environment.DEV, "http://other")
+
+    paths = {
+        cache.state_path(Browser.CHROMIUM),
+        cache.state_path(Browser.FIREFOX),
+        other_env.state_path(Browser.CHROMIUM),
+        other_url.state_path(Browser.CHROMIUM),
+    }
+
+    assert len(paths) == 4
+
+
+def test_stale_lock_is_taken_over(tmp_path: Path):
+    """Брошенная блокировка снимается, и ее получает новый владелец."""
+    lock_path = tmp_path / "state.lock"
+    lock_path.write_text("12345")
+    stale = time.time() - 3600
+    os.utime(lock_path, (stale, stale))
+
+    with file_lock(lock_path, timeout=1):
+        assert lock_path.read_text() == str(os.getpid())
+    assert not lock_path.exists()
+
+
+def test_held_lock_times_out(tmp_path: Path):
+    """Занятая блокировка не выдается повторно до истечения таймаута."""
+    lock_path = tmp_path / "state.lock"
+
+    with file_lock(lock_path), pytest.raises(TimeoutError):
+        with file_lock(lock_path, timeout=0.3):
+            pass